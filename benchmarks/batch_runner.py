@@ -0,0 +1,55 @@
+"""
+Throughput of run_batch: many small random circuits returning counts, and fewer
+20-qubit circuits returning their state vectors (16 MiB each, sent back through
+shared memory), in this process (1 worker) and on a process pool.
+
+Run from the repository root:  python -m benchmarks.batch_runner
+"""
+
+import os
+import time
+
+import numpy as np
+
+from src.dtos import QuantumCircuit
+from src.models.gates import CNOT, Ry, Rz
+from src.simulator.batch_runner import run_batch
+
+
+def random_circuit(num_qubits, layers, rng):
+    circuit = QuantumCircuit()
+    for _ in range(layers):
+        for qubit in range(num_qubits):
+            circuit.append(Ry(rng.uniform(0, 2 * np.pi), [qubit]))
+            circuit.append(Rz(rng.uniform(0, 2 * np.pi), [qubit]))
+        for qubit in range(num_qubits - 1):
+            circuit.append(CNOT(qubit, qubit + 1))
+    return circuit
+
+
+def measure(circuits, **options):
+    start = time.perf_counter()
+    results = list(run_batch(circuits, **options))
+    assert all(result.ok for result in results)
+    return time.perf_counter() - start
+
+
+def main():
+    rng = np.random.default_rng(11)
+    # At least two, so the pool path (IR encoding, shared memory) is always measured
+    workers = max(os.cpu_count() or 1, 2)
+    small = [random_circuit(10, 5, rng) for _ in range(1000)]
+    large = [random_circuit(20, 2, rng) for _ in range(8)]
+    print(f"cores available: {os.cpu_count()}")
+    print(f"{'batch':>28} {'1 worker (s)':>12} {f'{workers} workers (s)':>14}")
+    for label, circuits, options in [
+        ("1000 x 10 qubits, counts", small, {"outputs": ("counts",)}),
+        ("8 x 20 qubits, state vector", large, {"outputs": ("state_vector",)}),
+    ]:
+        serial = measure(circuits, max_workers=1, **options)
+        pooled = measure(circuits, max_workers=workers, **options)
+        print(f"{label:>28} {serial:>12.2f} {pooled:>14.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""
+Compares the local-contraction density-matrix gate kernel with the previous
+full-operator path (a 2^n x 2^n gate built with a Python loop, then two dense matmuls).
+
+Run from the repository root:  python -m benchmarks.dm_gate_kernel
+"""
+
+import time
+
+import numpy as np
+
+from src.simulator.dm_simulator import DensityMatrixSimulator
+
+HADAMARD = np.array([[1, 1], [1, -1]], dtype=complex) / np.sqrt(2)
+
+
+def full_operator_apply(density_matrix, gate_matrix, target, num_qubits):
+    # The implementation DensityMatrixSimulator used before the kernel rewrite
+    full_gate = np.eye(2**num_qubits, dtype=complex)
+    for i in range(2**num_qubits):
+        if (i >> target) & 1 == 0:
+            full_gate[i, i] = gate_matrix[0, 0]
+            full_gate[i, i + (1 << target)] = gate_matrix[0, 1]
+        else:
+            full_gate[i, i] = gate_matrix[1, 1]
+            full_gate[i, i - (1 << target)] = gate_matrix[1, 0]
+    return full_gate @ density_matrix @ full_gate.T.conj()
+
+
+def best_of(func, repeats):
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    print(f"{'n':>3} {'full operator (s)':>18} {'local kernel (s)':>17} {'speedup':>9}")
+    for num_qubits in range(4, 13):
+        repeats = 5 if num_qubits < 11 else 1
+        target = num_qubits // 2
+
+        simulator = DensityMatrixSimulator(num_qubits)
+        simulator.apply_gate("h", list(range(num_qubits)))
+        reference = simulator.density_matrix.copy()
+
+        old = best_of(
+            lambda: full_operator_apply(reference, HADAMARD, target, num_qubits),
+            repeats,
+        )
+        new = best_of(lambda: simulator.apply_custom_gate(HADAMARD, target), repeats)
+
+        expected = full_operator_apply(reference, HADAMARD, target, num_qubits)
+        simulator.density_matrix = reference.copy()
+        simulator.apply_custom_gate(HADAMARD, target)
+        assert np.allclose(simulator.density_matrix, expected)
+
+        print(f"{num_qubits:>3} {old:>18.5f} {new:>17.5f} {old / new:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
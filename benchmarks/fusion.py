@@ -0,0 +1,57 @@
+"""
+Gate counts and state-vector simulation time of a deep hardware-efficient ansatz
+(Ry/Rz on every qubit, then a CNOT ladder, per layer) before and after gate fusion.
+
+Run from the repository root:  python -m benchmarks.fusion
+"""
+
+import time
+
+import numpy as np
+
+from src.dtos import QuantumCircuit
+from src.models.gates import CNOT, Ry, Rz
+from src.optimizer import fuse_gates
+from src.simulator.sv_simulator import StateVectorSimulator
+
+
+def variational_circuit(num_qubits, layers, rng):
+    circuit = QuantumCircuit()
+    for _ in range(layers):
+        for qubit in range(num_qubits):
+            circuit.append(Ry(rng.uniform(0, 2 * np.pi), [qubit]))
+            circuit.append(Rz(rng.uniform(0, 2 * np.pi), [qubit]))
+        for qubit in range(num_qubits - 1):
+            circuit.append(CNOT(qubit, qubit + 1))
+    return circuit
+
+
+def simulate(circuit, num_qubits):
+    simulator = StateVectorSimulator(num_qubits)
+    start = time.perf_counter()
+    simulator.apply_circuit(circuit)
+    return time.perf_counter() - start, simulator.state_vector
+
+
+def main():
+    rng = np.random.default_rng(7)
+    print(
+        f"{'n':>3} {'layers':>6} {'gates':>7} {'fused':>7} {'time (s)':>9} {'fused (s)':>10} {'speedup':>8}"
+    )
+    for num_qubits, layers in [(12, 40), (16, 20), (20, 10)]:
+        circuit = variational_circuit(num_qubits, layers, rng)
+        start = time.perf_counter()
+        fused = fuse_gates(circuit)
+        fuse_time = time.perf_counter() - start
+
+        before, reference = simulate(circuit, num_qubits)
+        after, state = simulate(fused, num_qubits)
+        assert np.allclose(reference, state)
+        print(
+            f"{num_qubits:>3} {layers:>6} {len(circuit.gates):>7} {len(fused.gates):>7} "
+            f"{before:>9.3f} {after + fuse_time:>10.3f} {before / (after + fuse_time):>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+"""
+Time and memory of GHZ circuits (H, then a CNOT chain) on the MPS backend, which
+keeps bond dimension 2 so memory grows linearly with the number of qubits.
+
+Run from the repository root:  python -m benchmarks.mps_ghz
+"""
+
+import time
+
+import numpy as np
+
+from src.dtos import QuantumCircuit
+from src.models.PauliSum import PauliSum
+from src.models.gates import CNOT, Hadamard
+from src.simulator.mps_simulator import MPSSimulator
+
+
+def ghz_circuit(num_qubits):
+    circuit = QuantumCircuit()
+    circuit.append(Hadamard([0]))
+    for qubit in range(num_qubits - 1):
+        circuit.append(CNOT(qubit, qubit + 1))
+    return circuit
+
+
+def main():
+    print(
+        f"{'n':>5} {'run (s)':>8} {'bond':>5} {'memory (kB)':>12} {'<Z0 Zn-1>':>10} {'outcomes':>9}"
+    )
+    for num_qubits in [100, 200, 500, 1000]:
+        circuit = ghz_circuit(num_qubits)
+        simulator = MPSSimulator(num_qubits)
+        start = time.perf_counter()
+        counts = simulator.run(circuit, shots=1000, rng=np.random.default_rng(0))
+        elapsed = time.perf_counter() - start
+        correlation = simulator.calculate_expectation_value(
+            PauliSum.from_masks(num_qubits, [0], [1 | 1 << (num_qubits - 1)], [1.0])
+        )
+        print(
+            f"{num_qubits:>5} {elapsed:>8.3f} {max(simulator.bond_dimensions):>5} "
+            f"{simulator.nbytes() / 1024:>12.1f} {correlation:>10.3f} {len(counts):>9}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""
+Out-of-core state vector: passes over the amplitude file, bytes moved and time for
+a layered circuit, applied gate by gate (one pass each) and with the passes
+scheduled by apply_circuit, against the in-memory state vector. Then the streaming
+sampler and marginals. The file goes to the temporary directory; set TMPDIR to put
+it on the disk under test.
+
+Run from the repository root:  python -m benchmarks.out_of_core
+"""
+
+import time
+
+import numpy as np
+
+from src.dtos import QuantumCircuit
+from src.models.gates import CNOT, Ry, Rz
+from src.simulator.memory import format_bytes
+from src.simulator.out_of_core_simulator import OutOfCoreSimulator
+from src.simulator.sv_simulator import StateVectorSimulator
+
+NUM_QUBITS = 24
+BLOCK_QUBITS = 20
+
+
+def layered_circuit(num_qubits, layers, rng):
+    circuit = QuantumCircuit()
+    for _ in range(layers):
+        for qubit in range(num_qubits):
+            circuit.append(Ry(rng.uniform(0, 2 * np.pi), [qubit]))
+            circuit.append(Rz(rng.uniform(0, 2 * np.pi), [qubit]))
+        for qubit in range(num_qubits - 1):
+            circuit.append(CNOT(qubit, qubit + 1))
+    return circuit
+
+
+def main():
+    rng = np.random.default_rng(2)
+    circuit = layered_circuit(NUM_QUBITS, 2, rng)
+
+    start = time.perf_counter()
+    reference = StateVectorSimulator(NUM_QUBITS)
+    reference.apply_circuit(circuit)
+    print(f"in memory: {time.perf_counter() - start:.2f} s")
+
+    print(f"{'mode':>18} {'passes':>7} {'moved':>10} {'time (s)':>9} {'max |err|':>10}")
+    for label in ["gate by gate", "scheduled"]:
+        with OutOfCoreSimulator(NUM_QUBITS, block_qubits=BLOCK_QUBITS) as simulator:
+            start = time.perf_counter()
+            if label == "scheduled":
+                simulator.apply_circuit(circuit)
+            else:
+                for gate in circuit.gates:
+                    simulator.apply_custom_gate(gate.matrix, gate.qubits)
+            elapsed = time.perf_counter() - start
+            moved = simulator.bytes_read + simulator.bytes_written
+            error = np.abs(simulator.amplitudes - reference.state_vector).max()
+            print(
+                f"{label:>18} {len(simulator.io_log):>7} {format_bytes(moved):>10} "
+                f"{elapsed:>9.2f} {error:>10.1e}"
+            )
+            if label == "scheduled":
+                start = time.perf_counter()
+                simulator.sample_counts(100_000)
+                sampling = time.perf_counter() - start
+                start = time.perf_counter()
+                simulator.marginal_probabilities([0, NUM_QUBITS - 1])
+                marginal = time.perf_counter() - start
+                print(
+                    f"streaming: 100k shots {sampling:.2f} s, "
+                    f"2-qubit marginal {marginal:.2f} s"
+                )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""
+Single (complex64) against double (complex128) precision on the state-vector
+backend: memory, time, and the error of the single-precision state as the circuit
+gets deeper (largest amplitude error, infidelity, norm drift), with and without
+renormalization.
+
+Run from the repository root:  python -m benchmarks.precision
+"""
+
+import time
+
+import numpy as np
+
+from src.dtos import QuantumCircuit
+from src.models.gates import CNOT, Ry, Rz
+from src.simulator.sv_simulator import StateVectorSimulator
+
+
+def variational_circuit(num_qubits, layers, rng):
+    circuit = QuantumCircuit()
+    for _ in range(layers):
+        for qubit in range(num_qubits):
+            circuit.append(Ry(rng.uniform(0, 2 * np.pi), [qubit]))
+            circuit.append(Rz(rng.uniform(0, 2 * np.pi), [qubit]))
+        for qubit in range(num_qubits - 1):
+            circuit.append(CNOT(qubit, qubit + 1))
+    return circuit
+
+
+def simulate(circuit, num_qubits, **options):
+    simulator = StateVectorSimulator(num_qubits, **options)
+    start = time.perf_counter()
+    simulator.apply_circuit(circuit)
+    return time.perf_counter() - start, simulator.state_vector
+
+
+def main():
+    rng = np.random.default_rng(3)
+    num_qubits = 16
+    print(
+        f"{'layers':>6} {'double (s)':>10} {'single (s)':>10} {'max |err|':>10} "
+        f"{'1 - F':>9} {'norm drift':>10} {'renormalized':>12}"
+    )
+    for layers in [10, 50, 200]:
+        circuit = variational_circuit(num_qubits, layers, rng)
+        double_time, reference = simulate(circuit, num_qubits)
+        single_time, single = simulate(circuit, num_qubits, precision="single")
+        _, renormalized = simulate(
+            circuit, num_qubits, precision="single", renormalize=True
+        )
+        single = single.astype(np.complex128)
+        error = np.abs(single - reference).max()
+        norm = np.linalg.norm(single)
+        # Fidelity of the direction of the state, measured in double precision
+        infidelity = 1 - abs(np.vdot(reference, single)) ** 2 / norm**2
+        drift = abs(norm - 1)
+        renormalized_drift = abs(np.linalg.norm(renormalized.astype(np.complex128)) - 1)
+        print(
+            f"{layers:>6} {double_time:>10.3f} {single_time:>10.3f} {error:>10.1e} "
+            f"{infidelity:>9.1e} {drift:>10.1e} {renormalized_drift:>12.1e}"
+        )
+    print(
+        f"state of {num_qubits} qubits: {reference.nbytes >> 10} kB double, "
+        f"{reference.nbytes >> 11} kB single"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""
+Cold-start and parse throughput of the native streaming QASM 2.0 parser, compared
+with the qiskit-based path when qiskit is installed.
+
+Run from the repository root:  python -m benchmarks.qasm2_loader
+"""
+
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+from src.loader import Loader
+
+COLD_START = "import time; t = time.perf_counter(); {import_line}; print(time.perf_counter() - t)"
+
+
+def write_circuit(path, num_lines, num_qubits=20):
+    with open(path, "w") as qasm:
+        qasm.write('OPENQASM 2.0;\ninclude "qelib1.inc";\n')
+        qasm.write(f"qreg q[{num_qubits}];\ncreg c[{num_qubits}];\n")
+        for line in range(num_lines):
+            qubit = line % num_qubits
+            kind = line % 4
+            if kind == 0:
+                qasm.write(f"h q[{qubit}];\n")
+            elif kind == 1:
+                qasm.write(f"rz(pi/{line % 7 + 1}) q[{qubit}];\n")
+            elif kind == 2:
+                qasm.write(f"cx q[{qubit}],q[{(qubit + 1) % num_qubits}];\n")
+            else:
+                qasm.write(f"u3(0.1*{line % 5},pi/2,-pi/4) q[{qubit}];\n")
+
+
+def cold_start(import_line):
+    result = subprocess.run(
+        [sys.executable, "-c", COLD_START.format(import_line=import_line)],
+        capture_output=True,
+        text=True,
+        cwd=os.getcwd(),
+    )
+    return float(result.stdout) if result.returncode == 0 else None
+
+
+def main():
+    try:
+        import qiskit  # noqa: F401
+
+        backends = ["native", "qiskit"]
+    except ImportError:
+        backends = ["native"]
+
+    native = cold_start("from src.loader import Loader")
+    print(f"cold start, native import: {native:.3f} s")
+    if "qiskit" in backends:
+        print(
+            f"cold start, qiskit import: {cold_start('from qiskit import qasm2'):.3f} s"
+        )
+
+    with tempfile.TemporaryDirectory() as directory:
+        for num_lines in (10**5, 10**6):
+            path = os.path.join(directory, f"circuit_{num_lines}.qasm")
+            write_circuit(path, num_lines)
+            for backend in backends:
+                for compact in (False, True):
+                    start = time.perf_counter()
+                    circuit = Loader.load_qasm2(path, backend=backend, compact=compact)
+                    elapsed = time.perf_counter() - start
+                    kind = "CompactCircuit" if compact else "QuantumCircuit"
+                    print(
+                        f"{num_lines:>8} lines, {backend:>6} -> {kind:<14}: {elapsed:7.2f} s, "
+                        f"{num_lines / elapsed:>9.0f} lines/s, {len(circuit.gates)} gates"
+                    )
+
+
+if __name__ == "__main__":
+    main()
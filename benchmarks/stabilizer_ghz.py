@@ -0,0 +1,39 @@
+"""
+GHZ circuits (H, then a CNOT chain) routed by the dispatcher to the stabilizer
+tableau: gates cost O(n) word operations and, after one elimination of the
+stabilizers, each of the millions of shots is a random pick from the outcome space.
+
+Run from the repository root:  python -m benchmarks.stabilizer_ghz
+"""
+
+import time
+
+import numpy as np
+
+from src.dtos import QuantumCircuit
+from src.models.gates import CNOT, Hadamard
+from src.simulator.dispatch import run, select_simulator
+
+
+def ghz_circuit(num_qubits):
+    circuit = QuantumCircuit()
+    circuit.append(Hadamard([0]))
+    for qubit in range(num_qubits - 1):
+        circuit.append(CNOT(qubit, qubit + 1))
+    return circuit
+
+
+def main():
+    shots = 1_000_000
+    print(f"{'n':>5} {'backend':>20} {'run (s)':>8} {'outcomes':>9}")
+    for num_qubits in [1000, 2000, 5000]:
+        circuit = ghz_circuit(num_qubits)
+        backend = type(select_simulator(circuit)).__name__
+        start = time.perf_counter()
+        counts = run(circuit, shots=shots, rng=np.random.default_rng(0))
+        elapsed = time.perf_counter() - start
+        print(f"{num_qubits:>5} {backend:>20} {elapsed:>8.3f} {len(counts):>9}")
+
+
+if __name__ == "__main__":
+    main()
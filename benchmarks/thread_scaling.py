@@ -0,0 +1,84 @@
+"""
+Thread scaling of the state-vector and density-matrix gate kernels: time per gate
+with 1 to 32 worker threads, for targets at the bottom, middle and top of the
+register (gates on the top qubit split along the low untouched axis instead).
+
+Pin BLAS to one thread (OPENBLAS_NUM_THREADS=1 or OMP_NUM_THREADS=1) so the numbers
+show the kernel's own threads rather than two thread pools competing for the cores.
+Speed-ups are bounded by the cores available, printed first.
+
+Run from the repository root:  python -m benchmarks.thread_scaling
+"""
+
+import os
+import time
+
+import numpy as np
+
+from src.simulator.dm_simulator import DensityMatrixSimulator
+from src.simulator.sv_simulator import StateVectorSimulator
+
+THREADS = [1, 2, 4, 8, 16, 32]
+REPEATS = 3
+
+
+def gates(num_qubits, rng):
+    # (label, matrix, targets, controls): one- and two-qubit gates, dense and sparse
+    hadamard = np.array([[1, 1], [1, -1]]) / np.sqrt(2)
+    random = np.linalg.qr(rng.normal(size=(4, 4)) + 1j * rng.normal(size=(4, 4)))[0]
+    phase = np.diag([1, np.exp(0.3j)])
+    pauli_x = np.array([[0, 1], [1, 0]])
+    top, middle = num_qubits - 1, num_qubits // 2
+    return [
+        ("H low", hadamard, [0], None),
+        ("H mid", hadamard, [middle], None),
+        ("H top", hadamard, [top], None),
+        ("U4 0,mid", random, [0, middle], None),
+        ("CNOT 0,top", pauli_x, [top], [0]),
+        ("phase mid", phase, [middle], None),
+    ]
+
+
+def time_gate(simulator, matrix, targets, controls):
+    simulator.apply_custom_gate(matrix, targets, controls)  # starts the pool
+    start = time.perf_counter()
+    for _ in range(REPEATS):
+        simulator.apply_custom_gate(matrix, targets, controls)
+    return (time.perf_counter() - start) / REPEATS
+
+
+def scaling(label, make_simulator, num_qubits):
+    rng = np.random.default_rng(5)
+    rows = {}
+    for threads in THREADS:
+        simulator = make_simulator(threads)
+        for gate_label, *gate in gates(num_qubits, rng):
+            rows.setdefault(gate_label, []).append(time_gate(simulator, *gate))
+        del simulator
+    print(f"\n{label}: ms per gate (speed-up over 1 thread)")
+    print(f"{'threads':>10} " + " ".join(f"{threads:>13}" for threads in THREADS))
+    for gate_label, times in rows.items():
+        cells = " ".join(
+            f"{1e3 * seconds:>7.1f} ({times[0] / seconds:>3.1f})" for seconds in times
+        )
+        print(f"{gate_label:>10} {cells}")
+
+
+def main():
+    print(f"cores available: {os.cpu_count()}")
+    sv_qubits = 24
+    scaling(
+        f"state vector, {sv_qubits} qubits",
+        lambda threads: StateVectorSimulator(sv_qubits, num_threads=threads),
+        sv_qubits,
+    )
+    dm_qubits = 11
+    scaling(
+        f"density matrix, {dm_qubits} qubits",
+        lambda threads: DensityMatrixSimulator(dm_qubits, num_threads=threads),
+        dm_qubits,
+    )
+
+
+if __name__ == "__main__":
+    main()
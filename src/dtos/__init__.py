@@ -1,3 +1,5 @@
 from ._quantum_circuit import QuantumCircuit
+from ._circuit_dag import CircuitDAG
+from ._compact_circuit import CompactCircuit
 
-__all__ = ["QuantumCircuit"]
+__all__ = ["QuantumCircuit", "CircuitDAG", "CompactCircuit"]
@@ -0,0 +1,93 @@
+from typing import Any, Dict, List, Optional
+
+
+class CircuitDAG:
+    """
+    Dependency view of a circuit's gate list.
+
+    Gate i depends on the previous gate on each of its qubits. Gates are numbered by
+    their position in ``circuit.gates`` and partitioned ASAP into moments: layers of
+    gates acting on disjoint qubits, where every gate sits one layer after its latest
+    predecessor. All queries are answered from data computed once, in a single pass
+    over the gates.
+    """
+
+    def __init__(self, circuit: Any):
+        self.gates = list(circuit.gates)
+        # Per-qubit links: predecessors[i][q] is the previous gate on qubit q (if any)
+        self.predecessors: List[Dict[int, int]] = []
+        self.successors: List[Dict[int, int]] = []
+        self.layers: List[int] = []  # moment index of each gate
+        self.moments: List[List[int]] = []
+        self._first: Dict[int, int] = {}
+        self._last: Dict[int, int] = {}
+        self._critical_parent: List[Optional[int]] = []
+
+        for index, gate in enumerate(self.gates):
+            predecessors = {}
+            successors = {}
+            layer = 0
+            parent = None
+            for qubit in gate.qubits:
+                previous = self._last.get(qubit)
+                if previous is None:
+                    self._first[qubit] = index
+                    continue
+                predecessors[qubit] = previous
+                self.successors[previous][qubit] = index
+                if self.layers[previous] + 1 > layer:
+                    layer = self.layers[previous] + 1
+                    parent = previous
+            for qubit in gate.qubits:
+                self._last[qubit] = index
+            self.predecessors.append(predecessors)
+            self.successors.append(successors)
+            self.layers.append(layer)
+            self._critical_parent.append(parent)
+            if layer == len(self.moments):
+                self.moments.append([])
+            self.moments[layer].append(index)
+
+        self._gates_per_layer = [len(moment) for moment in self.moments]
+        self._critical_path = self._trace_critical_path()
+
+    def _trace_critical_path(self) -> List[int]:
+        if not self.moments:
+            return []
+        path = [self.moments[-1][0]]
+        while self._critical_parent[path[-1]] is not None:
+            path.append(self._critical_parent[path[-1]])
+        return path[::-1]
+
+    @property
+    def depth(self) -> int:
+        """Number of moments (circuit depth)."""
+        return len(self.moments)
+
+    @property
+    def critical_path(self) -> List[int]:
+        """Indices of a longest dependency chain, in execution order."""
+        return list(self._critical_path)
+
+    @property
+    def gates_per_layer(self) -> List[int]:
+        """Number of gates in each moment."""
+        return list(self._gates_per_layer)
+
+    def moment_gates(self, layer: int) -> List[Any]:
+        """The gates of one moment; they act on pairwise disjoint qubits."""
+        return [self.gates[index] for index in self.moments[layer]]
+
+    def first_on(self, qubit: int) -> Optional[int]:
+        """Index of the first gate on ``qubit``, or None if the qubit is idle."""
+        return self._first.get(qubit)
+
+    def last_on(self, qubit: int) -> Optional[int]:
+        """Index of the last gate on ``qubit``, or None if the qubit is idle."""
+        return self._last.get(qubit)
+
+    def __len__(self):
+        return len(self.gates)
+
+    def __repr__(self):
+        return f"CircuitDAG(gates={len(self.gates)}, depth={self.depth})"
@@ -0,0 +1,295 @@
+import math
+from array import array
+from typing import Any, Iterator, List, Optional, Sequence
+
+import numpy as np
+
+from src.dtos._circuit_dag import CircuitDAG
+from src.models.gates import (
+    CNOT,
+    CZ,
+    Hadamard,
+    Identity,
+    Ph,
+    Rx,
+    Ry,
+    Rz,
+    S,
+    T,
+    Unitary,
+    X,
+    Y,
+    Z,
+)
+from src.models.Parameter import ParameterExpression
+from src.models.gates.gate import Gate
+
+# Opcode of each gate name; the position in this tuple is the opcode value
+OPCODES = (
+    "I",
+    "X",
+    "Y",
+    "Z",
+    "H",
+    "S",
+    "T",
+    "Rx",
+    "Ry",
+    "Rz",
+    "Ph",
+    "CNOT",
+    "CZ",
+    "Unitary",
+)
+_OPCODE_OF = {name: code for code, name in enumerate(OPCODES)}
+_UNITARY = _OPCODE_OF["Unitary"]
+
+_FACTORIES = {
+    "I": lambda qubits, param: Identity(qubits=qubits),
+    "X": lambda qubits, param: X(qubits=qubits),
+    "Y": lambda qubits, param: Y(qubits=qubits),
+    "Z": lambda qubits, param: Z(qubits=qubits),
+    "H": lambda qubits, param: Hadamard(qubits=qubits),
+    "S": lambda qubits, param: S(qubits=qubits),
+    "T": lambda qubits, param: T(qubits=qubits),
+    "Rx": lambda qubits, param: Rx(theta=param, qubits=qubits),
+    "Ry": lambda qubits, param: Ry(theta=param, qubits=qubits),
+    "Rz": lambda qubits, param: Rz(theta=param, qubits=qubits),
+    "Ph": lambda qubits, param: Ph(delta=param, qubits=qubits),
+    "CNOT": lambda qubits, param: CNOT(control_qubit=qubits[0], target_qubit=qubits[1]),
+    "CZ": lambda qubits, param: CZ(qubits=qubits),
+}
+
+
+# Attribute holding the angle of each parametric gate
+PARAMETER_ATTRIBUTES = {"Rx": "theta", "Ry": "theta", "Rz": "theta", "Ph": "delta"}
+
+
+def gate_angle(gate: Gate):
+    """The angle of a parametric gate as stored (a number or a ParameterExpression),
+    or None for gates without one."""
+    attribute = PARAMETER_ATTRIBUTES.get(gate.name)
+    return None if attribute is None else getattr(gate, attribute)
+
+
+def gate_parameter(gate: Gate) -> float:
+    """
+    The scalar parameter stored for a gate (its angle), or NaN if it has none.
+
+    :raises ValueError: If the angle depends on unbound parameters; the columns only
+        hold numbers, so such circuits must be bound first.
+    """
+    angle = gate_angle(gate)
+    if angle is None:
+        return math.nan
+    if isinstance(angle, ParameterExpression) and angle.parameters:
+        raise ValueError(
+            f"{gate.name} angle depends on unbound parameters "
+            f"{sorted(angle.parameters)}; bind parameters first "
+            "(QuantumCircuit.bind)."
+        )
+    return float(angle)
+
+
+def _column(values, dtype) -> np.ndarray:
+    if isinstance(values, array):
+        return np.frombuffer(values, dtype=dtype).copy()
+    return values
+
+
+class CompactCircuit:
+    """
+    Columnar, array-backed storage for large circuits.
+
+    Gate g has opcode ``opcodes[g]`` (an index into OPCODES), acts on
+    ``qubit_indices[offsets[g]:offsets[g + 1]]`` and has parameter ``params[g]``
+    (NaN when the gate has none). For Unitary gates the parameter is the index of the
+    matrix in ``matrices``. Qubits in use are tracked in a set. While a circuit is
+    being built the columns are growable ``array.array`` buffers, so appending is
+    amortized O(1) and a one-qubit gate costs 21 bytes instead of a Python object.
+    Columns can also be NumPy arrays (e.g. memory-mapped ones, see from_columns).
+
+    ``gates`` is a lazy sequence that builds Gate objects on access, so code written
+    for QuantumCircuit (simulators, optimizers, CircuitDAG) works unchanged.
+    """
+
+    def __init__(self):
+        self._opcodes = array("B")
+        self._params = array("d")
+        self._offsets = array("q", [0])
+        self._qubit_indices = array("i")
+        self._qubit_set = set()
+        self.matrices: List[np.ndarray] = []
+        self._dag: Optional[CircuitDAG] = None
+
+    @classmethod
+    def from_columns(
+        cls,
+        opcodes: np.ndarray,
+        qubit_indices: np.ndarray,
+        offsets: np.ndarray,
+        params: np.ndarray,
+        matrices: Optional[List[np.ndarray]] = None,
+        qubits: Optional[Sequence[int]] = None,
+    ) -> "CompactCircuit":
+        """
+        Wraps existing columns (e.g. memory-mapped ones) without copying them. Passing
+        the qubits in use avoids a scan of the qubit-index column.
+        """
+        circuit = cls()
+        circuit._opcodes = opcodes
+        circuit._params = params
+        circuit._offsets = offsets
+        circuit._qubit_indices = qubit_indices
+        circuit.matrices = list(matrices) if matrices is not None else []
+        if qubits is None:
+            qubits = np.unique(qubit_indices).tolist()
+        circuit._qubit_set = set(int(q) for q in qubits)
+        return circuit
+
+    @classmethod
+    def from_circuit(cls, circuit: Any) -> "CompactCircuit":
+        """Builds the columnar form of any circuit with a ``gates`` list."""
+        compact = cls()
+        for qubit in circuit.qubits:
+            compact.add_qubit(qubit)
+        for gate in circuit.gates:
+            compact.append(gate)
+        return compact
+
+    def _make_growable(self):
+        # Columns wrapped by from_columns are copied once before the first append
+        if not isinstance(self._opcodes, array):
+            self._opcodes = array("B", np.asarray(self._opcodes).tobytes())
+            self._params = array("d", np.asarray(self._params).tobytes())
+            self._offsets = array("q", np.asarray(self._offsets, np.int64).tobytes())
+            self._qubit_indices = array(
+                "i", np.asarray(self._qubit_indices, np.int32).tobytes()
+            )
+
+    def add_qubit(self, qubit_index: int):
+        """Mark a qubit as used by the circuit."""
+        self._qubit_set.add(qubit_index)
+
+    def add_operation(self, name: str, qubits: Sequence[int], param: float = math.nan):
+        """Append a gate given by its OPCODES name, qubits and parameter."""
+        self._make_growable()
+        self._opcodes.append(_OPCODE_OF[name])
+        self._params.append(param)
+        self._qubit_indices.extend(qubits)
+        self._offsets.append(len(self._qubit_indices))
+        self._qubit_set.update(qubits)
+
+    def append(self, gate: Gate):
+        """Append a Gate object, storing it as columns."""
+        if gate.name == "Unitary":
+            self.matrices.append(gate.matrix)
+            self.add_operation("Unitary", gate.qubits, len(self.matrices) - 1)
+        else:
+            self.add_operation(gate.name, gate.qubits, gate_parameter(gate))
+
+    @property
+    def num_gates(self) -> int:
+        return len(self._opcodes)
+
+    # The column properties return NumPy arrays: zero-copy for wrapped columns and a
+    # snapshot for growable ones (a live view would block further appends).
+    @property
+    def opcodes(self) -> np.ndarray:
+        return _column(self._opcodes, np.uint8)
+
+    @property
+    def params(self) -> np.ndarray:
+        return _column(self._params, np.float64)
+
+    @property
+    def offsets(self) -> np.ndarray:
+        return _column(self._offsets, np.int64)
+
+    @property
+    def qubit_indices(self) -> np.ndarray:
+        return _column(self._qubit_indices, np.int32)
+
+    @property
+    def qubits(self) -> List[int]:
+        """Indices of the qubits in use, in increasing order."""
+        return sorted(self._qubit_set)
+
+    @property
+    def gates(self) -> "GateView":
+        return GateView(self)
+
+    @property
+    def dag(self) -> CircuitDAG:
+        """The dependency/moment view, cached until more gates are appended."""
+        if self._dag is None or len(self._dag) != self.num_gates:
+            self._dag = CircuitDAG(self)
+        return self._dag
+
+    def gate(self, index: int) -> Gate:
+        """Materialize gate ``index`` as a Gate object."""
+        opcode = int(self._opcodes[index])
+        qubits = [
+            int(q)
+            for q in self._qubit_indices[
+                self._offsets[index] : self._offsets[index + 1]
+            ]
+        ]
+        param = float(self._params[index])
+        if opcode == _UNITARY:
+            return Unitary(self.matrices[int(param)], qubits)
+        return _FACTORIES[OPCODES[opcode]](qubits, param)
+
+    def to_circuit(self):
+        """Materialize every gate into a regular QuantumCircuit."""
+        from src.dtos import QuantumCircuit
+
+        circuit = QuantumCircuit()
+        for qubit in self.qubits:
+            circuit.add_qubit(qubit)
+        for gate in self.gates:
+            circuit.append(gate)
+        return circuit
+
+    def nbytes(self) -> int:
+        """Bytes used by the live part of the columns (excluding Unitary matrices)."""
+        return (
+            self.opcodes.nbytes
+            + self.params.nbytes
+            + self.offsets.nbytes
+            + self.qubit_indices.nbytes
+        )
+
+    def print_summary(self):
+        """Print the number of qubits and gates in the circuit."""
+        print(f"Number of qubits: {len(self.qubits)}")
+        print(f"Number of gates: {self.num_gates}")
+
+    def __len__(self):
+        return self.num_gates
+
+    def __repr__(self):
+        return f"CompactCircuit(qubits={len(self.qubits)}, gates={self.num_gates})"
+
+
+class GateView(Sequence):
+    """Read-only sequence of Gate objects backed by a CompactCircuit's columns."""
+
+    def __init__(self, circuit: CompactCircuit):
+        self._circuit = circuit
+
+    def __len__(self):
+        return self._circuit.num_gates
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._circuit.gate(i) for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("gate index out of range")
+        return self._circuit.gate(index)
+
+    def __iter__(self) -> Iterator[Gate]:
+        for index in range(len(self)):
+            yield self._circuit.gate(index)
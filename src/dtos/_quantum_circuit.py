@@ -1,19 +1,24 @@
-from typing import List, Dict
-
-from sympy.strategies.core import switch
+import copy
+from typing import Any, List, Dict, Mapping, Optional
 
+from src.dtos._circuit_dag import CircuitDAG
+from src.dtos._compact_circuit import PARAMETER_ATTRIBUTES, gate_angle
 from src.models.Gate import Gate
+from src.models.Parameter import ParameterExpression
 from src.models.gates import X, Hadamard, CNOT, CZ, X, Y, Z, S, T, Rx, Ry, Rz, Identity
 
 
 class QuantumCircuit:
     def __init__(self):
         self.qubits: List[int] = []  # List of qubit indices
+        self._qubit_set = set()  # Same indices, for O(1) membership checks
         self.gates: List[Gate] = []  # List of gates with their properties
+        self._dag: Optional[CircuitDAG] = None  # Built on first use by the dag property
 
     def add_qubit(self, qubit_index: int):
         """Add a qubit to the circuit."""
-        if qubit_index not in self.qubits:
+        if qubit_index not in self._qubit_set:
+            self._qubit_set.add(qubit_index)
             self.qubits.append(qubit_index)
 
     def add_gate(
@@ -43,7 +48,6 @@ class QuantumCircuit:
                 f"Unsupported gate: {gate_name}. Supported gates are: X, Hadamard, CNOT, CZ, Y, Z, S, T, Rx, Ry, Rz, Identity."
             )
         gate = None
-        print(gate_name)
         match gate_name:
             case "X":
                 gate = X(qubits=target_qubits)
@@ -77,6 +81,50 @@ class QuantumCircuit:
                 gate = Identity(qubits=target_qubits)
 
         self.gates.append(gate)
+        self._dag = None
+
+    def append(self, gate: Gate):
+        """Append an already constructed gate (and its qubits) to the circuit."""
+        for qubit in gate.qubits:
+            self.add_qubit(qubit)
+        self.gates.append(gate)
+        self._dag = None
+
+    @property
+    def dag(self) -> CircuitDAG:
+        """
+        The dependency/moment view of the circuit, built once and shared by every
+        caller until the gate list changes.
+        """
+        if self._dag is None or len(self._dag) != len(self.gates):
+            self._dag = CircuitDAG(self)
+        return self._dag
+
+    @property
+    def parameters(self) -> List[str]:
+        """Sorted names of the symbolic parameters used by the gates of the circuit."""
+        names = set()
+        for gate in self.gates:
+            angle = gate_angle(gate)
+            if isinstance(angle, ParameterExpression):
+                names |= angle.parameters
+        return sorted(names)
+
+    def bind(self, values: Mapping[Any, float]) -> "QuantumCircuit":
+        """
+        Returns a copy of the circuit with parameters substituted (keyed by Parameter
+        or name). Gates without symbolic angles are shared with this circuit.
+        """
+        bound = QuantumCircuit()
+        for qubit in self.qubits:
+            bound.add_qubit(qubit)
+        for gate in self.gates:
+            angle = gate_angle(gate)
+            if isinstance(angle, ParameterExpression):
+                gate = copy.copy(gate)
+                setattr(gate, PARAMETER_ATTRIBUTES[gate.name], angle.bind(values))
+            bound.gates.append(gate)
+        return bound
 
     def __repr__(self):
         return f"QuantumCircuit(qubits={self.qubits}, gates={self.gates})"
@@ -1,3 +1,4 @@
 from ._loader import Loader
+from ._cache import ParseCache
 
-__all__ = ["Loader"]
+__all__ = ["Loader", "ParseCache"]
@@ -0,0 +1,122 @@
+import hashlib
+import os
+import tempfile
+from typing import Optional
+
+from src.dtos import CompactCircuit
+from src.loader._ir import IR_VERSION, read_ir, write_ir
+from src.loader._qasm2_parser import PARSER_VERSION
+
+# Bump when parsing output changes, so stale cache entries are never reused
+LOADER_VERSION = f"qasm2-{PARSER_VERSION}/ir-{IR_VERSION}"
+_SUFFIX = ".ir"
+
+
+def file_hash(path: str, chunk_size: int = 1 << 20) -> str:
+    """SHA-256 of a file's contents, read in chunks."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as source:
+        for chunk in iter(lambda: source.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class ParseCache:
+    """
+    On-disk cache of parsed circuits, stored in the binary IR format.
+
+    Entries are keyed by the SHA-256 of the source file plus LOADER_VERSION, so an
+    edited file or a new parser version never hits a stale entry. Entries are written
+    to a temporary file in the cache directory and atomically renamed into place, so
+    concurrent processes never see a partial entry; if two processes parse the same
+    file, the last rename wins with identical contents. Each hit refreshes the
+    entry's modification time, and once the directory exceeds ``max_bytes`` the
+    least recently used entries are evicted.
+    """
+
+    def __init__(self, directory: Optional[str] = None, max_bytes: int = 1 << 30):
+        """
+        :param directory: Where entries are stored. Defaults to ~/.cache/qestkit/qasm2.
+        :param max_bytes: Size limit for all entries together.
+        """
+        if directory is None:
+            directory = os.path.join(
+                os.path.expanduser("~"), ".cache", "qestkit", "qasm2"
+            )
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self.max_bytes = max_bytes
+
+    def key(self, circuit_file: str) -> str:
+        """The cache key of a source file: its content hash combined with LOADER_VERSION."""
+        return hashlib.sha256(
+            f"{file_hash(circuit_file)}:{LOADER_VERSION}".encode("ascii")
+        ).hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key + _SUFFIX)
+
+    def get(self, key: str) -> Optional[CompactCircuit]:
+        """Returns the cached circuit for ``key`` (memory-mapped), or None on a miss."""
+        path = self._path(key)
+        try:
+            circuit = read_ir(path)
+        except (FileNotFoundError, ValueError):
+            return None
+        try:
+            os.utime(path)  # mark as recently used
+        except OSError:
+            pass
+        return circuit
+
+    def put(self, key: str, circuit) -> None:
+        """Stores ``circuit`` under ``key`` atomically, then enforces the size limit."""
+        handle, temporary = tempfile.mkstemp(
+            dir=self.directory, prefix=".tmp-", suffix=_SUFFIX
+        )
+        os.close(handle)
+        try:
+            write_ir(circuit, temporary)
+            os.replace(temporary, self._path(key))
+        except OSError:
+            # e.g. the target is memory-mapped by a reader on Windows; the existing
+            # entry has the same contents, so dropping ours is safe
+            pass
+        finally:
+            if os.path.exists(temporary):
+                try:
+                    os.remove(temporary)
+                except OSError:
+                    pass
+        self.evict()
+
+    def evict(self) -> None:
+        """Removes least recently used entries until the cache fits in max_bytes."""
+        entries = []
+        total = 0
+        with os.scandir(self.directory) as listing:
+            for entry in listing:
+                if not entry.name.endswith(_SUFFIX) or entry.name.startswith(".tmp-"):
+                    continue
+                try:
+                    stat = entry.stat()
+                except FileNotFoundError:
+                    continue  # removed by another process
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+                total += stat.st_size
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+                total -= size
+            except OSError:
+                pass  # already evicted elsewhere, or still mapped on Windows
+
+    def clear(self) -> None:
+        """Removes every entry."""
+        limit, self.max_bytes = self.max_bytes, -1
+        try:
+            self.evict()
+        finally:
+            self.max_bytes = limit
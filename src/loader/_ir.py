@@ -0,0 +1,189 @@
+import hashlib
+import struct
+from typing import Any, List
+
+import numpy as np
+
+from src.dtos import CompactCircuit
+from src.dtos._compact_circuit import OPCODES
+
+# Binary circuit IR, little-endian:
+#
+#   header     magic, format version, number of sections, SHA-256 of everything
+#              after the header and section table
+#   sections   (offset, length in bytes) of each section, in _SECTIONS order
+#   body       sections, each aligned to _ALIGNMENT bytes so they can be viewed in
+#              place through a memory map
+#
+# The opcode table stores the OPCODES names the opcode column refers to, so files
+# stay readable if OPCODES grows; opcodes are only remapped when the tables differ.
+IR_MAGIC = b"QESTIR\x00\x00"
+IR_VERSION = 1
+_HEADER = struct.Struct("<8sII32s")
+_SECTION = struct.Struct("<QQ")
+_ALIGNMENT = 64
+_SECTIONS = (
+    ("opcode_table", np.uint8),
+    ("opcodes", np.uint8),
+    ("params", np.float64),
+    ("offsets", np.int64),
+    ("qubit_indices", np.int32),
+    ("qubits", np.int32),
+    ("matrix_offsets", np.int64),
+    ("matrices", np.complex128),
+)
+
+
+def _body_start() -> int:
+    size = _HEADER.size + _SECTION.size * len(_SECTIONS)
+    return -(-size // _ALIGNMENT) * _ALIGNMENT
+
+
+def encode_ir(circuit: Any) -> bytes:
+    """
+    Encodes a circuit in the binary IR format in memory, e.g. to send it to another
+    process (see decode_ir).
+
+    :param circuit: A CompactCircuit, or any circuit with ``gates`` and ``qubits``.
+    :return: The same bytes write_ir stores in a file.
+    :raises ValueError: If a gate angle depends on unbound parameters.
+    """
+    if not isinstance(circuit, CompactCircuit):
+        circuit = CompactCircuit.from_circuit(circuit)
+    matrices = [np.ascontiguousarray(m, dtype=np.complex128) for m in circuit.matrices]
+    matrix_offsets = np.zeros(len(matrices) + 1, dtype=np.int64)
+    np.cumsum([m.size for m in matrices], out=matrix_offsets[1:])
+    columns = {
+        "opcode_table": np.frombuffer("\n".join(OPCODES).encode("ascii"), np.uint8),
+        "opcodes": circuit.opcodes,
+        "params": circuit.params,
+        "offsets": circuit.offsets,
+        "qubit_indices": circuit.qubit_indices,
+        "qubits": np.asarray(circuit.qubits, dtype=np.int32),
+        "matrix_offsets": matrix_offsets,
+        "matrices": (
+            np.concatenate([m.reshape(-1) for m in matrices])
+            if matrices
+            else np.zeros(0, dtype=np.complex128)
+        ),
+    }
+
+    table = []
+    chunks: List[bytes] = []
+    position = _body_start()
+    digest = hashlib.sha256()
+    for name, dtype in _SECTIONS:
+        data = np.ascontiguousarray(columns[name], dtype=dtype).tobytes()
+        padding = -len(data) % _ALIGNMENT
+        table.append((position, len(data)))
+        chunk = data + b"\x00" * padding
+        digest.update(chunk)
+        chunks.append(chunk)
+        position += len(chunk)
+
+    header = _HEADER.pack(IR_MAGIC, IR_VERSION, len(_SECTIONS), digest.digest())
+    header += b"".join(_SECTION.pack(offset, length) for offset, length in table)
+    header += b"\x00" * (_body_start() - len(header))
+    return b"".join([header] + chunks)
+
+
+def write_ir(circuit: Any, path: str) -> str:
+    """
+    Writes a circuit to the binary IR format.
+
+    :param circuit: A CompactCircuit, or any circuit with ``gates`` and ``qubits``.
+    :param path: Destination file.
+    :return: The hex SHA-256 content hash stored in the header.
+    """
+    data = encode_ir(circuit)
+    with open(path, "wb") as output:
+        output.write(data)
+    return _read_header(data)[1]
+
+
+def read_ir_hash(path: str) -> str:
+    """Returns the content hash recorded in an IR file's header, reading only the header."""
+    with open(path, "rb") as source:
+        return _read_header(source.read(_HEADER.size))[1]
+
+
+def _read_header(data: bytes):
+    if len(data) < _HEADER.size:
+        raise ValueError("File is too short to be a circuit IR file.")
+    magic, version, num_sections, digest = _HEADER.unpack_from(data)
+    if magic != IR_MAGIC:
+        raise ValueError("Not a circuit IR file (bad magic number).")
+    if version != IR_VERSION:
+        raise ValueError(f"Unsupported IR version {version}; expected {IR_VERSION}.")
+    if num_sections != len(_SECTIONS):
+        raise ValueError(f"Corrupt IR file: {num_sections} sections.")
+    return num_sections, digest.hex()
+
+
+def read_ir(path: str, verify: bool = False) -> CompactCircuit:
+    """
+    Opens an IR file as a CompactCircuit whose columns are read-only views of a memory
+    map, so nothing is parsed or copied up front and large circuits open in
+    milliseconds.
+
+    :param path: The IR file.
+    :param verify: Recompute the content hash and compare it to the header. This reads
+        the whole file.
+    :raises ValueError: If the file is not a valid IR file or fails verification.
+    """
+    return decode_ir(np.memmap(path, dtype=np.uint8, mode="r"), verify)
+
+
+def decode_ir(data: Any, verify: bool = False) -> CompactCircuit:
+    """
+    Wraps IR bytes (from encode_ir, or any buffer holding an IR file) as a
+    CompactCircuit whose columns are read-only views of the buffer; nothing is copied
+    unless the opcode table needs remapping.
+
+    :param data: A bytes-like object or uint8 array.
+    :param verify: Recompute the content hash and compare it to the header.
+    :raises ValueError: If the buffer is not valid IR or fails verification.
+    """
+    mapped = np.frombuffer(data, dtype=np.uint8)
+    num_sections, digest = _read_header(bytes(mapped[: _HEADER.size]))
+    if len(mapped) < _body_start():
+        raise ValueError("Corrupt IR file: the section table is truncated.")
+    sections = {}
+    for index, (name, dtype) in enumerate(_SECTIONS):
+        offset, length = _SECTION.unpack_from(
+            mapped, _HEADER.size + index * _SECTION.size
+        )
+        if offset + length > len(mapped):
+            raise ValueError(f"Corrupt IR file: section {name} is truncated.")
+        sections[name] = mapped[offset : offset + length].view(dtype)
+
+    if verify:
+        body = mapped[_body_start() :]
+        if hashlib.sha256(body).hexdigest() != digest:
+            raise ValueError("IR content hash mismatch; the data is corrupt.")
+
+    opcodes = sections["opcodes"]
+    table = bytes(sections["opcode_table"]).decode("ascii").split("\n")
+    if tuple(table) != OPCODES:
+        # Written with a different opcode numbering: remap (this copies the column)
+        try:
+            remap = np.array([OPCODES.index(name) for name in table], dtype=np.uint8)
+        except ValueError as error:
+            raise ValueError(f"IR file uses an unknown gate: {error}") from None
+        opcodes = remap[opcodes]
+
+    matrix_offsets = sections["matrix_offsets"]
+    entries = sections["matrices"]
+    matrices = []
+    for start, end in zip(matrix_offsets[:-1], matrix_offsets[1:]):
+        size = int(round(np.sqrt(end - start)))
+        matrices.append(entries[start:end].reshape(size, size))
+
+    return CompactCircuit.from_columns(
+        opcodes,
+        sections["qubit_indices"],
+        sections["offsets"],
+        sections["params"],
+        matrices,
+        qubits=sections["qubits"].tolist(),
+    )
@@ -1,6 +1,9 @@
-from qiskit import qasm2
-from src.dtos import QuantumCircuit
-from src.models.gates import X, Hadamard, CNOT, CZ, X, Y, Z, S, T, Rx, Ry, Rz, Identity
+from typing import Optional
+
+from src.dtos import CompactCircuit, QuantumCircuit
+from src.loader._cache import ParseCache
+from src.loader._ir import read_ir, write_ir
+from src.loader._qasm2_parser import Qasm2Parser, build_gates
 
 
 class Loader:
@@ -8,29 +11,58 @@ class Loader:
         self.path = path
 
     @staticmethod
-    def load_qasm2(circuit_file: str) -> QuantumCircuit:
+    def load_qasm2(
+        circuit_file: str,
+        backend: str = "native",
+        compact: bool = False,
+        cache: Optional[ParseCache] = None,
+    ) -> QuantumCircuit:
         """
         Load a QASM2 file and map it to the custom QuantumCircuit structure.
 
         :param circuit_file: Path to the QASM2 file.
+        :param backend: "native" streams the file through our own parser; "qiskit"
+            parses it with qiskit (which must be installed) and converts the result.
+        :param compact: Return a CompactCircuit instead of a QuantumCircuit.
+        :param cache: Optional ParseCache. On a hit the file is not parsed at all;
+            on a miss the parsed circuit is stored for the next load.
         :return: A QuantumCircuit object representing the circuit.
         """
+        if cache is not None:
+            key = cache.key(circuit_file)
+            cached = cache.get(key)
+            if cached is None:
+                cached = Loader.load_qasm2(circuit_file, backend, compact=True)
+                cache.put(key, cached)
+            return cached if compact else cached.to_circuit()
+
+        custom_circuit = CompactCircuit() if compact else QuantumCircuit()
+        if backend == "native":
+            with open(circuit_file, "r", encoding="utf-8") as source:
+                return Qasm2Parser().parse(source, custom_circuit)
+        elif backend == "qiskit":
+            return Loader._load_qasm2_qiskit(circuit_file, custom_circuit)
+        raise ValueError(f"Invalid backend: {backend}. Must be 'native' or 'qiskit'.")
+
+    @staticmethod
+    def _load_qasm2_qiskit(circuit_file: str, custom_circuit):
+        # Optional fallback: qiskit is only imported when explicitly requested
+        from qiskit import qasm2
+
         qs_circuit = qasm2.load(circuit_file)
-        custom_circuit = QuantumCircuit()
 
         # Map Qiskit circuit to custom circuit
         for instruction in qs_circuit.data:
             gate_name = instruction.operation.name
-            if gate_name == "measure":
+            if gate_name in ("measure", "barrier"):
                 # Skip measurement gates as they are not part of the circuit structure
                 continue
-            target_qubits = [qubit._index for qubit in instruction.qubits]
-            params = {param.name: param for param in instruction.operation.params}
-
-            # Add qubits and gates to the custom circuit
-            for qubit in target_qubits:
-                custom_circuit.add_qubit(qubit)
-            custom_circuit.add_gate(gate_name, target_qubits, params)
+            target_qubits = [
+                qs_circuit.find_bit(qubit).index for qubit in instruction.qubits
+            ]
+            params = [float(param) for param in instruction.operation.params]
+            for gate in build_gates(gate_name, params, target_qubits):
+                custom_circuit.append(gate)
 
         return custom_circuit
 
@@ -40,6 +72,23 @@ class Loader:
         raise NotImplementedError("QASM3 loading not implemented yet.")
 
     @staticmethod
-    def load_ir(circuit_file: str):
-        # Placeholder for future implementation
-        raise NotImplementedError("IR loading not implemented yet.")
+    def load_ir(circuit_file: str, verify: bool = False) -> CompactCircuit:
+        """
+        Load a circuit saved in the binary IR format (see save_ir).
+
+        :param circuit_file: Path to the IR file.
+        :param verify: Check the file against the content hash in its header.
+        :return: A CompactCircuit whose columns are memory-mapped from the file.
+        """
+        return read_ir(circuit_file, verify=verify)
+
+    @staticmethod
+    def save_ir(circuit, circuit_file: str) -> str:
+        """
+        Save a QuantumCircuit or CompactCircuit in the binary IR format.
+
+        :param circuit: The circuit to save.
+        :param circuit_file: Destination path.
+        :return: The content hash of the written file.
+        """
+        return write_ir(circuit, circuit_file)
@@ -0,0 +1,315 @@
+import math
+import re
+from functools import lru_cache
+from typing import Callable, Dict, Iterable, List, Tuple
+
+from src.models.gates import CNOT, CZ, Hadamard, Identity, Ph, Rx, Ry, Rz, S, T, X, Y, Z
+from src.models.gates.gate import Gate
+
+_STATEMENT = re.compile(r"([A-Za-z_][A-Za-z0-9_]*)\s*(?:\((.*)\))?\s*(.*)", re.S)
+_ARGUMENT = re.compile(r"\s*([A-Za-z_][A-Za-z0-9_]*)\s*(?:\[\s*(\d+)\s*\])?\s*$")
+_REGISTER = re.compile(r"\s*([A-Za-z_][A-Za-z0-9_]*)\s*\[\s*(\d+)\s*\]\s*$")
+_TOKEN = re.compile(
+    r"\s*(?:(\d+\.?\d*(?:[eE][-+]?\d+)?|\.\d+(?:[eE][-+]?\d+)?)|([A-Za-z_]\w*)|(.))"
+)
+
+# Version of the parser output; part of the parse-cache key
+PARSER_VERSION = "1"
+
+# Number of distinct parameter expressions remembered by evaluate_expression
+EXPRESSION_CACHE_SIZE = 65536
+
+_FUNCTIONS: Dict[str, Callable[[float], float]] = {
+    "sin": math.sin,
+    "cos": math.cos,
+    "tan": math.tan,
+    "exp": math.exp,
+    "ln": math.log,
+    "sqrt": math.sqrt,
+}
+
+
+def _single(factory):
+    return lambda params, qubits: [factory(params, [qubit]) for qubit in qubits]
+
+
+# qelib1 gates we support, mapped to our gate classes. Each builder takes the
+# evaluated parameters and the qubit indices and returns the gates to append.
+# sdg/tdg/u1/p are phase shifts and u/u2/u3 decompose exactly as
+# U(theta, phi, lambda) = Ph(phi) Ry(theta) Ph(lambda).
+_GATES: Dict[str, Tuple[int, int, Callable[[List[float], List[int]], List[Gate]]]] = {
+    # name: (number of parameters, number of qubits, builder)
+    "id": (0, 1, _single(lambda p, q: Identity(qubits=q))),
+    "x": (0, 1, _single(lambda p, q: X(qubits=q))),
+    "y": (0, 1, _single(lambda p, q: Y(qubits=q))),
+    "z": (0, 1, _single(lambda p, q: Z(qubits=q))),
+    "h": (0, 1, _single(lambda p, q: Hadamard(qubits=q))),
+    "s": (0, 1, _single(lambda p, q: S(qubits=q))),
+    "t": (0, 1, _single(lambda p, q: T(qubits=q))),
+    "sdg": (0, 1, _single(lambda p, q: Ph(delta=-math.pi / 2, qubits=q))),
+    "tdg": (0, 1, _single(lambda p, q: Ph(delta=-math.pi / 4, qubits=q))),
+    "rx": (1, 1, _single(lambda p, q: Rx(theta=p[0], qubits=q))),
+    "ry": (1, 1, _single(lambda p, q: Ry(theta=p[0], qubits=q))),
+    "rz": (1, 1, _single(lambda p, q: Rz(theta=p[0], qubits=q))),
+    "u1": (1, 1, _single(lambda p, q: Ph(delta=p[0], qubits=q))),
+    "p": (1, 1, _single(lambda p, q: Ph(delta=p[0], qubits=q))),
+    "u2": (
+        2,
+        1,
+        lambda p, q: [
+            Ph(delta=p[1], qubits=q),
+            Ry(theta=math.pi / 2, qubits=q),
+            Ph(delta=p[0], qubits=q),
+        ],
+    ),
+    "u3": (
+        3,
+        1,
+        lambda p, q: [
+            Ph(delta=p[2], qubits=q),
+            Ry(theta=p[0], qubits=q),
+            Ph(delta=p[1], qubits=q),
+        ],
+    ),
+    "cx": (0, 2, lambda p, q: [CNOT(control_qubit=q[0], target_qubit=q[1])]),
+    "CX": (0, 2, lambda p, q: [CNOT(control_qubit=q[0], target_qubit=q[1])]),
+    "cz": (0, 2, lambda p, q: [CZ(qubits=q)]),
+}
+_GATES["U"] = _GATES["u"] = _GATES["u3"]
+
+# Statements that do not change the unitary part of the circuit
+_IGNORED = {"OPENQASM", "include", "creg", "barrier", "measure"}
+
+
+def build_gates(name: str, params: List[float], qubits: List[int]) -> List[Gate]:
+    """
+    Maps one qelib1 gate application (on already resolved qubit indices) to gates.
+
+    :raises ValueError: If the gate is not supported or has the wrong arity.
+    """
+    if name not in _GATES:
+        raise ValueError(f"Unsupported QASM gate: {name}")
+    num_params, num_qubits, builder = _GATES[name]
+    if len(params) != num_params or len(qubits) != num_qubits:
+        raise ValueError(
+            f"Gate {name} takes {num_params} parameter(s) and {num_qubits} qubit(s), "
+            f"got {len(params)} and {len(qubits)}."
+        )
+    return builder(params, qubits)
+
+
+@lru_cache(maxsize=EXPRESSION_CACHE_SIZE)
+def evaluate_expression(expression: str) -> float:
+    """
+    Evaluates a QASM 2.0 parameter expression: numbers, pi, + - * / ^, unary minus,
+    parentheses and sin, cos, tan, exp, ln, sqrt. Results are memoized, since
+    generated circuits repeat the same few expressions many times.
+    """
+    try:
+        return float(expression)
+    except ValueError:
+        pass
+    tokens = []
+    for number, identifier, symbol in _TOKEN.findall(expression):
+        if number:
+            tokens.append(("number", float(number)))
+        elif identifier:
+            tokens.append(("name", identifier))
+        elif symbol.strip():
+            tokens.append(("symbol", symbol))
+    position = 0
+
+    def peek():
+        return tokens[position] if position < len(tokens) else (None, None)
+
+    def take():
+        nonlocal position
+        position += 1
+        return tokens[position - 1]
+
+    def expect(symbol):
+        kind, value = take() if position < len(tokens) else (None, None)
+        if value != symbol:
+            raise ValueError(f"Expected '{symbol}' in expression: {expression}")
+
+    def primary():
+        kind, value = take() if position < len(tokens) else (None, None)
+        if kind == "number":
+            return value
+        if kind == "name":
+            if value == "pi":
+                return math.pi
+            if value in _FUNCTIONS:
+                expect("(")
+                argument = additive()
+                expect(")")
+                return _FUNCTIONS[value](argument)
+        if value == "(":
+            result = additive()
+            expect(")")
+            return result
+        if value in ("-", "+"):
+            operand = power()
+            return -operand if value == "-" else operand
+        raise ValueError(f"Invalid parameter expression: {expression}")
+
+    def power():
+        base = primary()
+        if peek()[1] == "^":
+            take()
+            return base ** power()  # right associative
+        return base
+
+    def multiplicative():
+        result = power()
+        while peek()[1] in ("*", "/"):
+            _, operator = take()
+            operand = power()
+            result = result * operand if operator == "*" else result / operand
+        return result
+
+    def additive():
+        result = multiplicative()
+        while peek()[1] in ("+", "-"):
+            _, operator = take()
+            operand = multiplicative()
+            result = result + operand if operator == "+" else result - operand
+        return result
+
+    result = additive()
+    if position != len(tokens):
+        raise ValueError(f"Invalid parameter expression: {expression}")
+    return result
+
+
+def _statements(lines: Iterable[str]) -> Iterable[Tuple[int, str]]:
+    # Yields (line number, statement) pairs; statements may span or share lines
+    pending = []
+    for number, line in enumerate(lines, start=1):
+        comment = line.find("//")
+        if comment >= 0:
+            line = line[:comment]
+        if ";" not in line:
+            if line.strip():
+                pending.append(line)
+            continue
+        parts = line.split(";")
+        for part in parts[:-1]:
+            pending.append(part)
+            statement = " ".join(pending).strip()
+            pending = []
+            if statement:
+                yield number, statement
+        if parts[-1].strip():
+            pending.append(parts[-1])
+    if "".join(pending).strip():
+        raise ValueError("Unterminated statement at end of QASM input.")
+
+
+class Qasm2Parser:
+    """
+    Streaming OpenQASM 2.0 parser producing our circuit types without qiskit.
+
+    Statements are read line by line, so the source is never held in memory. Quantum
+    registers are laid out one after another in declaration order, so ``q[i]`` of the
+    second register maps to qubit ``size_of_first + i``. Gate applications on whole
+    registers are broadcast as in the QASM specification. Measurements, barriers and
+    classical registers are skipped; custom gate definitions, ``if``, ``reset`` and
+    ``opaque`` are rejected with a ValueError.
+    """
+
+    def __init__(self):
+        self.registers: Dict[str, Tuple[int, int]] = {}  # name -> (offset, size)
+        self.num_qubits = 0
+        self._operands: Dict[str, Tuple[int, ...]] = {}  # resolved argument strings
+
+    def parse(self, lines: Iterable[str], circuit):
+        """
+        Parses QASM source lines and appends the gates to ``circuit``.
+
+        :param lines: Any iterable of source lines (e.g. an open file).
+        :param circuit: A QuantumCircuit or CompactCircuit to append gates to.
+        :return: ``circuit``.
+        """
+        for number, statement in _statements(lines):
+            try:
+                self._statement(statement, circuit)
+            except ValueError as error:
+                raise ValueError(f"Line {number}: {error}") from None
+        return circuit
+
+    def _statement(self, statement: str, circuit):
+        match = _STATEMENT.match(statement)
+        if match is None:
+            raise ValueError(f"Cannot parse statement: {statement}")
+        name, params, arguments = match.groups()
+        if name in _IGNORED:
+            return
+        if name == "qreg":
+            register = _REGISTER.match(arguments)
+            if register is None:
+                raise ValueError(f"Invalid register declaration: {statement}")
+            size = int(register.group(2))
+            self.registers[register.group(1)] = (self.num_qubits, size)
+            self.num_qubits += size
+            return
+        if name in ("gate", "opaque", "if", "reset"):
+            raise ValueError(f"'{name}' statements are not supported.")
+
+        values = []
+        if params is not None and params.strip():
+            values = [evaluate_expression(p) for p in _split_arguments(params)]
+        operands = [self._operand(a) for a in _split_arguments(arguments)]
+        for qubits in _broadcast(operands):
+            for gate in build_gates(name, values, qubits):
+                circuit.append(gate)
+
+    def _operand(self, argument: str) -> Tuple[int, ...]:
+        operand = self._operands.get(argument)
+        if operand is None:
+            operand = self._operands[argument] = self._resolve(argument)
+        return operand
+
+    def _resolve(self, argument: str) -> Tuple[int, ...]:
+        match = _ARGUMENT.match(argument)
+        if match is None or match.group(1) not in self.registers:
+            raise ValueError(f"Unknown qubit argument: {argument.strip()}")
+        offset, size = self.registers[match.group(1)]
+        if match.group(2) is None:
+            return tuple(range(offset, offset + size))
+        index = int(match.group(2))
+        if index >= size:
+            raise ValueError(f"Qubit index out of range: {argument.strip()}")
+        return (offset + index,)
+
+
+def _split_arguments(text: str) -> List[str]:
+    # Splits on top-level commas only, so "sin(a, b)"-style nesting stays intact
+    if "(" not in text:
+        return [part for part in text.split(",") if part.strip()]
+    parts, depth, start = [], 0, 0
+    for index, char in enumerate(text):
+        if char == "(":
+            depth += 1
+        elif char == ")":
+            depth -= 1
+        elif char == "," and depth == 0:
+            parts.append(text[start:index])
+            start = index + 1
+    parts.append(text[start:])
+    return [part for part in parts if part.strip()]
+
+
+def _broadcast(operands: List[Tuple[int, ...]]) -> Iterable[List[int]]:
+    # Whole-register operands are applied element-wise; single qubits are repeated
+    if all(len(operand) == 1 for operand in operands):
+        yield [operand[0] for operand in operands]
+        return
+    sizes = {len(operand) for operand in operands if len(operand) != 1}
+    if len(sizes) > 1:
+        raise ValueError("Register operands of a gate must have the same size.")
+    width = sizes.pop() if sizes else 1
+    for index in range(width):
+        yield [
+            operand[index] if len(operand) > 1 else operand[0] for operand in operands
+        ]
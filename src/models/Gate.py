@@ -1,6 +1,28 @@
+from functools import lru_cache
+
 import numpy as np
 from src.models.QuantumObject import QuantumObject
 from src.models.NoiseChannel import NoiseChannel
+from src.simulator.kernels import apply_matrix, apply_matrix_density
+from src.simulator.sv_simulator import StateVectorSimulator
+
+# Maximum number of full-system operators kept by Gate.get_operator
+OPERATOR_CACHE_SIZE = 16
+
+
+@lru_cache(maxsize=OPERATOR_CACHE_SIZE)
+def _cached_operator(matrix_bytes, dtype, qubits, num_qubits):
+    # Keyed on the matrix contents rather than id(), which can be reused after GC.
+    # The operator is U applied to the row qubits of the identity, seen as a
+    # 2n-qubit vector.
+    size = 1 << len(qubits)
+    matrix = np.frombuffer(matrix_bytes, dtype=dtype).reshape(size, size)
+    identity = np.eye(2**num_qubits, dtype=np.result_type(matrix, complex))
+    operator = apply_matrix(
+        identity.reshape(-1), matrix, [q + num_qubits for q in qubits], 2 * num_qubits
+    ).reshape(identity.shape)
+    operator.setflags(write=False)
+    return operator
 
 
 class Gate(QuantumObject):
@@ -66,10 +88,7 @@ class Gate(QuantumObject):
         Returns:
             numpy.ndarray: The transformed state vector.
         """
-        num_qubits = int(np.log2(len(state_vector)))
-        self.validate(num_qubits)  # Make sure the gate is valid for this system
-        operator = self.get_operator(num_qubits)
-        return operator @ state_vector
+        return self.apply_local(state_vector)
 
     def _apply_density_matrix(self, density_matrix):
         """
@@ -82,13 +101,36 @@ class Gate(QuantumObject):
         Returns:
             numpy.ndarray: The transformed density matrix.
         """
-        num_qubits = (
-            int(np.log2(density_matrix.shape[0])) // 1
-        )  # Corrected to find integer log base 2 for density matrices
-        self.validate(num_qubits)
-        operator = self.get_operator(num_qubits)
-        operator_dagger = np.conjugate(operator).transpose()
-        return operator @ density_matrix @ operator_dagger
+        return self.apply_local(density_matrix)
+
+    def apply_local(self, quantum_state):
+        """
+        Applies the gate matrix directly to the target axes of a state vector or density
+        matrix, without building the full-system operator.  State vectors are routed
+        through the StateVectorSimulator kernels; density matrices are contracted with U
+        on the target row axes and U^dagger on the target column axes.
+
+        Args:
+            quantum_state (numpy.ndarray): A state vector (1-D) or density matrix (2-D).
+
+        Returns:
+            numpy.ndarray: The transformed state, as a new array.
+        """
+        if self.matrix is None:
+            raise ValueError("Gate matrix is not defined.")
+        num_qubits = int(np.log2(quantum_state.shape[0]))
+        self.validate(num_qubits)  # Make sure the gate is valid for this system
+
+        if quantum_state.ndim == 1:
+            simulator = StateVectorSimulator(num_qubits, initial_state=quantum_state)
+            simulator.apply_custom_gate(self.matrix, self.qubits)
+            return simulator.state_vector
+        density_matrix = np.array(
+            quantum_state, dtype=np.result_type(quantum_state, self.matrix)
+        )
+        return apply_matrix_density(
+            density_matrix, self.matrix, self.qubits, num_qubits
+        )
 
     def _apply_tensor_network(self, tensor_network):
         """
@@ -100,7 +142,10 @@ class Gate(QuantumObject):
         Returns:
             The transformed tensor network.
         """
-        raise NotImplementedError("Tensor network implementation not yet available.")
+        # Any tensor-network backend exposing apply_custom_gate (e.g. MPSSimulator)
+        self.validate(tensor_network.get_num_qubits())
+        tensor_network.apply_custom_gate(self.matrix, self.qubits)
+        return tensor_network
 
     def validate(self, num_qubits):
         """
@@ -129,8 +174,9 @@ class Gate(QuantumObject):
 
     def get_operator(self, num_qubits):
         """
-        Constructs the full operator for the quantum system. This implementation uses kronecker products.
-        Override this method in subclasses for optimized implementations, especially for tensor networks.
+        Constructs the full operator for the quantum system.  Only use this when the
+        2^n x 2^n matrix itself is needed; applying the gate goes through apply_local.
+        Operators are cached (see OPERATOR_CACHE_SIZE) and returned read-only.
 
         Args:
             num_qubits (int): Total number of qubits in the quantum system.
@@ -140,53 +186,14 @@ class Gate(QuantumObject):
         """
         if self.matrix is None:
             raise ValueError("Gate matrix is not defined.")
-
-        identity = np.eye(2, dtype=complex)
-        target_qubits = sorted(self.qubits)  # Ensure qubits are in increasing order
-        num_target_qubits = len(target_qubits)
-        all_qubits = list(range(num_qubits))
-
-        # Find qubits that are acted upon by the gate and unaffected qubits
-        affected_qubits = target_qubits
-        unaffected_qubits = [q for q in all_qubits if q not in affected_qubits]
-
-        # Initialize the operator to the gate's matrix
-        operator = self.matrix
-
-        # Build the full operator by kroneckering the identity matrix for each unaffected qubit
-        for _ in range(num_qubits - num_target_qubits):
-            operator = np.kron(identity, operator)
-
-        # Construct a permutation to map the operator's qubit order to the standard qubit order.
-        permutation = []
-        index_affected = 0
-        index_unaffected = 0
-        for _ in range(num_qubits):
-            if index_unaffected < len(unaffected_qubits) and unaffected_qubits[
-                index_unaffected
-            ] < min(affected_qubits, default=float("inf")):
-                permutation.append(unaffected_qubits[index_unaffected])
-                index_unaffected += 1
-            else:
-                permutation.append(affected_qubits[index_affected])
-                index_affected += 1
-        permute = np.argsort(permutation)
-
-        # Permute the operator
-        original_shape = (2,) * num_qubits
-        permuted_axes = tuple(permute)
-        operator = operator.reshape(original_shape + original_shape)
-        operator = np.moveaxis(
-            operator, range(num_qubits), range(num_qubits, 2 * num_qubits)
-        )  # Swapping order
-        operator = np.moveaxis(
-            operator,
-            range(num_qubits, 2 * num_qubits),
-            [i + num_qubits for i in permute],
+        self.validate(num_qubits)
+        matrix = np.ascontiguousarray(self.matrix)
+        return _cached_operator(
+            matrix.tobytes(),
+            matrix.dtype.str,
+            tuple(self.qubits),
+            num_qubits,
         )
-        operator = operator.reshape((2**num_qubits, 2**num_qubits))
-
-        return operator
 
     def __repr__(self):
         return f"{self.__class__.__name__}(name={self.name}, qubits={self.qubits})"
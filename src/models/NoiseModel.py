@@ -0,0 +1,164 @@
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+import numpy as np
+from src.models.NoiseChannel import NoiseChannel
+from src.models.gates.matrices import canonical_name
+from src.simulator.kernels import apply_matrix
+
+# Largest gate (in qubits) whose channels are folded into a single superoperator
+MAX_FUSED_QUBITS = 2
+# Number of fused gate-and-noise superoperators remembered per model
+FUSED_CACHE_SIZE = 1024
+
+
+def _gate_key(gate_name: str) -> str:
+    # Registry spelling where there is one ("cx" and "CNOT" match), else the raw name
+    try:
+        return canonical_name(gate_name)
+    except ValueError:
+        return gate_name
+
+
+class NoiseModel:
+    """
+    Attaches noise channels to the gates of a circuit. After each gate, every channel
+    registered for that gate's name (or for all gates) is applied to the gate's qubits.
+
+    The channels of a gate depend only on its name and qubits, so they are resolved
+    once per distinct (name, qubits) pair and reused for the rest of the run. For
+    gates on up to MAX_FUSED_QUBITS qubits, the gate and all of its channels are also
+    folded into one superoperator, so a noisy gate is a single contraction with rho.
+
+    Attributes:
+        rules (list): (channel, gate names or None, qubits or None) in insertion order.
+    """
+
+    def __init__(self):
+        self.rules: List[
+            Tuple[NoiseChannel, Optional[frozenset], Optional[frozenset]]
+        ] = []
+        self._resolved: Dict[Tuple[str, Tuple[int, ...]], list] = {}
+        self._fused: Dict[tuple, np.ndarray] = {}
+
+    def add_channel(
+        self,
+        channel: NoiseChannel,
+        gates: Optional[Union[str, Iterable[str]]] = None,
+        qubits: Optional[Iterable[int]] = None,
+    ) -> "NoiseModel":
+        """
+        Registers a channel to follow the given gates.
+
+        Args:
+            channel (NoiseChannel): The channel to apply.
+            gates (str | Iterable[str], optional): Gate names the channel follows, in any
+                spelling the registry knows. Defaults to every gate.
+            qubits (Iterable[int], optional): Restricts the channel to gates acting on
+                one of these qubits; a single-qubit channel then only acts on them.
+
+        Returns:
+            NoiseModel: This model, so calls can be chained.
+        """
+        if isinstance(gates, str):
+            gates = [gates]
+        names = None if gates is None else frozenset(_gate_key(g) for g in gates)
+        targets = None if qubits is None else frozenset(qubits)
+        self.rules.append((channel, names, targets))
+        self._resolved.clear()
+        self._fused.clear()
+        return self
+
+    def channels_for(self, gate) -> List[Tuple[NoiseChannel, List[int]]]:
+        """
+        Returns the channels that follow ``gate`` with the qubits each acts on.
+
+        Args:
+            gate (Gate): A gate with ``name`` and ``qubits``.
+
+        Returns:
+            list: (channel, qubits) pairs, in the order the channels were added.
+
+        Raises:
+            ValueError: If a multi-qubit channel does not match the gate's qubit count.
+        """
+        key = (gate.name, tuple(gate.qubits))
+        resolved = self._resolved.get(key)
+        if resolved is None:
+            resolved = self._resolve(_gate_key(gate.name), list(gate.qubits))
+            self._resolved[key] = resolved
+        return resolved
+
+    def fused_superoperator(self, gate) -> Optional[np.ndarray]:
+        """
+        Returns the superoperator of ``gate`` followed by its channels, acting on the
+        row qubits and then the column qubits of ``gate.qubits`` (see
+        ``apply_superoperator``), or None when the gate is better applied on its own:
+        it has no channels, acts on more than MAX_FUSED_QUBITS qubits, or broadcasts a
+        single-qubit matrix over several qubits.
+
+        Args:
+            gate (Gate): A gate with ``name``, ``qubits`` and ``matrix``.
+
+        Returns:
+            numpy.ndarray | None: The read-only 4^k x 4^k superoperator.
+        """
+        channels = self.channels_for(gate)
+        matrix = gate.matrix
+        k = len(gate.qubits)
+        if not channels or k > MAX_FUSED_QUBITS or matrix.shape != (1 << k, 1 << k):
+            return None
+        matrix = np.ascontiguousarray(matrix)
+        key = (gate.name, tuple(gate.qubits), matrix.tobytes())
+        fused = self._fused.get(key)
+        if fused is None:
+            fused = self._fuse(matrix, list(gate.qubits), channels)
+            if len(self._fused) >= FUSED_CACHE_SIZE:
+                self._fused.clear()
+            self._fused[key] = fused
+        return fused
+
+    @staticmethod
+    def _fuse(matrix, qubits, channels):
+        # The superoperator acts on 2k qubits: gate qubit j is bit 2k-1-j (row) and
+        # bit k-1-j (column). Channels are applied to the rows of the product, which
+        # are the upper 2k bits of the 4k-qubit vector it forms.
+        k = len(qubits)
+        fused = np.kron(matrix, np.conj(matrix)).astype(complex)
+        for channel, acted in channels:
+            positions = [qubits.index(q) for q in acted]
+            groups = (
+                [[p] for p in positions] if channel.num_qubits == 1 else [positions]
+            )
+            for group in groups:
+                rows = [4 * k - 1 - p for p in group]
+                columns = [3 * k - 1 - p for p in group]
+                fused = apply_matrix(
+                    fused.reshape(-1), channel.superoperator, rows + columns, 4 * k
+                ).reshape(fused.shape)
+        fused.setflags(write=False)
+        return fused
+
+    def _resolve(self, name: str, qubits: List[int]):
+        resolved = []
+        for channel, names, targets in self.rules:
+            if names is not None and name not in names:
+                continue
+            acted = qubits
+            if targets is not None:
+                if targets.isdisjoint(qubits):
+                    continue
+                if channel.num_qubits == 1:
+                    acted = [q for q in qubits if q in targets]
+            if channel.num_qubits not in (1, len(acted)):
+                raise ValueError(
+                    f"Channel {channel.name} acts on {channel.num_qubits} qubits, "
+                    f"but gate {name} acts on {qubits}."
+                )
+            resolved.append((channel, acted))
+        return resolved
+
+    def __len__(self):
+        return len(self.rules)
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(channels={len(self.rules)})"
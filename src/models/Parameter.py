@@ -0,0 +1,145 @@
+from numbers import Real
+from typing import Any, Dict, Mapping, Union
+
+import numpy as np
+
+
+def _name(key: Any) -> str:
+    return key.name if isinstance(key, Parameter) else key
+
+
+class ParameterExpression:
+    """
+    A linear expression sum_i c_i * p_i + constant over symbolic parameters, e.g. the
+    angle ``2 * gamma`` of a QAOA cost layer. Expressions are bound to numbers at run
+    time, either one value set at a time (``bind``) or for a whole batch (``evaluate``).
+
+    Attributes:
+        terms (dict): Coefficient of each parameter, keyed by parameter name.
+        constant (float): The constant offset.
+    """
+
+    __slots__ = ("terms", "constant")
+
+    def __init__(self, terms: Dict[str, float], constant: float = 0.0):
+        self.terms = {name: c for name, c in terms.items() if c != 0}
+        self.constant = float(constant)
+
+    @property
+    def parameters(self) -> frozenset:
+        """The names of the parameters this expression depends on."""
+        return frozenset(self.terms)
+
+    def bind(self, values: Mapping[Any, float]) -> Union[float, "ParameterExpression"]:
+        """
+        Substitutes the given parameter values (keyed by Parameter or name).
+
+        Returns:
+            float | ParameterExpression: A number once every parameter is bound,
+            otherwise the partially bound expression.
+        """
+        values = {_name(k): v for k, v in values.items()}
+        constant = self.constant
+        remaining = {}
+        for name, coefficient in self.terms.items():
+            if name in values:
+                constant += coefficient * float(values[name])
+            else:
+                remaining[name] = coefficient
+        return ParameterExpression(remaining, constant) if remaining else constant
+
+    def evaluate(self, values: Mapping[Any, Any]) -> np.ndarray:
+        """
+        Evaluates the expression for a batch of value sets.
+
+        Args:
+            values (Mapping): A length-B array of values per parameter (Parameter or
+                name keys); every parameter of the expression must be present.
+
+        Returns:
+            numpy.ndarray: The B values of the expression.
+        """
+        values = {_name(k): v for k, v in values.items()}
+        result = self.constant
+        for name, coefficient in self.terms.items():
+            if name not in values:
+                raise ValueError(f"No values given for parameter {name}.")
+            result = result + coefficient * np.asarray(values[name], dtype=float)
+        return np.asarray(result, dtype=float)
+
+    def _combine(self, other, sign: float) -> "ParameterExpression":
+        if isinstance(other, ParameterExpression):
+            terms = dict(self.terms)
+            for name, coefficient in other.terms.items():
+                terms[name] = terms.get(name, 0.0) + sign * coefficient
+            return ParameterExpression(terms, self.constant + sign * other.constant)
+        if isinstance(other, Real):
+            return ParameterExpression(self.terms, self.constant + sign * float(other))
+        return NotImplemented
+
+    def __add__(self, other):
+        return self._combine(other, 1.0)
+
+    def __radd__(self, other):
+        return self._combine(other, 1.0)
+
+    def __sub__(self, other):
+        return self._combine(other, -1.0)
+
+    def __rsub__(self, other):
+        return (-self)._combine(other, 1.0)
+
+    def __mul__(self, other):
+        if not isinstance(other, Real):
+            return NotImplemented  # only linear expressions are supported
+        factor = float(other)
+        return ParameterExpression(
+            {name: factor * c for name, c in self.terms.items()},
+            factor * self.constant,
+        )
+
+    def __rmul__(self, other):
+        return self.__mul__(other)
+
+    def __truediv__(self, other):
+        if not isinstance(other, Real):
+            return NotImplemented
+        return self.__mul__(1.0 / float(other))
+
+    def __neg__(self):
+        return self.__mul__(-1.0)
+
+    def __float__(self):
+        if self.terms:
+            raise TypeError(
+                f"Expression depends on unbound parameters {sorted(self.terms)}."
+            )
+        return self.constant
+
+    def __repr__(self):
+        parts = [f"{c:g}*{name}" for name, c in self.terms.items()]
+        if self.constant or not parts:
+            parts.append(f"{self.constant:g}")
+        return " + ".join(parts)
+
+
+class Parameter(ParameterExpression):
+    """
+    A named symbolic angle, e.g. ``Rx(Parameter("theta"), [0])``. Parameters with the
+    same name are the same parameter.
+    """
+
+    __slots__ = ("name",)
+
+    def __init__(self, name: str):
+        super().__init__({name: 1.0})
+        self.name = name
+
+    def __eq__(self, other):
+        return isinstance(other, Parameter) and other.name == self.name
+
+    def __hash__(self):
+        return hash((Parameter, self.name))
+
+    def __repr__(self):
+        return f"Parameter({self.name})"
@@ -0,0 +1,274 @@
+from collections import defaultdict
+from typing import Dict, Iterable, List, Tuple, Union
+
+import numpy as np
+from src.simulator.kernels import grouped_shape
+
+# i^k for k = 0..3, the phase of a Pauli string with k Y factors (Y = i X Z)
+_I_POWERS = (1, 1j, -1, -1j)
+
+
+def pauli_qubits(mask: int) -> List[int]:
+    """The qubits whose bit is set in ``mask``, in ascending order."""
+    return [q for q in range(mask.bit_length()) if (mask >> q) & 1]
+
+
+def _walsh_hadamard(values: np.ndarray, num_qubits: int) -> np.ndarray:
+    # In place: values[z] becomes sum_b values[b] * (-1)^popcount(b & z)
+    for q in range(num_qubits):
+        view = values.reshape(-1, 2, 1 << q)
+        low = view[:, 0].copy()
+        view[:, 0] += view[:, 1]
+        np.subtract(low, view[:, 1], out=view[:, 1])
+    return values
+
+
+def _sign_vector(z_mask: int, num_qubits: int) -> np.ndarray:
+    # (-1)^popcount(b & z) for every basis state b
+    signs = np.ones(1 << num_qubits)
+    qubits = pauli_qubits(z_mask)
+    if qubits:
+        shape, axes = grouped_shape(num_qubits, qubits)
+        view = signs.reshape(shape)
+        for axis in axes:
+            selector = [slice(None)] * len(shape)
+            selector[axis] = 1
+            view[tuple(selector)] *= -1
+    return signs
+
+
+def _parity_sum(values: np.ndarray, z_mask: int, num_qubits: int) -> complex:
+    # sum_b values[b] * (-1)^popcount(b & z): sum out every qubit outside z (one pass),
+    # then sign the remaining 2^k entries
+    qubits = pauli_qubits(z_mask)
+    if not qubits:
+        return complex(values.sum())
+    shape, axes = grouped_shape(num_qubits, qubits)
+    others = tuple(axis for axis in range(len(shape)) if axis not in axes)
+    reduced = (
+        values.reshape(shape).sum(axis=others) if others else values.reshape(shape)
+    )
+    signs = np.ones(1)
+    for _ in qubits:
+        signs = np.kron(signs, [1, -1])
+    # After the reduction the target axes are in ascending axis order (descending
+    # qubit order), which matches the C-order flattening of the kron above
+    return complex(np.dot(reduced.reshape(-1), signs))
+
+
+class PauliSum:
+    """
+    A Hermitian observable sum_t c_t P_t over Pauli strings, stored as bitmask pairs:
+    bit q of ``x_masks[t]`` / ``z_masks[t]`` says whether P_t has an X / Z factor on
+    qubit q (both for Y, since Y = i X Z). No 2^n x 2^n matrix is ever built. Masks
+    are uint64 up to 64 qubits and Python integers beyond.
+
+    With P = i^{|x & z|} X^x Z^z, P|b> = i^{|x & z|} (-1)^{|b & z|} |b ^ x>, so
+
+        <psi|P|psi> = i^{|x & z|} sum_b conj(psi[b ^ x]) psi[b] (-1)^{|b & z|}
+        tr(rho P)   = i^{|x & z|} sum_b rho[b, b ^ x]        (-1)^{|b & z|}.
+
+    Terms are grouped by x-mask: one gather per group builds the products above, and
+    each z-mask in the group is a signed sum of that vector. Large groups (e.g. all the
+    diagonal ZZ...Z terms of an Ising Hamiltonian) read every z at once from one
+    Walsh-Hadamard transform, so evaluation is O(terms * 2^n) at worst.
+
+    Attributes:
+        num_qubits (int): Number of qubits the observable is defined on.
+        x_masks (numpy.ndarray): X bitmask of each term.
+        z_masks (numpy.ndarray): Z bitmask of each term.
+        coefficients (numpy.ndarray): Complex coefficient of each term.
+    """
+
+    def __init__(
+        self,
+        terms: Iterable[Tuple[str, complex]] = (),
+        num_qubits: int = None,
+    ):
+        """
+        Builds an observable from (label, coefficient) pairs.
+
+        Args:
+            terms (Iterable[tuple]): Pauli labels over "IXYZ" with qubit 0 rightmost,
+                as in measured bitstrings (e.g. ("ZZI", 0.5) is 0.5 Z_2 Z_1).
+            num_qubits (int, optional): Defaults to the length of the labels.
+
+        Raises:
+            ValueError: For unknown Pauli characters or labels of different lengths.
+        """
+        x_masks, z_masks, coefficients = [], [], []
+        lengths = set()
+        for label, coefficient in terms:
+            x = z = 0
+            for q, pauli in enumerate(reversed(label.upper())):
+                if pauli in "XY":
+                    x |= 1 << q
+                if pauli in "ZY":
+                    z |= 1 << q
+                if pauli not in "IXYZ":
+                    raise ValueError(f"Unknown Pauli '{pauli}' in label {label}.")
+            lengths.add(len(label))
+            x_masks.append(x)
+            z_masks.append(z)
+            coefficients.append(coefficient)
+        if len(lengths) > 1:
+            raise ValueError(f"Pauli labels have different lengths {sorted(lengths)}.")
+        if num_qubits is None:
+            num_qubits = lengths.pop() if lengths else 0
+        self._set(num_qubits, x_masks, z_masks, coefficients)
+
+    def _set(self, num_qubits, x_masks, z_masks, coefficients):
+        # Masks of more than 64 qubits (MPS backend) are kept as Python integers
+        dtype = np.uint64 if num_qubits <= 64 else object
+        self.num_qubits = num_qubits
+        self.x_masks = np.asarray(x_masks, dtype=dtype).reshape(-1)
+        self.z_masks = np.asarray(z_masks, dtype=dtype).reshape(-1)
+        self.coefficients = np.asarray(coefficients, dtype=complex).reshape(-1)
+        if len(self.x_masks) != len(self.z_masks) or len(self.x_masks) != len(
+            self.coefficients
+        ):
+            raise ValueError("Masks and coefficients must have the same length.")
+        self._groups = None
+
+    @classmethod
+    def from_masks(cls, num_qubits, x_masks, z_masks, coefficients) -> "PauliSum":
+        """Builds an observable directly from X/Z bitmasks and coefficients."""
+        observable = cls.__new__(cls)
+        observable._set(num_qubits, x_masks, z_masks, coefficients)
+        return observable
+
+    def groups(self) -> Dict[int, Tuple[List[int], np.ndarray]]:
+        """
+        Terms grouped by x-mask (terms in a group share one gather of the state).
+
+        Returns:
+            dict: x-mask -> (z-masks, coefficients including the i^{|x & z|} phase).
+        """
+        if self._groups is None:
+            collected = defaultdict(lambda: ([], []))
+            for x, z, c in zip(
+                self.x_masks.tolist(), self.z_masks.tolist(), self.coefficients
+            ):
+                zs, cs = collected[x]
+                zs.append(z)
+                cs.append(c * _I_POWERS[(x & z).bit_count() % 4])
+            self._groups = {x: (zs, np.array(cs)) for x, (zs, cs) in collected.items()}
+        return self._groups
+
+    def expectation_value(self, quantum_state: np.ndarray) -> float:
+        """
+        Evaluates <O> on a state vector (1-D) or density matrix (2-D) without a dense
+        observable.
+
+        Returns:
+            float: The real part of <O> (exact for Hermitian observables).
+        """
+        n = self.num_qubits
+        if quantum_state.shape[0] != 1 << n:
+            raise ValueError(
+                f"State of dimension {quantum_state.shape[0]} does not match {n} qubits."
+            )
+        total = 0j
+        for x, (z_masks, coefficients) in self.groups().items():
+            if quantum_state.ndim == 1:
+                products = self._vector_products(quantum_state, x)
+            else:
+                products = self._density_products(quantum_state, x)
+            if len(z_masks) > n:
+                transformed = _walsh_hadamard(products, n)
+                sums = transformed[np.asarray(z_masks, dtype=np.int64)]
+            else:
+                sums = np.array([_parity_sum(products, z, n) for z in z_masks])
+            total += np.dot(coefficients, sums)
+        return float(total.real)
+
+    def _vector_products(self, state_vector: np.ndarray, x_mask: int) -> np.ndarray:
+        # conj(psi[b ^ x]) * psi[b]: flipping the x qubits is reversing their axes
+        if x_mask == 0:
+            return np.abs(state_vector) ** 2 + 0j
+        shape, axes = grouped_shape(self.num_qubits, pauli_qubits(x_mask))
+        view = state_vector.reshape(shape)
+        return (np.conj(np.flip(view, axis=axes)) * view).reshape(-1)
+
+    def _density_products(self, density_matrix: np.ndarray, x_mask: int) -> np.ndarray:
+        # rho[b, b ^ x] gathered from the flat matrix
+        indices = np.arange(1 << self.num_qubits, dtype=np.int64)
+        flat = density_matrix.reshape(-1)
+        products = flat[(indices << self.num_qubits) + (indices ^ x_mask)]
+        # Complex in the precision of rho (a real rho becomes complex128)
+        return products.astype(np.result_type(products, np.complex64), copy=False)
+
+    def apply(self, state_vector: np.ndarray) -> np.ndarray:
+        """
+        Computes O|psi> without a dense observable, as a sum over x-mask groups of
+        D_x * psi[c ^ x], where D_x[c] collects the signed coefficients of the group.
+
+        Args:
+            state_vector (numpy.ndarray): The 2^n state vector.
+
+        Returns:
+            numpy.ndarray: A new state vector holding O|psi>.
+        """
+        n = self.num_qubits
+        # O|psi> keeps the precision of psi (complex64 stays complex64)
+        result = np.zeros(1 << n, dtype=np.result_type(state_vector, np.complex64))
+        for x, (z_masks, coefficients) in self.groups().items():
+            # (P psi)[c] = i^{|x&z|} (-1)^{|(c ^ x) & z|} psi[c ^ x]
+            weights = np.array(
+                [c * (-1) ** (x & z).bit_count() for z, c in zip(z_masks, coefficients)]
+            )
+            if len(z_masks) > n:
+                diagonal = np.zeros(1 << n, dtype=complex)
+                np.add.at(diagonal, np.asarray(z_masks, dtype=np.int64), weights)
+                diagonal = _walsh_hadamard(diagonal, n)
+            else:
+                diagonal = np.zeros(1 << n, dtype=complex)
+                for z, weight in zip(z_masks, weights):
+                    diagonal += weight * _sign_vector(z, n)
+            diagonal = diagonal.astype(result.dtype, copy=False)
+            if x == 0:
+                result += diagonal * state_vector
+            else:
+                shape, axes = grouped_shape(n, pauli_qubits(x))
+                flipped = np.flip(state_vector.reshape(shape), axis=axes)
+                result += diagonal * flipped.reshape(-1)
+        return result
+
+    def to_matrix(self) -> np.ndarray:
+        """The dense 2^n x 2^n matrix. Only meant for small systems and checks."""
+        dim = 1 << self.num_qubits
+        indices = np.arange(dim, dtype=np.int64)
+        matrix = np.zeros((dim, dim), dtype=complex)
+        for x, z, c in zip(
+            self.x_masks.tolist(), self.z_masks.tolist(), self.coefficients
+        ):
+            signs = np.ones(dim)
+            for q in pauli_qubits(z):
+                signs = np.where((indices >> q) & 1, -signs, signs)
+            phase = c * _I_POWERS[(x & z).bit_count() % 4]
+            matrix[indices ^ x, indices] += phase * signs
+        return matrix
+
+    def __add__(self, other: "PauliSum") -> "PauliSum":
+        if not isinstance(other, PauliSum):
+            return NotImplemented
+        return PauliSum.from_masks(
+            max(self.num_qubits, other.num_qubits),
+            np.concatenate([self.x_masks, other.x_masks]),
+            np.concatenate([self.z_masks, other.z_masks]),
+            np.concatenate([self.coefficients, other.coefficients]),
+        )
+
+    def __mul__(self, factor: Union[int, float, complex]) -> "PauliSum":
+        return PauliSum.from_masks(
+            self.num_qubits, self.x_masks, self.z_masks, self.coefficients * factor
+        )
+
+    def __rmul__(self, factor: Union[int, float, complex]) -> "PauliSum":
+        return self.__mul__(factor)
+
+    def __len__(self):
+        return len(self.coefficients)
+
+    def __repr__(self):
+        return f"PauliSum(num_qubits={self.num_qubits}, terms={len(self)})"
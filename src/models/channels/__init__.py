@@ -0,0 +1,15 @@
+from .kraus import KrausChannel
+from .depolarizing import DepolarizingChannel
+from .amplitude_damping import AmplitudeDampingChannel
+from .phase_damping import PhaseDampingChannel
+from .bit_flip import BitFlipChannel
+from .phase_flip import PhaseFlipChannel
+
+__all__ = [
+    "KrausChannel",
+    "DepolarizingChannel",
+    "AmplitudeDampingChannel",
+    "PhaseDampingChannel",
+    "BitFlipChannel",
+    "PhaseFlipChannel",
+]
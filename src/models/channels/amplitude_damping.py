@@ -0,0 +1,17 @@
+import numpy as np
+from .kraus import KrausChannel, check_probability
+
+
+class AmplitudeDampingChannel(KrausChannel):
+    def __init__(self, gamma):
+        """
+        Initialize the amplitude damping channel (energy relaxation |1> -> |0>).
+
+        :param gamma: Decay probability in [0, 1].
+        """
+        check_probability(gamma)
+        operators = [
+            [[1, 0], [0, np.sqrt(1 - gamma)]],
+            [[0, np.sqrt(gamma)], [0, 0]],
+        ]
+        super().__init__(operators, name="AmplitudeDamping", strength=gamma)
@@ -0,0 +1,30 @@
+import itertools
+from functools import reduce
+
+import numpy as np
+from src.models.gates.matrices import I_MATRIX, X_MATRIX, Y_MATRIX, Z_MATRIX
+from .kraus import KrausChannel, check_probability
+
+
+class DepolarizingChannel(KrausChannel):
+    def __init__(self, probability, num_qubits=1):
+        """
+        Initialize the depolarizing channel rho -> (1 - p) rho + p I / 2^k, with the
+        4^k Pauli strings as Kraus operators.
+
+        :param probability: Depolarizing probability p in [0, 1].
+        :param num_qubits: Number of qubits k the channel acts on jointly.
+        """
+        check_probability(probability)
+        paulis = (I_MATRIX, X_MATRIX, Y_MATRIX, Z_MATRIX)
+        scale = 4**num_qubits
+        operators = []
+        for index, factors in enumerate(itertools.product(paulis, repeat=num_qubits)):
+            weight = (
+                1 - probability + probability / scale
+                if index == 0
+                else probability / scale
+            )
+            if weight > 0:
+                operators.append(np.sqrt(weight) * reduce(np.kron, factors))
+        super().__init__(operators, name="Depolarizing", strength=probability)
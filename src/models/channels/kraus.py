@@ -0,0 +1,277 @@
+import numpy as np
+from src.models.NoiseChannel import NoiseChannel
+from src.simulator.kernels import (
+    apply_kraus,
+    apply_superoperator,
+    reduced_density_matrix,
+)
+from src.simulator.sv_simulator import StateVectorSimulator
+
+# Allowed deviation of sum_i K_i^dagger K_i from the identity
+COMPLETENESS_TOLERANCE = 1e-10
+
+
+def check_probability(probability):
+    """Raises ValueError unless ``probability`` lies in [0, 1]."""
+    if not 0.0 <= probability <= 1.0:
+        raise ValueError(f"Probability {probability} must lie in [0, 1].")
+
+
+class KrausChannel(NoiseChannel):
+    """
+    A noise channel given by its Kraus operators, rho -> sum_i K_i rho K_i^dagger.
+
+    The channel is contracted with the target qubits of rho only. Its superoperator
+    S = sum_i K_i kron conj(K_i) is precomputed and used whenever one 4^k x 4^k
+    contraction is cheaper than two 2^k x 2^k contractions per Kraus operator, or when
+    S is diagonal and can be applied in place.
+
+    Attributes:
+        kraus_operators (tuple): Read-only 2^k x 2^k Kraus operators.
+        num_qubits (int): The number of qubits k the channel acts on.
+        superoperator (numpy.ndarray): Read-only 4^k x 4^k superoperator.
+    """
+
+    def __init__(self, kraus_operators, name="Kraus", strength=0.0):
+        """
+        Initializes a channel from its Kraus operators.
+
+        Args:
+            kraus_operators (Sequence[numpy.ndarray]): The 2^k x 2^k Kraus operators;
+                qubits[0] is the most significant bit of their index.
+            name (str, optional): The name of the channel. Defaults to "Kraus".
+            strength (float, optional): The noise strength, for reference.
+
+        Raises:
+            ValueError: If the operators have mismatched or non power-of-two shapes, or
+                are not trace preserving.
+        """
+        super().__init__(name, strength)
+        operators = []
+        for kraus in kraus_operators:
+            kraus = np.array(kraus, dtype=complex)
+            kraus.setflags(write=False)
+            operators.append(kraus)
+        if not operators:
+            raise ValueError("A Kraus channel needs at least one operator.")
+        dim = operators[0].shape[0]
+        if dim < 2 or dim & (dim - 1) or any(k.shape != (dim, dim) for k in operators):
+            raise ValueError(
+                f"Kraus operators of shapes {[k.shape for k in operators]} do not act on whole qubits."
+            )
+        completeness = sum(k.conj().T @ k for k in operators)
+        if not np.allclose(completeness, np.eye(dim), atol=COMPLETENESS_TOLERANCE):
+            raise ValueError(f"Kraus operators of {name} are not trace preserving.")
+
+        self.kraus_operators = tuple(operators)
+        self.num_qubits = dim.bit_length() - 1
+        superoperator = sum(np.kron(k, k.conj()) for k in operators)
+        superoperator.setflags(write=False)
+        self.superoperator = superoperator
+        diagonal = np.count_nonzero(superoperator) == np.count_nonzero(
+            np.diagonal(superoperator)
+        )
+        # Superoperator: 4^k work per amplitude; Kraus form: 2 * m * 2^k plus a sum
+        self._use_superoperator = diagonal or dim <= 2 * len(operators)
+
+        # Trajectories: K_i^dagger K_i gives the branch probabilities. When every one is
+        # a multiple w_i of the identity (a mixture of unitaries, e.g. Pauli channels)
+        # the probabilities do not depend on the state and need no reduced state.
+        self._gram = np.array([k.conj().T @ k for k in operators])
+        weights = np.real(np.trace(self._gram, axis1=1, axis2=2)) / dim
+        self._mixture = all(
+            np.allclose(g, w * np.eye(dim), atol=COMPLETENESS_TOLERANCE)
+            for g, w in zip(self._gram, weights)
+        )
+        self._weights = weights
+        self._branches = []
+        for kraus, weight in zip(operators, weights):
+            branch = kraus / np.sqrt(weight) if weight > 0 else kraus
+            if self._mixture and np.allclose(branch, np.eye(dim)):
+                branch = None  # identity branch: nothing to apply
+            self._branches.append(branch)
+
+    def target_groups(self, qubits, num_qubits):
+        """
+        Splits ``qubits`` into the groups the channel acts on: each qubit on its own for
+        a single-qubit channel, otherwise all of them at once.
+
+        Raises:
+            ValueError: If a group does not match the channel or the system.
+        """
+        if isinstance(qubits, int):
+            qubits = [qubits]
+        if self.num_qubits == 1 and len(qubits) > 1:
+            groups = [[q] for q in qubits]
+        else:
+            groups = [list(qubits)]
+        for group in groups:
+            self._validate_qubits(group, num_qubits)
+        return groups
+
+    def contract(self, density_matrix, qubits, num_qubits, scratch=None, threads=1):
+        """
+        Applies the channel to rho in place. A single-qubit channel given several
+        qubits acts on each of them independently.
+
+        Args:
+            density_matrix (numpy.ndarray): The 2^n x 2^n density matrix.
+            qubits (list): The target qubits.
+            num_qubits (int): Total number of qubits n.
+            scratch (numpy.ndarray, optional): Reusable buffer of the same size as rho.
+            threads (int, optional): Worker threads for the contraction. Defaults to 1.
+
+        Returns:
+            numpy.ndarray: ``density_matrix``, holding the transformed state.
+        """
+        for group in self.target_groups(qubits, num_qubits):
+            if self._use_superoperator:
+                apply_superoperator(
+                    density_matrix,
+                    self.superoperator,
+                    group,
+                    num_qubits,
+                    scratch,
+                    threads,
+                )
+            else:
+                apply_kraus(
+                    density_matrix,
+                    self.kraus_operators,
+                    group,
+                    num_qubits,
+                    scratch,
+                    threads,
+                )
+        return density_matrix
+
+    def sample_operator(self, state_vector, qubits, num_qubits, rng, scratch=None):
+        """
+        Samples the Kraus branch of one trajectory, with probability ||K_i psi||^2.
+
+        Args:
+            state_vector (numpy.ndarray): The normalized state vector psi.
+            qubits (list): The k target qubits.
+            num_qubits (int): Total number of qubits n.
+            rng (numpy.random.Generator): Source of randomness.
+            scratch (numpy.ndarray, optional): Reusable buffer of the same size as psi.
+
+        Returns:
+            numpy.ndarray | None: K_i / sqrt(p_i), which keeps psi normalized, or None
+            if the sampled branch is the identity.
+        """
+        return self.sample_with(
+            lambda: reduced_density_matrix(state_vector, qubits, num_qubits, scratch),
+            rng,
+        )
+
+    def sample_with(self, reduced_state, rng):
+        """
+        Samples a Kraus branch given the reduced state of the targets, which any
+        backend able to produce it (state vector, MPS) can supply.
+
+        Args:
+            reduced_state (Callable[[], numpy.ndarray]): Returns the 2^k x 2^k reduced
+                density matrix of the targets; only called for channels whose branch
+                probabilities depend on the state.
+            rng (numpy.random.Generator): Source of randomness.
+
+        Returns:
+            numpy.ndarray | None: As for ``sample_operator``.
+        """
+        if self._mixture:
+            probabilities = self._weights
+        else:
+            # ||K_i psi||^2 = tr(K_i^dagger K_i rho_T) with rho_T the reduced state
+            probabilities = np.maximum(
+                np.real(np.einsum("kij,ji->k", self._gram, reduced_state())), 0.0
+            )
+        cumulative = np.cumsum(probabilities)
+        index = int(np.searchsorted(cumulative, rng.random() * cumulative[-1], "right"))
+        index = min(index, len(cumulative) - 1)
+        if self._mixture:
+            return self._branches[index]
+        return self.kraus_operators[index] / np.sqrt(
+            probabilities[index] / cumulative[-1]
+        )
+
+    def _apply_state_vector(self, state_vector, qubits, rng=None):
+        """
+        Applies one sampled Kraus branch to a state vector (a single trajectory).
+
+        Args:
+            state_vector (numpy.ndarray): The state vector.
+            qubits (list): The qubits that the noise acts on.
+            rng (numpy.random.Generator, optional): Source of randomness.
+
+        Returns:
+            numpy.ndarray: The transformed, normalized state vector, as a new array.
+        """
+        num_qubits = int(np.log2(state_vector.shape[0]))
+        simulator = StateVectorSimulator(
+            num_qubits, rng=rng, initial_state=state_vector
+        )
+        simulator.apply_channel(self, qubits)
+        return simulator.state_vector
+
+    def _apply_tensor_network(self, tensor_network, qubits):
+        """
+        Applies one sampled Kraus branch to a matrix product state (a trajectory).
+
+        Args:
+            tensor_network (MPSSimulator): The MPS, updated in place.
+            qubits (list): The qubits that the noise acts on.
+
+        Returns:
+            MPSSimulator: ``tensor_network``.
+        """
+        tensor_network.apply_channel(self, qubits)
+        return tensor_network
+
+    def _apply_density_matrix(self, density_matrix, qubits):
+        """
+        Applies the channel to a density matrix.
+
+        Args:
+            density_matrix (numpy.ndarray): The density matrix.
+            qubits (list): The qubits that the noise acts on.
+
+        Returns:
+            numpy.ndarray: The transformed density matrix, as a new array.
+        """
+        num_qubits = int(np.log2(density_matrix.shape[0]))
+        density_matrix = np.array(density_matrix, dtype=complex)
+        return self.contract(density_matrix, qubits, num_qubits)
+
+    def _validate_qubits(self, qubits, num_qubits):
+        if len(qubits) != self.num_qubits:
+            raise ValueError(
+                f"Channel {self.name} acts on {self.num_qubits} qubit(s), got {qubits}."
+            )
+        if len(set(qubits)) != len(qubits) or any(
+            q >= num_qubits or q < 0 for q in qubits
+        ):
+            raise ValueError(
+                f"Invalid qubit indices {qubits} for a system with {num_qubits} qubits."
+            )
+
+    def validate(self, num_qubits):
+        """
+        Validates the channel against the given number of qubits.
+
+        Args:
+            num_qubits (int): Total number of qubits in the quantum system.
+
+        Raises:
+            ValueError: If the channel acts on more qubits than the system has.
+        """
+        if self.num_qubits > num_qubits:
+            raise ValueError(
+                f"Channel {self.name} acts on {self.num_qubits} qubits, but the system has {num_qubits}."
+            )
+
+    def __repr__(self):
+        return (
+            f"{self.__class__.__name__}(name={self.name}, strength={self.strength}, "
+            f"num_qubits={self.num_qubits}, num_operators={len(self.kraus_operators)})"
+        )
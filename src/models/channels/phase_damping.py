@@ -0,0 +1,18 @@
+import numpy as np
+from .kraus import KrausChannel, check_probability
+
+
+class PhaseDampingChannel(KrausChannel):
+    def __init__(self, lam):
+        """
+        Initialize the phase damping channel, which scales the off-diagonal entries of
+        rho by sqrt(1 - lam) and leaves populations unchanged.
+
+        :param lam: Damping probability in [0, 1].
+        """
+        check_probability(lam)
+        operators = [
+            [[1, 0], [0, np.sqrt(1 - lam)]],
+            [[0, 0], [0, np.sqrt(lam)]],
+        ]
+        super().__init__(operators, name="PhaseDamping", strength=lam)
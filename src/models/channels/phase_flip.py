@@ -0,0 +1,18 @@
+import numpy as np
+from src.models.gates.matrices import I_MATRIX, Z_MATRIX
+from .kraus import KrausChannel, check_probability
+
+
+class PhaseFlipChannel(KrausChannel):
+    def __init__(self, probability):
+        """
+        Initialize the phase flip channel, which applies Z with the given probability.
+
+        :param probability: Flip probability in [0, 1].
+        """
+        check_probability(probability)
+        operators = [
+            np.sqrt(1 - probability) * I_MATRIX,
+            np.sqrt(probability) * Z_MATRIX,
+        ]
+        super().__init__(operators, name="PhaseFlip", strength=probability)
@@ -11,6 +11,7 @@ from .y import Y
 from .z import Z
 from .cnot import CNOT
 from .cz import CZ
+from .unitary import Unitary
 
 __all__ = [
     "X",
@@ -26,4 +27,5 @@ __all__ = [
     "Z",
     "CNOT",
     "CZ",
+    "Unitary",
 ]
@@ -3,6 +3,8 @@ from .gate import Gate
 
 
 class CNOT(Gate):
+    __slots__ = ()
+
     def __init__(self, control_qubit, target_qubit):
         """
         Initialize the CNOT (Controlled-NOT) gate.
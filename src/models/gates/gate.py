@@ -1,8 +1,12 @@
 import numpy as np
 from abc import ABC, abstractmethod
 
+from .matrices import gate_matrix
+
 
 class Gate(ABC):
+    __slots__ = ("name", "qubits")
+
     def __init__(self, name, qubits=None):
         """
         Base class for quantum gates.
@@ -12,7 +16,7 @@ class Gate(ABC):
         """
         self.name = name
         self.qubits = qubits if qubits is not None else []
-        # Matrix removed, will be handled by simulators
+        # Matrices are looked up in the shared registry (see matrices.py)
 
     @abstractmethod
     def apply(self, simulator_context, **kwargs):
@@ -38,6 +42,13 @@ class Gate(ABC):
                 f"Invalid qubit indices {self.qubits} for a system with {num_qubits} qubits."
             )
 
+    @property
+    def matrix(self) -> np.ndarray:
+        """
+        The read-only matrix of the gate, shared through the gate-matrix registry.
+        """
+        return gate_matrix(self.name)
+
     # get_operator removed, will be handled by simulators
 
     def __repr__(self):
@@ -3,6 +3,8 @@ from .gate import Gate
 
 
 class Hadamard(Gate):
+    __slots__ = ()
+
     def __init__(self, qubits=None):
         """
         Initialize the Hadamard gate.
@@ -3,6 +3,8 @@ from .gate import Gate
 
 
 class Identity(Gate):
+    __slots__ = ()
+
     def __init__(self, qubits=None):
         """
         Initialize the Identity (I) gate.
@@ -0,0 +1,210 @@
+import numpy as np
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Optional, Sequence, Union
+
+# Number of distinct angles remembered per parametric gate
+PARAMETRIC_CACHE_SIZE = 4096
+
+# Amplitude types a simulator can run in; "single" halves memory and bandwidth
+PRECISIONS = MappingProxyType(
+    {"double": np.dtype(np.complex128), "single": np.dtype(np.complex64)}
+)
+
+
+def complex_dtype(precision: Union[str, type, np.dtype]) -> np.dtype:
+    """
+    Resolves a precision option to its complex dtype.
+
+    :param precision: "double" or "single", or the dtype itself (complex128/complex64).
+    :raises ValueError: For any other precision.
+    """
+    if isinstance(precision, str) and precision in PRECISIONS:
+        return PRECISIONS[precision]
+    try:
+        dtype = np.dtype(precision)
+    except TypeError:
+        dtype = None
+    if dtype not in PRECISIONS.values():
+        raise ValueError(
+            f"Unsupported precision {precision!r}; use one of {list(PRECISIONS)}."
+        )
+    return dtype
+
+
+def _frozen(matrix, dtype=np.complex128) -> np.ndarray:
+    """Returns a read-only complex copy of ``matrix``."""
+    matrix = np.array(matrix, dtype=dtype)
+    matrix.setflags(write=False)
+    return matrix
+
+
+I_MATRIX = _frozen(np.eye(2))
+X_MATRIX = _frozen([[0, 1], [1, 0]])
+Y_MATRIX = _frozen([[0, -1j], [1j, 0]])
+Z_MATRIX = _frozen([[1, 0], [0, -1]])
+H_MATRIX = _frozen(np.array([[1, 1], [1, -1]]) / np.sqrt(2))
+S_MATRIX = _frozen([[1, 0], [0, 1j]])
+T_MATRIX = _frozen([[1, 0], [0, np.exp(1j * np.pi / 4)]])
+# Two-qubit gates act on [control, target]; the control is the most significant bit
+CNOT_MATRIX = _frozen([[1, 0, 0, 0], [0, 1, 0, 0], [0, 0, 0, 1], [0, 0, 1, 0]])
+CZ_MATRIX = _frozen(np.diag([1, 1, 1, -1]))
+
+FIXED_GATES = MappingProxyType(
+    {
+        "I": I_MATRIX,
+        "X": X_MATRIX,
+        "Y": Y_MATRIX,
+        "Z": Z_MATRIX,
+        "H": H_MATRIX,
+        "S": S_MATRIX,
+        "T": T_MATRIX,
+        "CNOT": CNOT_MATRIX,
+        "CZ": CZ_MATRIX,
+    }
+)
+# The same matrices rounded once to single precision
+_SINGLE_FIXED_GATES = MappingProxyType(
+    {name: _frozen(matrix, np.complex64) for name, matrix in FIXED_GATES.items()}
+)
+_FIXED_BY_DTYPE = {
+    PRECISIONS["double"]: FIXED_GATES,
+    PRECISIONS["single"]: _SINGLE_FIXED_GATES,
+}
+PARAMETRIC_GATES = ("Rx", "Ry", "Rz", "Ph")
+
+# Lower-case spellings (QASM names, class names) mapped to the registry names
+_ALIASES = {
+    "i": "I",
+    "id": "I",
+    "identity": "I",
+    "x": "X",
+    "y": "Y",
+    "z": "Z",
+    "h": "H",
+    "hadamard": "H",
+    "s": "S",
+    "t": "T",
+    "cx": "CNOT",
+    "cnot": "CNOT",
+    "cz": "CZ",
+    "rx": "Rx",
+    "ry": "Ry",
+    "rz": "Rz",
+    "ph": "Ph",
+}
+
+
+def canonical_name(gate_name: str) -> str:
+    """
+    Maps any supported spelling of a gate name (e.g. 'h', 'Hadamard', 'cx') to its
+    registry name (e.g. 'H', 'CNOT').
+
+    :raises ValueError: If the gate is not in the registry.
+    """
+    try:
+        return _ALIASES[gate_name.lower()]
+    except KeyError:
+        raise ValueError(f"Unsupported gate: {gate_name}") from None
+
+
+def _rx(theta):
+    c, s = np.cos(np.multiply(theta, 0.5)), np.sin(np.multiply(theta, 0.5))
+    return np.stack(
+        [np.stack([c, -1j * s], axis=-1), np.stack([-1j * s, c], axis=-1)], axis=-2
+    ).astype(complex)
+
+
+def _ry(theta):
+    c, s = np.cos(np.multiply(theta, 0.5)), np.sin(np.multiply(theta, 0.5))
+    return np.stack(
+        [np.stack([c, -s], axis=-1), np.stack([s, c], axis=-1)], axis=-2
+    ).astype(complex)
+
+
+def _rz(theta):
+    phase = np.exp(np.multiply(theta, 0.5j))
+    zero = np.zeros_like(phase)
+    return np.stack(
+        [np.stack([np.conj(phase), zero], axis=-1), np.stack([zero, phase], axis=-1)],
+        axis=-2,
+    )
+
+
+def _ph(delta):
+    phase = np.exp(np.multiply(delta, 1j))
+    one, zero = np.ones_like(phase), np.zeros_like(phase)
+    return np.stack(
+        [np.stack([one, zero], axis=-1), np.stack([zero, phase], axis=-1)], axis=-2
+    )
+
+
+_BUILDERS = {"Rx": _rx, "Ry": _ry, "Rz": _rz, "Ph": _ph}
+
+
+@lru_cache(maxsize=PARAMETRIC_CACHE_SIZE)
+def _cached_parametric(
+    name: str, angle: float, dtype: np.dtype = PRECISIONS["double"]
+) -> np.ndarray:
+    # Evaluated in double precision and rounded once
+    return _frozen(_BUILDERS[name](angle), dtype)
+
+
+def rx_matrix(theta: float) -> np.ndarray:
+    """Rotation around the X axis, memoized per angle."""
+    return _cached_parametric("Rx", float(theta))
+
+
+def ry_matrix(theta: float) -> np.ndarray:
+    """Rotation around the Y axis, memoized per angle."""
+    return _cached_parametric("Ry", float(theta))
+
+
+def rz_matrix(theta: float) -> np.ndarray:
+    """Rotation around the Z axis, memoized per angle."""
+    return _cached_parametric("Rz", float(theta))
+
+
+def ph_matrix(delta: float) -> np.ndarray:
+    """Phase shift diag(1, e^{i delta}), memoized per angle."""
+    return _cached_parametric("Ph", float(delta))
+
+
+def parametric_matrices(
+    gate_name: str, angles: Sequence[float], precision="double"
+) -> np.ndarray:
+    """
+    Builds the matrices of a parametric gate for a whole batch of angles at once.
+
+    :param gate_name: Any spelling of Rx, Ry, Rz or Ph.
+    :param angles: The B angles, in radians.
+    :param precision: "double" or "single" (or the complex dtype) of the result.
+    :return: A new (B, 2, 2) complex array; entry b is the matrix for angles[b].
+    """
+    name = canonical_name(gate_name)
+    if name not in _BUILDERS:
+        raise ValueError(f"Gate {gate_name} is not parametric.")
+    matrices = _BUILDERS[name](np.asarray(angles, dtype=float).reshape(-1))
+    return matrices.astype(complex_dtype(precision), copy=False)
+
+
+def gate_matrix(
+    gate_name: str, params: Optional[Sequence[float]] = None, precision="double"
+) -> np.ndarray:
+    """
+    Looks up the read-only matrix of a gate. Fixed gates return a shared precomputed
+    array and parametric gates a memoized one, so repeated lookups do not allocate.
+
+    :param gate_name: Any supported spelling of the gate name.
+    :param params: The angle of a parametric gate, as a one-element sequence.
+    :param precision: "double" or "single" (or the complex dtype) of the matrix.
+    :return: The 2^k x 2^k gate matrix. It must not be modified.
+    """
+    name = canonical_name(gate_name)
+    dtype = complex_dtype(precision)
+    matrix = _FIXED_BY_DTYPE[dtype].get(name)
+    if matrix is not None:
+        return matrix
+    if not params:
+        raise ValueError(f"Gate {gate_name} requires an angle parameter.")
+    return _cached_parametric(name, float(params[0]), dtype)
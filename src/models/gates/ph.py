@@ -1,8 +1,11 @@
 import numpy as np
 from .gate import Gate
+from .matrices import ph_matrix
 
 
 class Ph(Gate):
+    __slots__ = ("delta",)
+
     def __init__(self, delta, qubits=None):
         """
         Initialize the Phase Shift (Ph) gate.
@@ -13,6 +16,13 @@ class Ph(Gate):
         super().__init__(name="Ph", qubits=qubits)
         self.delta = delta
 
+    @property
+    def matrix(self) -> np.ndarray:
+        """
+        The read-only matrix for the current angle, memoized by the registry.
+        """
+        return ph_matrix(self.delta)
+
     def apply(self, simulator_context, **kwargs):
         """
         Apply the Phase Shift gate using the provided simulator context.
@@ -1,8 +1,11 @@
 import numpy as np
 from .gate import Gate
+from .matrices import rx_matrix
 
 
 class Rx(Gate):
+    __slots__ = ("theta",)
+
     def __init__(self, theta, qubits=None):
         """
         Initialize the Rx gate (rotation around X-axis).
@@ -13,6 +16,13 @@ class Rx(Gate):
         super().__init__(name="Rx", qubits=qubits)
         self.theta = theta
 
+    @property
+    def matrix(self) -> np.ndarray:
+        """
+        The read-only matrix for the current angle, memoized by the registry.
+        """
+        return rx_matrix(self.theta)
+
     def apply(self, simulator_context, **kwargs):
         """
         Apply the Rx gate using the provided simulator context.
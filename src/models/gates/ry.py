@@ -1,8 +1,11 @@
 import numpy as np
 from .gate import Gate
+from .matrices import ry_matrix
 
 
 class Ry(Gate):
+    __slots__ = ("theta",)
+
     def __init__(self, theta, qubits=None):
         """
         Initialize the Ry gate (rotation around Y-axis).
@@ -13,6 +16,13 @@ class Ry(Gate):
         super().__init__(name="Ry", qubits=qubits)
         self.theta = theta
 
+    @property
+    def matrix(self) -> np.ndarray:
+        """
+        The read-only matrix for the current angle, memoized by the registry.
+        """
+        return ry_matrix(self.theta)
+
     def apply(self, simulator_context, **kwargs):
         """
         Apply the Ry gate using the provided simulator context.
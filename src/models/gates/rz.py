@@ -1,8 +1,11 @@
 import numpy as np
 from .gate import Gate
+from .matrices import rz_matrix
 
 
 class Rz(Gate):
+    __slots__ = ("theta",)
+
     def __init__(self, theta, qubits=None):
         """
         Initialize the Rz gate (rotation around Z-axis).
@@ -13,6 +16,13 @@ class Rz(Gate):
         super().__init__(name="Rz", qubits=qubits)
         self.theta = theta
 
+    @property
+    def matrix(self) -> np.ndarray:
+        """
+        The read-only matrix for the current angle, memoized by the registry.
+        """
+        return rz_matrix(self.theta)
+
     def apply(self, simulator_context, **kwargs):
         """
         Apply the Rz gate using the provided simulator context.
@@ -3,6 +3,8 @@ from .gate import Gate
 
 
 class S(Gate):
+    __slots__ = ()
+
     def __init__(self, qubits=None):
         """
         Initialize the S gate (a special phase gate).
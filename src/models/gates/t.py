@@ -3,6 +3,8 @@ from .gate import Gate
 
 
 class T(Gate):
+    __slots__ = ()
+
     def __init__(self, qubits=None):
         """
         Initialize the T gate (π/8 phase gate).
@@ -0,0 +1,41 @@
+import numpy as np
+from .gate import Gate
+
+
+class Unitary(Gate):
+    __slots__ = ("_matrix",)
+
+    def __init__(self, matrix, qubits=None):
+        """
+        Initialize a gate from an explicit unitary matrix, e.g. the product of several
+        fused gates.
+
+        :param matrix: The 2^k x 2^k matrix; qubits[0] is its most significant bit.
+        :param qubits: Indices of the k qubits this gate acts on.
+        """
+        super().__init__(name="Unitary", qubits=qubits)
+        matrix = np.array(matrix, dtype=complex)
+        if matrix.shape != (2 ** len(self.qubits),) * 2:
+            raise ValueError(
+                f"Unitary matrix of shape {matrix.shape} does not act on {len(self.qubits)} qubit(s)."
+            )
+        matrix.setflags(write=False)
+        self._matrix = matrix
+
+    @property
+    def matrix(self) -> np.ndarray:
+        """
+        The read-only matrix this gate was built from.
+        """
+        return self._matrix
+
+    def apply(self, simulator_context, **kwargs):
+        """
+        Apply the unitary using the provided simulator context.
+        The actual implementation is handled by the simulator.
+
+        :param simulator_context: The context of the simulator.
+        :param kwargs: Additional arguments specific to the simulator or gate.
+        :return: The modified simulator context.
+        """
+        pass
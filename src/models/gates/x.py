@@ -4,6 +4,8 @@ from .gate import Gate
 
 
 class X(Gate):
+    __slots__ = ()
+
     def __init__(self, qubits=None):
         """
         Initialize the Pauli-X gate.
@@ -1,9 +1,9 @@
-import numpy as np
-
 from .gate import Gate
 
 
 class Y(Gate):
+    __slots__ = ()
+
     def __init__(self, qubits):
         """
         Initialize the Y gate.
@@ -13,5 +13,14 @@ class Y(Gate):
         super().__init__(name="Y", qubits=qubits)
         if len(self.qubits) != 1:
             raise ValueError("Y gate acts on exactly one qubit.")
-        # The matrix representation of the Y gate
-        self.matrix = np.array([[0, -1j], [1j, 0]], dtype=complex)
+
+    def apply(self, simulator_context, **kwargs):
+        """
+        Apply the Y gate using the provided simulator context.
+        The actual implementation is handled by the simulator.
+
+        :param simulator_context: The context of the simulator.
+        :param kwargs: Additional arguments specific to the simulator or gate.
+        :return: The modified simulator context.
+        """
+        pass
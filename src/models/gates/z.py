@@ -1,8 +1,9 @@
-import numpy as np
 from .gate import Gate
 
 
 class Z(Gate):
+    __slots__ = ()
+
     def __init__(self, qubits):
         """
         Initialize the Z gate.
@@ -12,5 +13,14 @@ class Z(Gate):
         super().__init__(name="Z", qubits=qubits)
         if len(self.qubits) != 1:
             raise ValueError("Z gate acts on exactly one qubit.")
-        # The matrix representation of the Z gate
-        self.matrix = np.array([[1, 0], [0, -1]], dtype=complex)
+
+    def apply(self, simulator_context, **kwargs):
+        """
+        Apply the Z gate using the provided simulator context.
+        The actual implementation is handled by the simulator.
+
+        :param simulator_context: The context of the simulator.
+        :param kwargs: Additional arguments specific to the simulator or gate.
+        :return: The modified simulator context.
+        """
+        pass
@@ -0,0 +1,4 @@
+from ._fusion import fuse_gates
+from ._peephole import simplify_gates
+
+__all__ = ["fuse_gates", "simplify_gates"]
@@ -0,0 +1,142 @@
+import copy
+
+import numpy as np
+from typing import Dict, List, Optional
+
+from src.dtos import QuantumCircuit
+from src.dtos._compact_circuit import gate_angle
+from src.models.Parameter import ParameterExpression
+from src.models.gates import Unitary
+from src.models.gates.gate import Gate
+
+_SWAP = np.array(
+    [[1, 0, 0, 0], [0, 0, 1, 0], [0, 1, 0, 0], [0, 0, 0, 1]], dtype=complex
+)
+_IDENTITY = np.eye(2, dtype=complex)
+
+
+class _Block:
+    """A run of gates on one or two qubits that is being multiplied into one matrix."""
+
+    def __init__(self, qubits: List[int], matrix: np.ndarray, gate: Gate):
+        self.qubits = qubits
+        self.matrix = matrix
+        self.gates = [gate]
+
+    def absorb_single(self, qubit: int, matrix: np.ndarray, gate: Gate):
+        # Apply a 1-qubit gate after the block: (A on its position) @ block
+        if len(self.qubits) == 1:
+            self.matrix = matrix @ self.matrix
+        elif qubit == self.qubits[0]:
+            self.matrix = np.kron(matrix, _IDENTITY) @ self.matrix
+        else:
+            self.matrix = np.kron(_IDENTITY, matrix) @ self.matrix
+        self.gates.append(gate)
+
+    def absorb_pair(self, qubits: List[int], matrix: np.ndarray, gate: Gate):
+        # Apply a 2-qubit gate on the same pair after the block, in the block's order
+        if qubits != self.qubits:
+            matrix = _SWAP @ matrix @ _SWAP
+        self.matrix = matrix @ self.matrix
+        self.gates.append(gate)
+
+    def to_gate(self) -> Gate:
+        if len(self.gates) == 1:
+            return self.gates[0]
+        return Unitary(self.matrix, list(self.qubits))
+
+
+def fuse_gates(circuit: QuantumCircuit) -> QuantumCircuit:
+    """
+    Merges runs of gates into as few state sweeps as possible.
+
+    Consecutive single-qubit gates on the same wire become one 2x2 unitary. A 2-qubit
+    gate absorbs the pending single-qubit gates on both of its wires, any later
+    single-qubit gates on those wires, and later 2-qubit gates on the same pair, into
+    one 4x4 unitary. A block is closed as soon as another multi-qubit gate touches one
+    of its wires. Gates are only moved past gates on disjoint qubits, so the result is
+    equivalent to the input circuit.
+
+    Blocks made of a single original gate are emitted unchanged; merged blocks become
+    Unitary gates. Gates with unbound symbolic angles are left unfused and close the
+    blocks on their wires.
+
+    :param circuit: The circuit to optimize. It is not modified.
+    :return: A new QuantumCircuit with the fused gates.
+    """
+    fused = QuantumCircuit()
+    for qubit in circuit.qubits:
+        fused.add_qubit(qubit)
+
+    open_blocks: Dict[int, _Block] = {}
+    order: List[_Block] = []  # open blocks, in creation order
+
+    def close(block: Optional[_Block]):
+        if block is None or block not in order:
+            return
+        order.remove(block)
+        for qubit in block.qubits:
+            del open_blocks[qubit]
+        fused.append(block.to_gate())
+
+    def open_block(block: _Block):
+        for qubit in block.qubits:
+            open_blocks[qubit] = block
+        order.append(block)
+
+    for gate in circuit.gates:
+        qubits = list(gate.qubits)
+        angle = gate_angle(gate)
+        if isinstance(angle, ParameterExpression) and angle.parameters:
+            # No matrix until the angle is bound: keep the gate as it is
+            for qubit in qubits:
+                close(open_blocks.get(qubit))
+            fused.append(gate)
+            continue
+        matrix = gate.matrix
+        if matrix.shape == (2, 2):
+            # A single-qubit gate listed on several wires acts on each independently
+            for qubit in qubits:
+                single = gate
+                if len(qubits) > 1:
+                    single = copy.copy(gate)
+                    single.qubits = [qubit]
+                block = open_blocks.get(qubit)
+                if block is None:
+                    open_block(_Block([qubit], matrix, single))
+                else:
+                    block.absorb_single(qubit, matrix, single)
+        elif matrix.shape == (4, 4):
+            a, b = qubits
+            block = open_blocks.get(a)
+            if block is not None and block is open_blocks.get(b):
+                if len(block.qubits) == 2:
+                    block.absorb_pair(qubits, matrix, gate)
+                    continue
+            first, second = open_blocks.get(a), open_blocks.get(b)
+            for pending in (first, second):
+                if pending is not None and len(pending.qubits) == 2:
+                    close(pending)
+            first, second = open_blocks.get(a), open_blocks.get(b)
+            pair = _Block(qubits, matrix, gate)
+            if first is not None or second is not None:
+                left = first.matrix if first is not None else _IDENTITY
+                right = second.matrix if second is not None else _IDENTITY
+                pair.matrix = matrix @ np.kron(left, right)
+                pair.gates = (first.gates if first else []) + (
+                    second.gates if second else []
+                )
+                pair.gates.append(gate)
+                for pending in (first, second):
+                    if pending is not None:
+                        order.remove(pending)
+                        del open_blocks[pending.qubits[0]]
+            open_block(pair)
+        else:
+            for qubit in qubits:
+                close(open_blocks.get(qubit))
+            fused.append(gate)
+
+    for block in list(order):
+        close(block)
+    return fused
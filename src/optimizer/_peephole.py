@@ -0,0 +1,169 @@
+import copy
+import heapq
+import math
+from typing import Dict, List, Optional
+
+from src.dtos import QuantumCircuit
+from src.models.Parameter import ParameterExpression
+from src.models.gates.gate import Gate
+
+# Gates equal to their own inverse; CNOT pairs must also share control and target
+_SELF_INVERSE = {"H", "X", "Y", "Z", "CNOT", "CZ"}
+# Rotations whose angles add up when they follow each other on a qubit
+_ROTATIONS = {"Rx": "theta", "Ry": "theta", "Rz": "theta", "Ph": "delta"}
+# Period after which each rotation is exactly the identity
+_PERIODS = {"Rx": 4 * math.pi, "Ry": 4 * math.pi, "Rz": 4 * math.pi, "Ph": 2 * math.pi}
+# Single-qubit gates diagonal in the computational basis
+_DIAGONAL = {"I", "Z", "S", "T", "Rz", "Ph"}
+# Single-qubit gates diagonal in the X basis (commute with a CNOT target)
+_X_BASIS = {"X", "Rx"}
+
+
+def _is_negligible(gate: Gate, tolerance: float) -> bool:
+    if gate.name == "I":
+        return True
+    if gate.name in _ROTATIONS:
+        angle = getattr(gate, _ROTATIONS[gate.name])
+        if isinstance(angle, ParameterExpression) and angle.parameters:
+            # An unbound angle may take any value
+            return False
+        period = _PERIODS[gate.name]
+        angle = math.fmod(float(angle), period)
+        return min(abs(angle), period - abs(angle)) < tolerance
+    return False
+
+
+def _commutes(first: Gate, second: Gate) -> bool:
+    """Conservative check that two gates sharing at least one qubit commute."""
+    pair = {first.name, second.name}
+    if len(first.qubits) == 1 and len(second.qubits) == 1:
+        return first.name in _DIAGONAL and second.name in _DIAGONAL
+    if len(first.qubits) == 1 or len(second.qubits) == 1:
+        single, double = (first, second) if len(first.qubits) == 1 else (second, first)
+        if double.name == "CZ":
+            return single.name in _DIAGONAL
+        if double.name == "CNOT":
+            control, target = double.qubits
+            if single.qubits[0] == control:
+                return single.name in _DIAGONAL
+            return single.name in _X_BASIS
+        return False
+    if pair == {"CZ"}:
+        return True
+    if pair == {"CNOT"}:
+        # Commute unless one gate's target is the other's control
+        return (
+            first.qubits[1] != second.qubits[0] and first.qubits[0] != second.qubits[1]
+        )
+    if pair == {"CZ", "CNOT"}:
+        cnot, cz = (first, second) if first.name == "CNOT" else (second, first)
+        return cnot.qubits[1] not in cz.qubits
+    return False
+
+
+def _combine(previous: Gate, gate: Gate, tolerance: float):
+    """
+    Returns (True, replacement) when ``gate`` directly after ``previous`` simplifies to
+    ``replacement`` (None meaning both vanish), or (False, None) otherwise.
+    """
+    if previous.name != gate.name:
+        return False, None
+    if gate.name in _SELF_INVERSE:
+        if gate.name == "CZ":
+            same = set(previous.qubits) == set(gate.qubits)
+        else:
+            same = previous.qubits == gate.qubits
+        return (True, None) if same else (False, None)
+    if gate.name in _ROTATIONS and previous.qubits == gate.qubits:
+        attribute = _ROTATIONS[gate.name]
+        merged = copy.copy(previous)
+        # Symbolic angles add up as expressions; one whose parameters cancel is a
+        # plain number again
+        angle = getattr(previous, attribute) + getattr(gate, attribute)
+        if isinstance(angle, ParameterExpression) and not angle.parameters:
+            angle = float(angle)
+        setattr(merged, attribute, angle)
+        return True, (None if _is_negligible(merged, tolerance) else merged)
+    return False, None
+
+
+def simplify_gates(circuit: QuantumCircuit, tolerance: float = 1e-12) -> QuantumCircuit:
+    """
+    Algebraic peephole simplification of a circuit.
+
+    Identity gates and rotations by a multiple of their period are dropped. Pairs of
+    self-inverse gates (H, X, Y, Z, CNOT, CZ) cancel, and consecutive Rx/Ry/Rz/Ph
+    gates on a qubit merge into a single rotation. Each incoming gate is matched
+    against earlier gates on its qubits, looking past gates it commutes with:
+    diagonal gates move through CZ and CNOT controls, X-basis gates through CNOT
+    targets, and CZ/CNOT gates through each other where allowed. A cancellation can
+    therefore expose further ones (e.g. H X X H vanishes completely).
+
+    Rotations with symbolic (Parameter) angles merge into one rotation by the sum of
+    their angles, but are never dropped as negligible while a parameter is unbound.
+
+    :param circuit: The circuit to simplify. It is not modified.
+    :param tolerance: Rotations within this angle of the identity are removed.
+    :return: A new, equivalent QuantumCircuit.
+    """
+    gates: List[Optional[Gate]] = []
+    history: Dict[int, List[int]] = {}  # qubit -> indices into ``gates``
+
+    def earlier(qubits):
+        # Indices of surviving gates on any of ``qubits``, most recent first
+        seen = set()
+        lists = [reversed(history.get(q, [])) for q in qubits]
+        for index in heapq.merge(*lists, reverse=True):
+            if index not in seen and gates[index] is not None:
+                seen.add(index)
+                yield index
+
+    def forget(index, qubits):
+        # Removed gates are usually the latest on their wires, so search from the end
+        for qubit in qubits:
+            indices = history[qubit]
+            position = len(indices) - 1
+            while indices[position] != index:
+                position -= 1
+            del indices[position]
+
+    def push(gate: Gate):
+        for index in earlier(gate.qubits):
+            previous = gates[index]
+            combined, replacement = _combine(previous, gate, tolerance)
+            if combined:
+                gates[index] = replacement
+                if replacement is None:
+                    forget(index, previous.qubits)
+                return
+            if not _commutes(previous, gate):
+                break
+        for qubit in gate.qubits:
+            history.setdefault(qubit, []).append(len(gates))
+        gates.append(gate)
+
+    for gate in circuit.gates:
+        # Rotations are single-qubit gates; checking by name avoids building the
+        # matrix of an unbound symbolic angle
+        if len(gate.qubits) > 1 and (
+            gate.name in _ROTATIONS or gate.matrix.shape == (2, 2)
+        ):
+            # A single-qubit gate listed on several wires acts on each independently
+            singles = []
+            for qubit in gate.qubits:
+                single = copy.copy(gate)
+                single.qubits = [qubit]
+                singles.append(single)
+        else:
+            singles = [gate]
+        for single in singles:
+            if not _is_negligible(single, tolerance):
+                push(single)
+
+    simplified = QuantumCircuit()
+    for qubit in circuit.qubits:
+        simplified.add_qubit(qubit)
+    for gate in gates:
+        if gate is not None:
+            simplified.append(gate)
+    return simplified
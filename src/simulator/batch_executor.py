@@ -0,0 +1,215 @@
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Union
+
+import numpy as np
+from src.dtos._compact_circuit import gate_angle
+from src.models.Parameter import ParameterExpression
+from src.models.PauliSum import PauliSum
+from src.models.gates.matrices import (
+    canonical_name,
+    complex_dtype,
+    parametric_matrices,
+)
+from src.simulator.kernels import (
+    apply_diagonal,
+    apply_diagonal_batch,
+    apply_matrix,
+    apply_matrix_batch,
+)
+from src.simulator.sampling import sample_counts
+
+# Size of the states simulated together; batches are run in chunks of this size so the
+# working set stays in cache (one state per chunk if a single state is larger)
+BATCH_CHUNK_BYTES = 1 << 22
+
+
+class BatchExecutor:
+    """
+    Runs one parameterized circuit for a whole batch of B parameter sets at once.
+
+    The B states are stacked as a B x 2^n array and every gate is applied to the whole
+    batch in one vectorized operation: fixed gates share their matrix across the batch,
+    and gates with symbolic angles get B matrices built in one call to
+    ``parametric_matrices``. Like StateVectorSimulator, results are written into a
+    second preallocated buffer that is swapped with the state, and diagonal gates are
+    applied in place.
+
+    The circuit is compiled once, so it can be swept repeatedly at no extra cost.
+    """
+
+    def __init__(
+        self,
+        circuit: Any,
+        num_qubits: Optional[int] = None,
+        precision: str = "double",
+        renormalize: bool = False,
+    ):
+        """
+        Args:
+            circuit: A QuantumCircuit, possibly with Parameter angles.
+            num_qubits (int, optional): Defaults to one past the highest qubit used.
+            precision (str, optional): "double" (complex128) or "single" (complex64)
+                states; fixed matrices are rounded once here, swept ones when built.
+            renormalize (bool, optional): Rescale every final state to unit norm.
+        """
+        if num_qubits is None:
+            num_qubits = max(circuit.qubits) + 1 if len(circuit.qubits) else 0
+        self.num_qubits = num_qubits
+        self.dtype = complex_dtype(precision)
+        self.renormalize = renormalize
+        self.parameters = circuit.parameters
+        # (matrix or None, diagonal or None, expression or None, gate name, qubits)
+        self._operations = []
+        for gate in circuit.gates:
+            if any(q >= num_qubits or q < 0 for q in gate.qubits):
+                raise ValueError(
+                    f"Invalid qubit indices {gate.qubits} for a system with {num_qubits} qubits."
+                )
+            angle = gate_angle(gate)
+            if isinstance(angle, ParameterExpression):
+                name = canonical_name(gate.name)
+                for qubit in gate.qubits:
+                    self._operations.append((None, None, angle, name, [qubit]))
+                continue
+            matrix = gate.matrix.astype(self.dtype, copy=False)
+            if matrix.shape == (2, 2) and len(gate.qubits) > 1:
+                groups = [[q] for q in gate.qubits]
+            else:
+                groups = [list(gate.qubits)]
+            diagonal = np.diagonal(matrix)
+            if np.count_nonzero(matrix) != np.count_nonzero(diagonal):
+                diagonal = None
+            for group in groups:
+                self._operations.append((matrix, diagonal, None, gate.name, group))
+
+    def _batch_values(
+        self, values: Union[Mapping[Any, Sequence[float]], np.ndarray]
+    ) -> Dict[str, np.ndarray]:
+        # Accepts {parameter or name: B values} or a B x P array whose columns follow
+        # self.parameters
+        if isinstance(values, Mapping):
+            batch = {
+                getattr(k, "name", k): np.asarray(v, dtype=float).reshape(-1)
+                for k, v in values.items()
+            }
+        else:
+            array = np.asarray(values, dtype=float)
+            if array.ndim == 1:
+                array = array.reshape(-1, 1)
+            if array.shape[1] != len(self.parameters):
+                raise ValueError(
+                    f"Expected {len(self.parameters)} columns for parameters {self.parameters}, got {array.shape[1]}."
+                )
+            batch = {name: array[:, i] for i, name in enumerate(self.parameters)}
+        missing = [name for name in self.parameters if name not in batch]
+        if missing:
+            raise ValueError(f"No values given for parameters {missing}.")
+        sizes = {len(v) for v in batch.values()}
+        if len(sizes) > 1:
+            raise ValueError(f"Parameter value arrays have different lengths {sizes}.")
+        return batch
+
+    def states(
+        self, values: Union[Mapping[Any, Sequence[float]], np.ndarray]
+    ) -> np.ndarray:
+        """
+        Simulates the circuit from |0...0> for every parameter set.
+
+        Args:
+            values: B values per parameter, as a mapping keyed by Parameter or name,
+                or a B x P array with columns in the order of ``self.parameters``.
+
+        Returns:
+            numpy.ndarray: The B x 2^n final states; row b belongs to parameter set b.
+        """
+        values = self._batch_values(values)
+        batch = len(next(iter(values.values()))) if values else 1
+        chunk = max(1, BATCH_CHUNK_BYTES // (self.dtype.itemsize << self.num_qubits))
+        if batch <= chunk:
+            return self._run_chunk(values, batch)
+        states = np.empty((batch, 1 << self.num_qubits), dtype=self.dtype)
+        for start in range(0, batch, chunk):
+            stop = min(start + chunk, batch)
+            part = {name: v[start:stop] for name, v in values.items()}
+            states[start:stop] = self._run_chunk(part, stop - start)
+        return states
+
+    def _run_chunk(self, values: Dict[str, np.ndarray], batch: int) -> np.ndarray:
+        n = self.num_qubits
+        state = np.zeros((batch, 1 << n), dtype=self.dtype)
+        state[:, 0] = 1.0
+        scratch = np.empty_like(state)
+        # Matrices of repeated expressions (e.g. one angle shared by a layer) are built once
+        matrices_for = {}
+        for matrix, diagonal, expression, name, qubits in self._operations:
+            if expression is not None:
+                key = (name, id(expression))
+                matrices = matrices_for.get(key)
+                if matrices is None:
+                    matrices = parametric_matrices(
+                        name, expression.evaluate(values), self.dtype
+                    )
+                    matrices_for[key] = matrices
+                if name in ("Rz", "Ph"):
+                    apply_diagonal_batch(
+                        state, np.diagonal(matrices, axis1=1, axis2=2), qubits[0], n
+                    )
+                    continue
+                apply_matrix_batch(state, matrices, qubits[0], n, out=scratch)
+            elif diagonal is not None:
+                apply_diagonal(state, diagonal, qubits, n, batch=batch)
+                continue
+            else:
+                apply_matrix(
+                    state,
+                    matrix,
+                    qubits,
+                    n,
+                    out=scratch,
+                    overwrite_input=True,
+                    batch=batch,
+                )
+            state, scratch = scratch, state
+        if self.renormalize:
+            state /= np.linalg.norm(state, axis=1, keepdims=True)
+        return state
+
+    def probabilities(
+        self, values: Union[Mapping[Any, Sequence[float]], np.ndarray]
+    ) -> np.ndarray:
+        """The B x 2^n measurement probabilities of every parameter set."""
+        return np.abs(self.states(values)) ** 2
+
+    def expectation_values(
+        self,
+        values: Union[Mapping[Any, Sequence[float]], np.ndarray],
+        observables: Sequence[Union[np.ndarray, PauliSum]],
+    ) -> np.ndarray:
+        """
+        Computes <psi_b|O|psi_b> for every parameter set b and observable O.
+
+        Returns:
+            numpy.ndarray: A B x len(observables) array.
+        """
+        states = self.states(values)
+        result = np.empty((states.shape[0], len(observables)))
+        for i, observable in enumerate(observables):
+            if isinstance(observable, PauliSum):
+                result[:, i] = [observable.expectation_value(s) for s in states]
+                continue
+            # One GEMM for the whole batch: (O psi_b)^T stacked as rows
+            transformed = states @ np.asarray(observable).T
+            result[:, i] = np.real(np.einsum("bi,bi->b", states.conj(), transformed))
+        return result
+
+    def run(
+        self,
+        values: Union[Mapping[Any, Sequence[float]], np.ndarray],
+        shots: int = 1024,
+        rng: Optional[np.random.Generator] = None,
+    ) -> List[Dict[str, int]]:
+        """Samples ``shots`` measurements for every parameter set."""
+        rng = rng if rng is not None else np.random.default_rng()
+        return [
+            sample_counts(p, shots, self.num_qubits, rng)
+            for p in self.probabilities(values)
+        ]
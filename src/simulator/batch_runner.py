@@ -0,0 +1,324 @@
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from multiprocessing import resource_tracker, shared_memory
+from typing import Any, Dict, Iterable, Iterator, Optional, Sequence
+
+import numpy as np
+from src.loader import Loader
+from src.loader._ir import decode_ir, encode_ir
+from src.simulator.sampling import sample_counts
+from src.simulator.sv_simulator import StateVectorSimulator
+
+# Results a job can return; arrays are 2^n long
+OUTPUTS = ("counts", "probabilities", "state_vector")
+
+# Arrays at least this large come back through a shared-memory segment instead of
+# being pickled through the result pipe (below it the segment costs more)
+SHARED_MEMORY_MIN_BYTES = 1 << 16
+
+# Jobs queued per worker process: enough to keep workers busy, few enough that a
+# huge batch is not encoded (and its results held) all at once
+JOBS_PER_WORKER = 4
+
+# On Windows a segment disappears with its last handle, i.e. when the worker closes
+# it; results are pickled there instead
+_USE_SHARED_MEMORY = os.name != "nt"
+
+
+class JobResult:
+    """
+    Outcome of one circuit of a batch run.
+
+    Attributes:
+        index (int): Position of the circuit in the submitted batch.
+        source (str | None): The QASM path the circuit was loaded from, if any.
+        num_qubits (int): Qubits simulated (highest qubit + 1).
+        counts (dict | None): Measurement counts, if requested.
+        probabilities (numpy.ndarray | None): The 2^n outcome probabilities.
+        state_vector (numpy.ndarray | None): The final 2^n amplitudes.
+        error (BaseException | None): Why the job failed (a TimeoutError when it ran
+            out of time), or None.
+        elapsed (float): Seconds the job ran in its worker.
+    """
+
+    def __init__(
+        self,
+        index: int,
+        source: Optional[str] = None,
+        num_qubits: int = 0,
+        counts: Optional[Dict[str, int]] = None,
+        probabilities: Optional[np.ndarray] = None,
+        state_vector: Optional[np.ndarray] = None,
+        error: Optional[BaseException] = None,
+        elapsed: float = 0.0,
+    ):
+        self.index = index
+        self.source = source
+        self.num_qubits = num_qubits
+        self.counts = counts
+        self.probabilities = probabilities
+        self.state_vector = state_vector
+        self.error = error
+        self.elapsed = elapsed
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+    def __repr__(self):
+        status = "ok" if self.ok else f"error={self.error!r}"
+        return (
+            f"JobResult(index={self.index}, num_qubits={self.num_qubits}, "
+            f"{status}, elapsed={self.elapsed:.3f}s)"
+        )
+
+
+class _SharedArray:
+    # Name, shape and dtype of an array left in a shared-memory segment by a worker
+    def __init__(self, name: str, shape, dtype: str):
+        self.name = name
+        self.shape = shape
+        self.dtype = dtype
+
+
+class _TimedCircuit:
+    # Circuit wrapper whose gate iterator gives up once the job's time is spent. The
+    # simulators iterate ``circuit.gates``, so the check runs between gates.
+    def __init__(self, circuit: Any, timeout: Optional[float]):
+        self.circuit = circuit
+        self.qubits = circuit.qubits
+        self.timeout = timeout
+        self.deadline = None if timeout is None else time.monotonic() + timeout
+
+    @property
+    def gates(self):
+        for gate in self.circuit.gates:
+            self.check()
+            yield gate
+
+    def check(self):
+        if self.deadline is not None and time.monotonic() > self.deadline:
+            raise TimeoutError(f"Job exceeded its timeout of {self.timeout} s.")
+
+
+def _share(array: np.ndarray):
+    # Copies a large array into a new segment the parent will read and unlink
+    if not _USE_SHARED_MEMORY or array.nbytes < SHARED_MEMORY_MIN_BYTES:
+        return array
+    segment = shared_memory.SharedMemory(create=True, size=array.nbytes)
+    view = np.ndarray(array.shape, array.dtype, buffer=segment.buf)
+    view[...] = array
+    del view
+    shared = _SharedArray(segment.name, array.shape, array.dtype.str)
+    # The parent owns the segment now: keep this worker's resource tracker from
+    # unlinking it when the worker exits
+    resource_tracker.unregister(segment._name, "shared_memory")
+    segment.close()
+    return shared
+
+
+def _receive(value: Any) -> Any:
+    # Copies a shared array out of its segment and frees the segment
+    if not isinstance(value, _SharedArray):
+        return value
+    segment = shared_memory.SharedMemory(name=value.name)
+    try:
+        view = np.ndarray(value.shape, np.dtype(value.dtype), buffer=segment.buf)
+        array = view.copy()
+        del view
+    finally:
+        segment.close()
+        segment.unlink()
+    return array
+
+
+def _run_job(
+    payload: Any,
+    shots: int,
+    outputs: Sequence[str],
+    precision: str,
+    timeout: Optional[float],
+    seed: np.random.SeedSequence,
+    share: bool,
+) -> Dict[str, Any]:
+    # Runs in a worker: decode (or parse) the circuit, simulate, and return the
+    # requested outputs, large arrays through shared memory
+    start = time.perf_counter()
+    if isinstance(payload, str):
+        circuit = Loader.load_qasm2(payload, compact=True)
+    else:
+        circuit = decode_ir(payload)
+    num_qubits = max(circuit.qubits) + 1 if len(circuit.qubits) else 0
+    rng = np.random.default_rng(seed)
+    timed = _TimedCircuit(circuit, timeout)
+    simulator = StateVectorSimulator(num_qubits, rng=rng, precision=precision)
+    simulator.apply_circuit(timed)
+    timed.check()
+
+    result: Dict[str, Any] = {"num_qubits": num_qubits}
+    probabilities = None
+    if "counts" in outputs or "probabilities" in outputs:
+        probabilities = simulator.get_probabilities()
+    if "counts" in outputs:
+        result["counts"] = sample_counts(probabilities, shots, num_qubits, rng)
+    if "probabilities" in outputs:
+        result["probabilities"] = _share(probabilities) if share else probabilities
+    if "state_vector" in outputs:
+        state = simulator.state_vector
+        result["state_vector"] = _share(state) if share else state
+    result["elapsed"] = time.perf_counter() - start
+    return result
+
+
+def _result(index: int, source: Optional[str], future: Any) -> JobResult:
+    try:
+        values = future.result()
+    except Exception as error:
+        return JobResult(index, source, error=error)
+    return JobResult(
+        index,
+        source,
+        num_qubits=values["num_qubits"],
+        counts=values.get("counts"),
+        probabilities=_receive(values.get("probabilities")),
+        state_vector=_receive(values.get("state_vector")),
+        elapsed=values["elapsed"],
+    )
+
+
+def _release(future: Any):
+    # Frees the segments of a result that will never be consumed
+    if future.cancelled() or future.exception() is not None:
+        return
+    for value in future.result().values():
+        if isinstance(value, _SharedArray):
+            _receive(value)
+
+
+class _Done:
+    # Future-like holder for jobs run in the calling process
+    def __init__(self, function, *args):
+        try:
+            self._value, self._error = function(*args), None
+        except Exception as error:
+            self._value, self._error = None, error
+
+    def result(self):
+        if self._error is not None:
+            raise self._error
+        return self._value
+
+
+def run_batch(
+    circuits: Iterable[Any],
+    shots: int = 1024,
+    outputs: Sequence[str] = ("counts",),
+    timeout: Optional[float] = None,
+    max_workers: Optional[int] = None,
+    precision: str = "double",
+    seed: Optional[int] = None,
+) -> Iterator[JobResult]:
+    """
+    Simulates many circuits on a pool of worker processes and yields each result as
+    soon as its job finishes (completion order; ``JobResult.index`` gives the
+    position in ``circuits``).
+
+    Circuits are sent to the workers as binary IR bytes (QASM paths are sent as-is
+    and parsed by the worker). Arrays of at least SHARED_MEMORY_MIN_BYTES come back
+    through ``multiprocessing.shared_memory`` segments rather than being pickled; the
+    parent copies each one out once and frees the segment. At most JOBS_PER_WORKER
+    jobs per worker are in flight, so ``circuits`` may be a lazy iterable.
+
+    A failing job does not stop the batch: its result carries the exception. This
+    includes circuits that cannot be encoded (e.g. with unbound parameters).
+
+    Args:
+        circuits (Iterable): QuantumCircuits, CompactCircuits or QASM2 file paths.
+        shots (int, optional): Shots sampled for the counts. Defaults to 1024.
+        outputs (Sequence[str], optional): Any of OUTPUTS. Defaults to counts only.
+        timeout (float, optional): Seconds each job may run in its worker, checked
+            between gates; a job over time fails with TimeoutError and frees its
+            worker. Defaults to no limit.
+        max_workers (int, optional): Worker processes; 1 runs in this process.
+            Defaults to ``os.cpu_count()``.
+        precision (str, optional): "double" or "single" amplitudes.
+        seed (int, optional): Root seed; job i samples from the i-th spawned stream,
+            so counts do not depend on scheduling.
+
+    Yields:
+        JobResult: One per circuit, as each job finishes.
+    """
+    outputs = tuple(outputs)
+    unknown = [name for name in outputs if name not in OUTPUTS]
+    if unknown:
+        raise ValueError(f"Unknown outputs {unknown}; choose from {list(OUTPUTS)}.")
+    if timeout is not None and timeout <= 0:
+        raise ValueError(f"timeout must be positive, got {timeout}.")
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    root = np.random.SeedSequence(seed)
+
+    def jobs():
+        # Yields (index, source, payload, seed), or a failed JobResult for a circuit
+        # that cannot be encoded (e.g. with unbound parameters)
+        for index, circuit in enumerate(circuits):
+            job_seed = root.spawn(1)[0]
+            if isinstance(circuit, (str, os.PathLike)):
+                source = os.fspath(circuit)
+                payload = source
+            else:
+                source = None
+                try:
+                    payload = encode_ir(circuit)
+                except Exception as error:
+                    yield JobResult(index, source, error=error)
+                    continue
+            yield index, source, payload, job_seed
+
+    if max_workers == 1:
+        for job in jobs():
+            if isinstance(job, JobResult):
+                yield job
+                continue
+            index, source, payload, job_seed = job
+            done = _Done(
+                _run_job, payload, shots, outputs, precision, timeout, job_seed, False
+            )
+            yield _result(index, source, done)
+        return
+
+    pending = {}
+    queue = jobs()
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        try:
+            for job in queue:
+                if isinstance(job, JobResult):
+                    yield job
+                    continue
+                index, source, payload, job_seed = job
+                future = executor.submit(
+                    _run_job,
+                    payload,
+                    shots,
+                    outputs,
+                    precision,
+                    timeout,
+                    job_seed,
+                    _USE_SHARED_MEMORY,
+                )
+                pending[future] = (index, source)
+                while len(pending) >= max_workers * JOBS_PER_WORKER:
+                    finished, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in finished:
+                        yield _result(*pending.pop(future), future)
+            while pending:
+                finished, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    yield _result(*pending.pop(future), future)
+        finally:
+            # Stopped early (or failed): drop queued jobs and free the segments of
+            # jobs that still finish
+            for future in pending:
+                future.cancel()
+                future.add_done_callback(_release)
@@ -0,0 +1,313 @@
+import numpy as np
+from typing import Any, Dict, Optional, Sequence
+from src.models.gates.matrices import PRECISIONS, canonical_name, complex_dtype
+from src.simulator.dm_simulator import DensityMatrixSimulator
+from src.simulator.memory import (
+    available_memory,
+    density_matrix_bytes,
+    format_bytes,
+    mps_bytes,
+    stabilizer_bytes,
+    statevector_bytes,
+)
+from src.simulator.mps_simulator import MPSSimulator
+from src.simulator.qestkit_simulator import QuantumSimulator
+from src.simulator.stabilizer_simulator import CLIFFORD_GATES, StabilizerSimulator
+from src.simulator.sv_simulator import StateVectorSimulator
+
+# Backends the planner chooses from; on equal estimates the earlier one wins
+BACKENDS = ("stabilizer", "statevector", "mps", "density_matrix")
+
+
+def is_clifford(circuit: Any) -> bool:
+    """
+    Whether every gate of the circuit is one the tableau simulator applies
+    (I, X, Y, Z, H, S, CNOT, CZ, in any supported spelling).
+    """
+    for gate in circuit.gates:
+        try:
+            name = canonical_name(gate.name)
+        except ValueError:
+            return False
+        if name not in CLIFFORD_GATES:
+            return False
+    return True
+
+
+def _max_gate_qubits(circuit: Any) -> int:
+    # Widest gate (a 2x2 matrix on several targets is broadcast)
+    width = 0
+    for gate in circuit.gates:
+        try:
+            width = max(width, gate.matrix.shape[0].bit_length() - 1)
+        except TypeError:
+            # An unbound symbolic angle: parametric gates act on one qubit
+            width = max(width, 1)
+    return width
+
+
+class SimulationPlan:
+    """
+    Backend choice and peak-memory estimate for one circuit, made before anything is
+    allocated. Schedulers can read ``peak_bytes`` (or ``to_dict()``) to pack jobs onto
+    nodes; ``create_simulator`` then builds the chosen backend.
+
+    With a noise model only the density matrix is planned: the state-vector and MPS
+    backends would sample every shot of ``run`` from a single noise trajectory. To
+    average pure-state trajectories instead, use ``run_trajectories``.
+
+    Attributes:
+        backend (str): The chosen backend, one of BACKENDS.
+        num_qubits (int): Register size.
+        precision (str): "double" or "single".
+        shots (int): Shots the estimates include.
+        noisy (bool): Whether a noise model is attached.
+        clifford (bool): Whether the circuit is pure Clifford.
+        max_bond_dimension (int | None): Bond cap assumed for the MPS estimate.
+        memory_budget (int | None): The budget the plan was made for (None: unlimited).
+        estimates (dict): Estimated peak bytes of every backend able to run the
+            circuit, whether or not it fits the budget.
+        peak_bytes (int): Estimated peak bytes of the chosen backend.
+    """
+
+    def __init__(
+        self,
+        backend: str,
+        num_qubits: int,
+        precision: str,
+        shots: int,
+        noisy: bool,
+        clifford: bool,
+        max_bond_dimension: Optional[int],
+        memory_budget: Optional[int],
+        estimates: Dict[str, int],
+        noise_model: Any = None,
+    ):
+        self.backend = backend
+        self.num_qubits = num_qubits
+        self.precision = precision
+        self.shots = shots
+        self.noisy = noisy
+        self.clifford = clifford
+        self.max_bond_dimension = max_bond_dimension
+        self.memory_budget = memory_budget
+        self.estimates = estimates
+        self.peak_bytes = estimates[backend]
+        self._noise_model = noise_model
+
+    def create_simulator(
+        self, rng: Optional[np.random.Generator] = None
+    ) -> QuantumSimulator:
+        """Builds the chosen backend, sized and configured as planned."""
+        if self.backend == "stabilizer":
+            return StabilizerSimulator(self.num_qubits, rng=rng)
+        if self.backend == "statevector":
+            return StateVectorSimulator(
+                self.num_qubits, rng=rng, precision=self.precision
+            )
+        if self.backend == "mps":
+            return MPSSimulator(
+                self.num_qubits,
+                max_bond_dimension=self.max_bond_dimension,
+                rng=rng,
+                precision=self.precision,
+            )
+        return DensityMatrixSimulator(
+            self.num_qubits,
+            rng=rng,
+            noise_model=self._noise_model,
+            precision=self.precision,
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """The plan as plain values (no noise model), e.g. for a job scheduler."""
+        return {
+            "backend": self.backend,
+            "num_qubits": self.num_qubits,
+            "precision": self.precision,
+            "shots": self.shots,
+            "noisy": self.noisy,
+            "clifford": self.clifford,
+            "max_bond_dimension": self.max_bond_dimension,
+            "memory_budget": self.memory_budget,
+            "estimates": dict(self.estimates),
+            "peak_bytes": self.peak_bytes,
+        }
+
+    def __repr__(self):
+        return (
+            f"SimulationPlan(backend={self.backend}, num_qubits={self.num_qubits}, "
+            f"precision={self.precision}, peak={format_bytes(self.peak_bytes)}, "
+            f"budget={'unlimited' if self.memory_budget is None else format_bytes(self.memory_budget)})"
+        )
+
+
+def estimate_memory(
+    circuit: Any,
+    noise_model: Any = None,
+    precision: str = "double",
+    shots: int = 1024,
+    max_bond_dimension: Optional[int] = None,
+    num_qubits: Optional[int] = None,
+) -> Dict[str, int]:
+    """
+    Estimates the peak bytes of running the circuit (and sampling ``shots``) on every
+    backend that supports it: the stabilizer tableau only for Clifford circuits, MPS
+    only for gates on at most two qubits. With a noise model only the density matrix
+    applies, as the other backends' ``run`` samples a single noise trajectory rather
+    than the noisy distribution. Estimates are upper bounds: every bond of the MPS
+    reaches its largest possible (or capped) dimension and every sampled shot may be
+    a distinct outcome.
+
+    Returns:
+        dict: Backend name to estimated peak bytes, for the applicable backends.
+    """
+    if num_qubits is None:
+        num_qubits = max(circuit.qubits) + 1 if len(circuit.qubits) else 0
+    noisy = noise_model is not None
+    estimates = {}
+    if not noisy:
+        if is_clifford(circuit):
+            estimates["stabilizer"] = stabilizer_bytes(num_qubits, shots)
+        estimates["statevector"] = statevector_bytes(num_qubits, precision, shots)
+        if _max_gate_qubits(circuit) <= 2:
+            estimates["mps"] = mps_bytes(
+                num_qubits, precision, shots, max_bond_dimension
+            )
+    estimates["density_matrix"] = density_matrix_bytes(
+        num_qubits, precision, shots, noisy
+    )
+    return estimates
+
+
+def plan_simulation(
+    circuit: Any,
+    memory_budget: Optional[int] = None,
+    noise_model: Any = None,
+    precision: str = "double",
+    shots: int = 1024,
+    max_bond_dimension: Optional[int] = None,
+    backends: Optional[Sequence[str]] = None,
+    num_qubits: Optional[int] = None,
+) -> SimulationPlan:
+    """
+    Picks the backend with the smallest estimated peak memory that fits the budget,
+    without allocating anything.
+
+    Args:
+        circuit (QuantumCircuit): The circuit to plan for.
+        memory_budget (int, optional): Bytes the run may use. Defaults to the memory
+            currently available to the process (unlimited if it cannot be read).
+        noise_model (NoiseModel, optional): Channels following the gates; restricts
+            the plan to the density matrix.
+        precision (str, optional): "double" or "single" amplitudes.
+        shots (int, optional): Shots sampled at the end. Defaults to 1024.
+        max_bond_dimension (int, optional): Bond cap for the MPS backend (truncating).
+        backends (Sequence[str], optional): Backends to consider. Defaults to BACKENDS.
+        num_qubits (int, optional): Register size; defaults to the highest qubit + 1.
+
+    Returns:
+        SimulationPlan: The chosen backend and the estimates behind the choice.
+
+    Raises:
+        ValueError: If none of ``backends`` applies (e.g. only "statevector" with a
+            noise model).
+        MemoryError: If no backend fits, listing every estimate against the budget.
+    """
+    if num_qubits is None:
+        num_qubits = max(circuit.qubits) + 1 if len(circuit.qubits) else 0
+    dtype = complex_dtype(precision)
+    precision = next(name for name, value in PRECISIONS.items() if value == dtype)
+    backends = BACKENDS if backends is None else tuple(backends)
+    unknown = [name for name in backends if name not in BACKENDS]
+    if unknown:
+        raise ValueError(f"Unknown backends {unknown}; choose from {list(BACKENDS)}.")
+    if memory_budget is None:
+        memory_budget = available_memory()
+
+    estimates = estimate_memory(
+        circuit, noise_model, precision, shots, max_bond_dimension, num_qubits
+    )
+    applicable = [name for name in backends if name in estimates]
+    if not applicable:
+        raise ValueError(
+            f"None of the backends {list(backends)} can run this circuit exactly; "
+            f"applicable: {list(estimates)}."
+        )
+    candidates = [
+        (estimates[name], BACKENDS.index(name), name)
+        for name in applicable
+        if memory_budget is None or estimates[name] <= memory_budget
+    ]
+    if not candidates:
+        considered = ", ".join(
+            f"{name} {format_bytes(estimates[name])}" for name in applicable
+        )
+        raise MemoryError(
+            f"No backend fits {num_qubits} qubits in {format_bytes(memory_budget)}"
+            f" (estimated peaks: {considered})."
+        )
+    backend = min(candidates)[2]
+    return SimulationPlan(
+        backend,
+        num_qubits,
+        precision,
+        shots,
+        noise_model is not None,
+        "stabilizer" in estimates,
+        max_bond_dimension,
+        memory_budget,
+        estimates,
+        noise_model,
+    )
+
+
+def select_simulator(
+    circuit: Any,
+    num_qubits: Optional[int] = None,
+    rng: Optional[np.random.Generator] = None,
+    precision: str = "double",
+    memory_budget: Optional[int] = None,
+) -> QuantumSimulator:
+    """
+    Picks a backend for the circuit: pure-Clifford circuits go to the stabilizer
+    tableau (polynomial in the number of qubits), everything else to the state
+    vector. Fails before allocating if that does not fit the memory budget.
+
+    Args:
+        circuit (QuantumCircuit): The circuit to inspect.
+        num_qubits (int, optional): Register size; defaults to the highest qubit + 1.
+        rng (np.random.Generator, optional): Random generator for sampling.
+        precision (str, optional): Amplitude precision of the state vector; the
+            tableau holds exact bits and ignores it.
+        memory_budget (int, optional): Bytes available; defaults to the free memory.
+
+    Returns:
+        QuantumSimulator: A fresh simulator sized for the circuit.
+    """
+    plan = plan_simulation(
+        circuit,
+        memory_budget,
+        precision=precision,
+        backends=("stabilizer",) if is_clifford(circuit) else ("statevector",),
+        num_qubits=num_qubits,
+    )
+    return plan.create_simulator(rng)
+
+
+def run(
+    circuit: Any,
+    shots: int = 1024,
+    num_qubits: Optional[int] = None,
+    rng: Optional[np.random.Generator] = None,
+    precision: str = "double",
+    memory_budget: Optional[int] = None,
+) -> Dict[str, int]:
+    """
+    Runs the circuit on the backend chosen by select_simulator.
+
+    Returns:
+        dict: Measurement counts of every qubit (qubit 0 rightmost).
+    """
+    simulator = select_simulator(circuit, num_qubits, rng, precision, memory_budget)
+    return simulator.run(circuit, shots, rng)
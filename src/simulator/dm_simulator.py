@@ -1,21 +1,61 @@
 import numpy as np
 from typing import List, Dict, Union, Optional
-from qestkit_simulator import QuantumSimulator
+from src.models.PauliSum import PauliSum
+from src.models.gates.matrices import complex_dtype, gate_matrix
+from src.simulator.qestkit_simulator import QuantumSimulator
+from src.simulator.kernels import (
+    PARALLEL_THRESHOLD,
+    apply_matrix_density,
+    apply_superoperator,
+    controlled_matrix,
+)
+from src.simulator.memory import check_allocation, density_matrix_bytes
+from src.simulator.sampling import sample_counts
 from typing import Any
 
 
 class DensityMatrixSimulator(QuantumSimulator):
-    def __init__(self, num_qubits: int):
+    def __init__(
+        self,
+        num_qubits: int,
+        rng: Optional[np.random.Generator] = None,
+        noise_model: Optional[Any] = None,
+        precision: str = "double",
+        renormalize: bool = False,
+        num_threads: int = 1,
+        parallel_threshold: int = PARALLEL_THRESHOLD,
+    ):
+        if num_threads < 1:
+            raise ValueError(f"num_threads must be at least 1, got {num_threads}.")
         self.num_qubits = num_qubits
-        self.density_matrix = np.zeros((2**num_qubits, 2**num_qubits), dtype=complex)
-        self.reset()
+        self.rng = rng if rng is not None else np.random.default_rng()
+        # Optional NoiseModel whose channels follow the gates of apply_circuit/run
+        self.noise_model = noise_model
+        # complex64 ("single") or complex128 ("double") entries; gates, channels and
+        # fused superoperators are rounded to it rather than upcasting rho
+        self.dtype = complex_dtype(precision)
+        # Rescale rho to unit trace after each circuit (rounding drift)
+        self.renormalize = renormalize
+        # Gates and channels split rho into blocks along its untouched row/column
+        # axes, run on num_threads workers once rho has parallel_threshold entries
+        self.num_threads = num_threads
+        self._threads = num_threads if 4**num_qubits >= parallel_threshold else 1
+        # Refuse up front rather than be OOM-killed once the 4^n pages are touched
+        check_allocation(
+            density_matrix_bytes(num_qubits, self.dtype),
+            f"A {num_qubits}-qubit density matrix",
+        )
+        self.density_matrix = np.zeros((2**num_qubits, 2**num_qubits), dtype=self.dtype)
+        # Reused by every gate application instead of allocating a new 4^n buffer
+        self._scratch = np.empty_like(self.density_matrix)
+        # Already zero (see StateVectorSimulator)
+        self.density_matrix[0, 0] = 1.0
 
     def reset(self):
-        # Initialize the density matrix to the |0...0⟩ state
-        self.density_matrix = np.zeros(
-            (2**self.num_qubits, 2**self.num_qubits), dtype=complex
-        )
+        # Initialize the density matrix to the |0...0⟩ state without reallocating it
+        self.density_matrix.fill(0)
         self.density_matrix[0, 0] = 1.0
+        self.circuit_position = 0
 
     def get_num_qubits(self) -> int:
         return self.num_qubits
@@ -27,13 +67,8 @@ class DensityMatrixSimulator(QuantumSimulator):
         controls: Optional[Union[int, List[int]]] = None,
         params: Optional[List[float]] = None,
     ):
-        # Example implementation for single-qubit gates
-        if isinstance(targets, int):
-            targets = [targets]
-
         gate_matrix = self._get_gate_matrix(gate_name, params)
-        for target in targets:
-            self._apply_single_qubit_gate(gate_matrix, target)
+        self.apply_custom_gate(gate_matrix, targets, controls)
 
     def apply_custom_gate(
         self,
@@ -41,52 +76,136 @@ class DensityMatrixSimulator(QuantumSimulator):
         targets: Union[int, List[int]],
         controls: Optional[Union[int, List[int]]] = None,
     ):
-        # Apply a custom gate matrix to the density matrix
+        # A 2x2 matrix is broadcast over every target; a 2^k x 2^k matrix acts on all
+        # k targets at once. Controls are prepended as the most significant qubits.
         if isinstance(targets, int):
             targets = [targets]
+        if controls is None:
+            controls = []
+        elif isinstance(controls, int):
+            controls = [controls]
 
-        for target in targets:
-            self._apply_single_qubit_gate(gate_matrix, target)
+        if gate_matrix.shape == (2, 2) and len(targets) > 1:
+            groups = [[target] for target in targets]
+        else:
+            groups = [list(targets)]
 
-    def run(self, circuit: Any, shots: int = 1024) -> Dict[str, int]:
-        # Simulate measurement outcomes
-        probabilities = np.real(np.diag(self.density_matrix))
-        outcomes = {
-            bin(i)[2:].zfill(self.num_qubits): 0 for i in range(2**self.num_qubits)
-        }
+        matrix = controlled_matrix(gate_matrix, len(controls))
+        for group in groups:
+            self._apply_local_gate(matrix, list(controls) + group)
+
+    def apply_channel(self, channel: Any, qubits: Union[int, List[int]]):
+        # Kraus channels are contracted with the target qubits of rho in place
+        channel.contract(
+            self.density_matrix,
+            qubits,
+            self.num_qubits,
+            self._scratch,
+            self._threads,
+        )
+
+    def apply_circuit(self, circuit: Any):
+        if self.noise_model is None:
+            super().apply_circuit(circuit)
+        else:
+            self._apply_noisy_circuit(circuit)
+        if self.renormalize:
+            self._renormalize()
 
-        for _ in range(shots):
-            sampled_state = np.random.choice(len(probabilities), p=probabilities)
-            outcomes[bin(sampled_state)[2:].zfill(self.num_qubits)] += 1
+    def _apply_noisy_circuit(self, circuit: Any):
+        # A gate and its channels become one superoperator where possible, so noise
+        # adds no extra pass over rho
+        for gate in circuit.gates:
+            fused = self.noise_model.fused_superoperator(gate)
+            if fused is not None:
+                self._validate_qubits(gate.qubits)
+                apply_superoperator(
+                    self.density_matrix,
+                    fused,
+                    gate.qubits,
+                    self.num_qubits,
+                    scratch=self._scratch,
+                    threads=self._threads,
+                )
+                continue
+            self.apply_custom_gate(gate.matrix, gate.qubits)
+            for channel, qubits in self.noise_model.channels_for(gate):
+                self.apply_channel(channel, qubits)
 
-        return outcomes
+    def run(
+        self,
+        circuit: Any,
+        shots: int = 1024,
+        rng: Optional[np.random.Generator] = None,
+    ) -> Dict[str, int]:
+        # Execute the circuit from |0...0⟩ (if given), then sample every shot at once;
+        # only observed outcomes appear in the result
+        if circuit is not None:
+            self.reset()
+            self.apply_circuit(circuit)
+        probabilities = np.real(np.diag(self.density_matrix))
+        return sample_counts(
+            probabilities, shots, self.num_qubits, rng if rng is not None else self.rng
+        )
 
     def calculate_expectation_value(
-        self, observable: np.ndarray, state_vector: np.ndarray
+        self,
+        observable: Union[np.ndarray, PauliSum],
+        state_vector: Optional[np.ndarray] = None,
     ) -> float:
-        # Calculate expectation value using the density matrix
-        return np.real(np.trace(np.dot(self.density_matrix, observable)))
+        # tr(rho O) for the simulator's density matrix, or <psi|O|psi> if a state vector
+        # is given. A PauliSum reads only the entries rho[b, b ^ x] it needs; a dense O
+        # costs one elementwise pass (sum_ij rho_ij O_ji), not a full matrix product.
+        state = self.density_matrix if state_vector is None else state_vector
+        if isinstance(observable, PauliSum):
+            return observable.expectation_value(state)
+        if state_vector is not None:
+            return float(np.real(np.vdot(state_vector, observable @ state_vector)))
+        return float(np.real(np.sum(self.density_matrix * np.transpose(observable))))
+
+    def _snapshot_state(self):
+        options = {"renormalize": self.renormalize, "num_threads": self.num_threads}
+        return options, {"density_matrix": self.density_matrix}
+
+    @classmethod
+    def _from_snapshot(cls, snapshot, rng, noise_model):
+        simulator = cls(
+            snapshot.num_qubits,
+            rng=rng,
+            noise_model=noise_model,
+            precision=snapshot.precision,
+            **snapshot.options,
+        )
+        # Copy-on-write map; gates update rho in place, privately to this simulator
+        simulator.density_matrix = snapshot.array("density_matrix")
+        return simulator
 
     def _get_gate_matrix(
         self, gate_name: str, params: Optional[List[float]]
     ) -> np.ndarray:
-        # Define gate matrices (example: Pauli-X, Hadamard)
-        if gate_name == "x":
-            return np.array([[0, 1], [1, 0]], dtype=complex)
-        elif gate_name == "h":
-            return np.array([[1, 1], [1, -1]], dtype=complex) / np.sqrt(2)
-        else:
-            raise ValueError(f"Unsupported gate: {gate_name}")
-
-    def _apply_single_qubit_gate(self, gate_matrix: np.ndarray, target: int):
-        # Apply a single-qubit gate to the density matrix
-        full_gate = np.eye(2**self.num_qubits, dtype=complex)
-        for i in range(2**self.num_qubits):
-            if (i >> target) & 1 == 0:
-                full_gate[i, i] = gate_matrix[0, 0]
-                full_gate[i, i + (1 << target)] = gate_matrix[0, 1]
-            else:
-                full_gate[i, i] = gate_matrix[1, 1]
-                full_gate[i, i - (1 << target)] = gate_matrix[1, 0]
-
-        self.density_matrix = full_gate @ self.density_matrix @ full_gate.T.conj()
+        # Shared, read-only matrices from the gate registry (no allocation per lookup)
+        return gate_matrix(gate_name, params, self.dtype)
+
+    def _renormalize(self):
+        trace = np.real(np.trace(self.density_matrix))
+        if trace > 0:
+            self.density_matrix /= trace
+
+    def _apply_local_gate(self, gate_matrix: np.ndarray, qubits: List[int]):
+        # Contract U and U† with the target row/column axes of rho only: O(4^n * 2^k)
+        # work and no 2^n x 2^n operator.
+        self._validate_qubits(qubits)
+        apply_matrix_density(
+            self.density_matrix,
+            gate_matrix,
+            qubits,
+            self.num_qubits,
+            scratch=self._scratch,
+            threads=self._threads,
+        )
+
+    def _validate_qubits(self, qubits: List[int]):
+        if any(q >= self.num_qubits or q < 0 for q in qubits):
+            raise ValueError(
+                f"Invalid qubit indices {qubits} for a system with {self.num_qubits} qubits."
+            )
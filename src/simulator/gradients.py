@@ -0,0 +1,231 @@
+import copy
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, List, Mapping, Optional, Tuple, Union
+
+import numpy as np
+from src.dtos import QuantumCircuit
+from src.dtos._compact_circuit import PARAMETER_ATTRIBUTES, gate_angle
+from src.models.Parameter import ParameterExpression
+from src.models.PauliSum import PauliSum
+from src.models.gates.matrices import gate_matrix
+from src.simulator.dm_simulator import DensityMatrixSimulator
+from src.simulator.kernels import apply_diagonal, apply_matrix
+from src.simulator.sv_simulator import StateVectorSimulator
+
+# Rx/Ry/Rz/Ph have generators with eigenvalues +-1/2 (Ph up to a global phase), so
+# dE/dtheta = (E(theta + s) - E(theta - s)) / 2 exactly with this shift
+PARAMETER_SHIFT = np.pi / 2
+
+
+def _derivative(name: str, angle: float) -> np.ndarray:
+    # d/dtheta exp(-i theta G / 2) = exp(-i (theta + pi) G / 2) / 2 for Rx, Ry, Rz
+    if name == "Ph":
+        return np.diag([0, 1j * np.exp(1j * angle)])
+    return gate_matrix(name, [angle + np.pi]) / 2
+
+
+def _operations(circuit: Any, values: Optional[Mapping[Any, float]]):
+    """
+    Expands a circuit into single-target, numerically bound gates for differentiation.
+
+    Returns:
+        tuple: A list of (gate, [(parameter index, d angle / d parameter)]) and the
+        number of parameters. With symbolic parameters these are
+        ``circuit.parameters``; otherwise the angle of each Rx/Ry/Rz/Ph gate.
+    """
+    names = circuit.parameters
+    index = {name: i for i, name in enumerate(names)}
+    bound = {getattr(k, "name", k): float(v) for k, v in (values or {}).items()}
+    operations = []
+    count = 0
+    for gate in circuit.gates:
+        angle = gate_angle(gate)
+        if angle is None:
+            if gate.matrix.shape == (2, 2) and len(gate.qubits) > 1:
+                operations.extend((_retarget(gate, q, None), []) for q in gate.qubits)
+            else:
+                operations.append((gate, []))
+            continue
+        if isinstance(angle, ParameterExpression) and angle.parameters:
+            missing = angle.parameters - bound.keys()
+            if missing:
+                raise ValueError(f"No values given for parameters {sorted(missing)}.")
+            contributions = [(index[p], c) for p, c in angle.terms.items()]
+            angle = angle.bind(bound)
+        elif names:
+            contributions = []  # a fixed angle in a symbolically parameterized circuit
+        else:
+            contributions = [(count, 1.0)]
+            count += 1
+        # A rotation given several qubits acts on each of them with the same angle
+        for qubit in gate.qubits:
+            operations.append((_retarget(gate, qubit, float(angle)), contributions))
+    return operations, len(names) if names else count
+
+
+def _retarget(gate: Any, qubit: int, angle: Optional[float]) -> Any:
+    # A copy of ``gate`` acting on ``qubit`` only, with its angle (if any) replaced
+    gate = copy.copy(gate)
+    gate.qubits = [qubit]
+    if angle is not None:
+        setattr(gate, PARAMETER_ATTRIBUTES[gate.name], angle)
+    return gate
+
+
+def _expectation(observable: Union[np.ndarray, PauliSum], state: np.ndarray) -> float:
+    if isinstance(observable, PauliSum):
+        return observable.expectation_value(state)
+    return float(np.real(np.vdot(state, observable @ state)))
+
+
+def _apply(state, scratch, matrix, qubits, num_qubits):
+    # Same dispatch as StateVectorSimulator: diagonal gates in place, others into
+    # scratch; returns the (possibly swapped) pair of buffers
+    diagonal = np.diagonal(matrix)
+    if np.count_nonzero(matrix) == np.count_nonzero(diagonal):
+        apply_diagonal(state, diagonal, qubits, num_qubits)
+        return state, scratch
+    apply_matrix(state, matrix, qubits, num_qubits, out=scratch, overwrite_input=True)
+    return scratch, state
+
+
+def adjoint_gradient(
+    circuit: Any,
+    observable: Union[np.ndarray, PauliSum],
+    values: Optional[Mapping[Any, float]] = None,
+    num_qubits: Optional[int] = None,
+) -> Tuple[float, np.ndarray]:
+    """
+    Computes <O> and its gradient by adjoint differentiation on a state vector.
+
+    After one forward pass, the state |psi> and lambda = O|psi> are walked back
+    through the circuit together, undoing one gate at a time. At a rotation U(theta),
+    dE/dtheta = 2 Re <lambda| dU/dtheta |psi_before>. Only four state vectors are
+    alive at any time (psi, lambda, the derivative term and one scratch buffer),
+    whatever the number of parameters.
+
+    Args:
+        circuit: A QuantumCircuit of any gates, whose Rx/Ry/Rz/Ph angles may be
+            Parameter expressions.
+        observable (PauliSum | numpy.ndarray): The observable O.
+        values (Mapping, optional): Values of the symbolic parameters (Parameter or
+            name keys).
+        num_qubits (int, optional): Defaults to one past the highest qubit used.
+
+    Returns:
+        tuple: <O> and the gradient, ordered as ``circuit.parameters``, or, for a
+        circuit without symbolic parameters, one entry per Rx/Ry/Rz/Ph gate in order.
+    """
+    operations, num_parameters = _operations(circuit, values)
+    if num_qubits is None:
+        num_qubits = max(circuit.qubits) + 1 if len(circuit.qubits) else 0
+
+    psi = np.zeros(1 << num_qubits, dtype=complex)
+    psi[0] = 1.0
+    scratch = np.empty_like(psi)
+    for gate, _ in operations:
+        psi, scratch = _apply(psi, scratch, gate.matrix, gate.qubits, num_qubits)
+    value = _expectation(observable, psi)
+    if isinstance(observable, PauliSum):
+        lam = observable.apply(psi)
+    else:
+        lam = np.asarray(observable) @ psi
+    mu = np.empty_like(psi)
+
+    gradient = np.zeros(num_parameters)
+    for gate, contributions in reversed(operations):
+        adjoint = np.conj(gate.matrix.T)
+        psi, scratch = _apply(psi, scratch, adjoint, gate.qubits, num_qubits)
+        if contributions:
+            # psi now holds the state before the gate
+            derivative = _derivative(gate.name, float(gate_angle(gate)))
+            apply_matrix(psi, derivative, gate.qubits, num_qubits, out=mu)
+            slope = 2 * np.real(np.vdot(lam, mu))
+            for parameter, coefficient in contributions:
+                gradient[parameter] += coefficient * slope
+        lam, scratch = _apply(lam, scratch, adjoint, gate.qubits, num_qubits)
+    return value, gradient
+
+
+def _shifted_expectation(
+    gates: List[Any],
+    observable: Union[np.ndarray, PauliSum],
+    num_qubits: int,
+    noise_model: Any,
+) -> float:
+    # One full simulation; with a noise model on the density-matrix backend
+    circuit = QuantumCircuit()
+    for gate in gates:
+        circuit.append(gate)
+    if noise_model is None:
+        simulator = StateVectorSimulator(num_qubits)
+    else:
+        simulator = DensityMatrixSimulator(num_qubits, noise_model=noise_model)
+    simulator.apply_circuit(circuit)
+    return simulator.calculate_expectation_value(observable)
+
+
+def parameter_shift_gradient(
+    circuit: Any,
+    observable: Union[np.ndarray, PauliSum],
+    values: Optional[Mapping[Any, float]] = None,
+    num_qubits: Optional[int] = None,
+    noise_model: Any = None,
+    max_workers: Optional[int] = None,
+) -> Tuple[float, np.ndarray]:
+    """
+    Reference gradient by the parameter-shift rule: every rotation occurrence is
+    simulated at theta +- PARAMETER_SHIFT, two full simulations per occurrence, spread
+    over a ProcessPoolExecutor. Unlike ``adjoint_gradient`` this also works on noisy
+    circuits: with a ``noise_model`` every simulation runs on the density-matrix
+    backend.
+
+    Args:
+        circuit: A QuantumCircuit, as for ``adjoint_gradient``.
+        observable (PauliSum | numpy.ndarray): The observable O.
+        values (Mapping, optional): Values of the symbolic parameters.
+        num_qubits (int, optional): Defaults to one past the highest qubit used.
+        noise_model (NoiseModel, optional): Channels following each gate.
+        max_workers (int, optional): Worker processes; 1 runs in this process.
+            Defaults to ``os.cpu_count()``.
+
+    Returns:
+        tuple: <O> and the gradient, ordered as in ``adjoint_gradient``.
+    """
+    operations, num_parameters = _operations(circuit, values)
+    if num_qubits is None:
+        num_qubits = max(circuit.qubits) + 1 if len(circuit.qubits) else 0
+    gates = [gate for gate, _ in operations]
+
+    jobs = [gates]
+    shifted = []  # (position in operations, contributions) of each +- pair
+    for position, (gate, contributions) in enumerate(operations):
+        if not contributions:
+            continue
+        angle = float(gate_angle(gate))
+        for shift in (PARAMETER_SHIFT, -PARAMETER_SHIFT):
+            replaced = list(gates)
+            replaced[position] = _retarget(gate, gate.qubits[0], angle + shift)
+            jobs.append(replaced)
+        shifted.append(contributions)
+
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    arguments = (
+        [observable] * len(jobs),
+        [num_qubits] * len(jobs),
+        [noise_model] * len(jobs),
+    )
+    if max_workers == 1 or len(jobs) == 1:
+        results = list(map(_shifted_expectation, jobs, *arguments))
+    else:
+        with ProcessPoolExecutor(max_workers=min(max_workers, len(jobs))) as executor:
+            results = list(executor.map(_shifted_expectation, jobs, *arguments))
+
+    gradient = np.zeros(num_parameters)
+    for i, contributions in enumerate(shifted):
+        slope = (results[1 + 2 * i] - results[2 + 2 * i]) / 2
+        for parameter, coefficient in contributions:
+            gradient[parameter] += coefficient * slope
+    return results[0], gradient
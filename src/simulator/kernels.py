@@ -0,0 +1,632 @@
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+# Qubit q is bit q of a basis-state index (qubit 0 is the least significant bit).
+# A k-qubit gate matrix acting on qubits [q_0, ..., q_{k-1}] uses q_0 as the most
+# significant bit of its own row/column index, e.g. CNOT on [control, target].
+
+# Largest number of amplitudes below a single-qubit target for which the gate is run
+# as one GEMM against (U kron I) rather than a batched 2x2 matmul.
+_KRON_GEMM_MAX_LOW = 8
+
+# Smallest state (in amplitudes) the simulators split across worker threads; below it
+# dispatching the blocks costs more than the gate itself
+PARALLEL_THRESHOLD = 1 << 18
+
+# One pool per worker count, shared by every simulator of the process
+_THREAD_POOLS: Dict[int, ThreadPoolExecutor] = {}
+
+
+def grouped_shape(
+    num_qubits: int, qubits: Sequence[int], batch: int = 1
+) -> Tuple[Tuple[int, ...], List[int]]:
+    """
+    Builds a reshape of a 2^n vector that isolates the target qubits as axes of size 2
+    and merges every run of untouched qubits into a single axis.
+
+    Args:
+        num_qubits (int): Total number of qubits described by the vector.
+        qubits (Sequence[int]): Target qubit indices.
+        batch (int, optional): Size of a leading batch axis of B states. Defaults to 1.
+
+    Returns:
+        tuple: The grouped shape and, for each entry of ``qubits``, its axis in that shape.
+    """
+    ordered = sorted(qubits, reverse=True)  # most significant bit first (C order)
+    shape = [batch] if batch > 1 else []
+    positions = {}
+    upper = num_qubits
+    for q in ordered:
+        if upper - q - 1 > 0:
+            shape.append(1 << (upper - q - 1))
+        positions[q] = len(shape)
+        shape.append(2)
+        upper = q
+    if upper > 0:
+        shape.append(1 << upper)
+    return tuple(shape), [positions[q] for q in qubits]
+
+
+def controlled_matrix(matrix: np.ndarray, num_controls: int) -> np.ndarray:
+    """
+    Returns the matrix of ``matrix`` controlled on ``num_controls`` qubits, with the
+    controls placed before the targets (most significant bits).
+    """
+    if num_controls == 0:
+        return matrix
+    dim = matrix.shape[0] << num_controls
+    controlled = np.eye(dim, dtype=np.result_type(matrix, np.complex64))
+    controlled[-matrix.shape[0] :, -matrix.shape[0] :] = matrix
+    return controlled
+
+
+def basis_selector(
+    shape: Tuple[int, ...], axes: Sequence[int], index: int
+) -> Tuple[Any, ...]:
+    """
+    Indexes the grouped view from ``grouped_shape`` at one basis state of the target
+    qubits (``index`` uses the first target as its most significant bit).
+    """
+    k = len(axes)
+    selector: List[Union[int, slice]] = [slice(None)] * len(shape)
+    for i, axis in enumerate(axes):
+        selector[axis] = (index >> (k - 1 - i)) & 1
+    # The trailing Ellipsis keeps the result a view even when every axis is indexed
+    return tuple(selector) + (Ellipsis,)
+
+
+def reorder_matrix(
+    matrix: np.ndarray, qubits: Sequence[int], new_order: Sequence[int]
+) -> np.ndarray:
+    """
+    Rewrites a gate matrix given for ``qubits`` so that it acts identically when its
+    targets are listed as ``new_order`` (a permutation of ``qubits``).
+    """
+    k = len(qubits)
+    perm = [list(qubits).index(q) for q in new_order]
+    tensor = matrix.reshape((2,) * (2 * k)).transpose(perm + [k + p for p in perm])
+    return tensor.reshape(matrix.shape)
+
+
+def _thread_pool(threads: int) -> ThreadPoolExecutor:
+    pool = _THREAD_POOLS.get(threads)
+    if pool is None:
+        pool = _THREAD_POOLS.setdefault(
+            threads,
+            ThreadPoolExecutor(max_workers=threads, thread_name_prefix="qestkit"),
+        )
+    return pool
+
+
+def split_axis(shape: Sequence[int], axes: Sequence[int], threads: int) -> int:
+    """
+    The axis of a grouped view to split across ``threads`` workers: slices along an
+    untouched (non-target) axis are independent blocks of the state for the gate.
+    The most significant one with at least ``threads`` entries gives the largest
+    contiguous blocks; otherwise the largest one is used (-1 if there is none).
+    """
+    free = [axis for axis in range(len(shape)) if axis not in axes]
+    for axis in free:
+        if shape[axis] >= threads:
+            return axis
+    return max(free, key=lambda axis: shape[axis], default=-1)
+
+
+def for_blocks(
+    threads: int,
+    shape: Sequence[int],
+    axis: int,
+    function: Callable[[Tuple[Any, ...]], Any],
+):
+    """
+    Calls ``function(selector)`` on contiguous ranges of ``axis`` of a view of
+    ``shape``, one range per worker thread, and waits for all of them. NumPy releases
+    the GIL in copies, ufuncs and BLAS calls, so the blocks run concurrently. With one
+    thread (or no axis to split) ``function`` gets a selector for the whole view.
+    """
+    size = shape[axis] if axis >= 0 else 1
+    parts = min(threads, size)
+    if parts <= 1:
+        function((Ellipsis,))
+        return
+    bounds = [size * part // parts for part in range(parts + 1)]
+    selectors = [
+        (slice(None),) * axis + (slice(start, stop), Ellipsis)
+        for start, stop in zip(bounds[:-1], bounds[1:])
+    ]
+    # list() re-raises the first exception of a block in the caller
+    list(_thread_pool(threads).map(function, selectors))
+
+
+def apply_matrix(
+    state: np.ndarray,
+    matrix: np.ndarray,
+    qubits: Sequence[int],
+    num_qubits: int,
+    out: Optional[np.ndarray] = None,
+    overwrite_input: bool = False,
+    batch: int = 1,
+    threads: int = 1,
+) -> np.ndarray:
+    """
+    Applies a k-qubit matrix to the target axes of a 2^n state vector by local tensor
+    contraction, without building the 2^n x 2^n operator.
+
+    Gates on one qubit, or on adjacent qubits, are one BLAS call on a reshaped view.
+    Other dense gates copy the state into a target-major layout, run one GEMM and
+    copy back. Other sparse gates are applied row by row on strided views of the 2^k
+    target sub-blocks, skipping zero matrix entries, so permutation-like gates such
+    as CNOT reduce to block copies.
+
+    With several threads each step is split into independent blocks along an
+    untouched (non-target) axis (see ``split_axis``) and the blocks run concurrently.
+
+    Args:
+        state (numpy.ndarray): Flat (or C-contiguous) state with 2^num_qubits entries.
+        matrix (numpy.ndarray): The 2^k x 2^k gate matrix, rounded to the dtype of
+            ``state`` (complex64 states stay complex64).
+        qubits (Sequence[int]): The k target qubits, in the order used by ``matrix``.
+        num_qubits (int): Total number of qubits described by ``state``.
+        out (numpy.ndarray, optional): Buffer for the result. Must not alias ``state``.
+        overwrite_input (bool, optional): Allow ``state`` to be used as workspace, which
+            avoids a temporary for dense multi-qubit gates. Defaults to False.
+        batch (int, optional): Number B of states stacked along a leading axis
+            (``state`` is B x 2^n); the same matrix is applied to each. Defaults to 1.
+        threads (int, optional): Worker threads to split the work across. Defaults
+            to 1 (run on the calling thread).
+
+    Returns:
+        numpy.ndarray: The transformed state, shaped like ``state``.
+    """
+    k = len(qubits)
+    if matrix.shape != (1 << k, 1 << k):
+        raise ValueError(
+            f"Matrix of shape {matrix.shape} does not act on {k} qubit(s) {list(qubits)}."
+        )
+    if len(set(qubits)) != k:
+        raise ValueError(f"Target qubits {list(qubits)} must be distinct.")
+    # Run in the state's precision: a complex128 gate never upcasts a complex64 state
+    matrix = matrix.astype(state.dtype, copy=False)
+    shape, axes = grouped_shape(num_qubits, qubits, batch)
+    if out is None:
+        out = np.empty_like(state)
+    src = state.reshape(shape)
+    dst = out.reshape(shape)
+
+    dim = 1 << k
+    if k == 1 or max(qubits) - min(qubits) == k - 1:
+        # Adjacent targets form one axis of size 2^k in a (L, 2^k, low) view
+        if k > 1:
+            matrix = reorder_matrix(matrix, qubits, sorted(qubits, reverse=True))
+        low = 1 << min(qubits)
+        if low <= _KRON_GEMM_MAX_LOW:
+            # Few amplitudes below the targets: one GEMM with (U kron I_low) on rows
+            # of length 2^k * low is much faster than many tiny broadcast matmuls.
+            block = (
+                np.kron(matrix, np.eye(low, dtype=matrix.dtype)) if low > 1 else matrix
+            ).T
+            rows_in = state.reshape(-1, dim * low)
+            rows_out = out.reshape(-1, dim * low)
+            for_blocks(
+                threads,
+                rows_in.shape,
+                0,
+                lambda rows: np.matmul(rows_in[rows], block, out=rows_out[rows]),
+            )
+        else:
+            # Split the (L, 2^k, low) view along L, or along low when the targets are
+            # the top qubits (strided column blocks are fine for matmul)
+            view_in = state.reshape(-1, dim, low)
+            view_out = out.reshape(-1, dim, low)
+            axis = 0 if view_in.shape[0] >= min(threads, low) else 2
+            for_blocks(
+                threads,
+                view_in.shape,
+                axis,
+                lambda part: np.matmul(matrix, view_in[part], out=view_out[part]),
+            )
+        return out
+
+    axis = split_axis(shape, axes, threads)
+
+    if np.count_nonzero(matrix) > dim:
+        # Target axes first: the state becomes a (2^k, 2^(n-k)) matrix for one GEMM.
+        # ``out`` holds the transposed input and ``state`` (or a temporary) the product.
+        # Threads split both copies along the same untouched axis and the GEMM by
+        # columns, so every block is a view and nothing extra is allocated.
+        perm = list(axes) + [a for a in range(len(shape)) if a not in axes]
+        target_major = tuple(shape[a] for a in perm)
+        major_in = src.transpose(perm)
+        major_out = out.reshape(target_major)
+        work = state if overwrite_input else np.empty_like(state)
+        work_major = work.reshape(target_major)
+        dst_major = dst.transpose(perm)
+        columns_in = out.reshape(dim, -1)
+        columns_out = work.reshape(dim, -1)
+        major_axis = perm.index(axis) if axis >= 0 else -1
+        for_blocks(
+            threads,
+            target_major,
+            major_axis,
+            lambda part: np.copyto(major_out[part], major_in[part]),
+        )
+        for_blocks(
+            threads,
+            columns_in.shape,
+            1,
+            lambda part: np.matmul(matrix, columns_in[part], out=columns_out[part]),
+        )
+        for_blocks(
+            threads,
+            target_major,
+            major_axis,
+            lambda part: np.copyto(dst_major[part], work_major[part]),
+        )
+        return out
+
+    for_blocks(
+        threads,
+        shape,
+        axis,
+        lambda part: _apply_sparse(
+            src[part], dst[part], matrix, shape, axes, overwrite_input
+        ),
+    )
+    return out
+
+
+def _apply_sparse(
+    src: np.ndarray,
+    dst: np.ndarray,
+    matrix: np.ndarray,
+    shape: Tuple[int, ...],
+    axes: Sequence[int],
+    overwrite_input: bool,
+):
+    # Row by row on the 2^k target sub-blocks of (a block of) the grouped view
+    dim = matrix.shape[0]
+    blocks_in = [src[basis_selector(shape, axes, j)] for j in range(dim)]
+    blocks_out = [dst[basis_selector(shape, axes, i)] for i in range(dim)]
+    temp = None
+    for i in range(dim):
+        block = blocks_out[i]
+        columns = np.flatnonzero(matrix[i])
+        if len(columns) == 0:
+            block.fill(0)
+            continue
+        for position, j in enumerate(columns):
+            coefficient = matrix[i, j]
+            if position == 0:
+                if coefficient == 1:
+                    np.copyto(block, blocks_in[j])
+                else:
+                    np.multiply(blocks_in[j], coefficient, out=block)
+                continue
+            # Output blocks not written yet are free workspace; for the last row the
+            # input blocks it already consumed are, if the caller allows it.
+            if i + 1 < dim:
+                work = blocks_out[i + 1]
+            elif overwrite_input:
+                work = blocks_in[columns[position - 1]]
+            else:
+                if temp is None:
+                    temp = np.empty_like(block)
+                work = temp
+            np.multiply(blocks_in[j], coefficient, out=work)
+            np.add(block, work, out=block)
+
+
+def apply_diagonal(
+    state: np.ndarray,
+    diagonal: np.ndarray,
+    qubits: Sequence[int],
+    num_qubits: int,
+    batch: int = 1,
+    threads: int = 1,
+) -> np.ndarray:
+    """
+    Multiplies a state vector in place by a diagonal k-qubit gate (Z, S, T, Rz, CZ, ...).
+    Each phase is applied to a strided view, so no scratch buffer is needed.
+
+    Args:
+        state (numpy.ndarray): Flat (or C-contiguous) state with 2^num_qubits entries.
+        diagonal (numpy.ndarray): The 2^k diagonal entries of the gate matrix.
+        qubits (Sequence[int]): The k target qubits, in the order used by ``diagonal``.
+        num_qubits (int): Total number of qubits described by ``state``.
+        batch (int, optional): Number B of states stacked along a leading axis.
+        threads (int, optional): Worker threads, each scaling one block of an
+            untouched axis. Defaults to 1.
+
+    Returns:
+        numpy.ndarray: ``state``, holding the transformed amplitudes.
+    """
+    shape, axes = grouped_shape(num_qubits, qubits, batch)
+    view = state.reshape(shape)
+    phases = [
+        (basis_selector(shape, axes, index), phase)
+        for index, phase in enumerate(np.asarray(diagonal, dtype=state.dtype))
+        if phase != 1
+    ]
+
+    def scale(part):
+        block = view[part]
+        for selector, phase in phases:
+            block[selector] *= phase
+
+    for_blocks(threads, shape, split_axis(shape, axes, threads), scale)
+    return state
+
+
+def apply_matrix_density(
+    density_matrix: np.ndarray,
+    matrix: np.ndarray,
+    qubits: Sequence[int],
+    num_qubits: int,
+    scratch: Optional[np.ndarray] = None,
+    threads: int = 1,
+) -> np.ndarray:
+    """
+    Computes U rho U^dagger for a k-qubit U by contracting only the target row and
+    column axes of rho, viewed as a (2,)*2n tensor.
+
+    The row index of rho is the more significant half of its flat index, so row qubit q
+    is qubit q + n of a 2n-qubit vector and column qubit q is qubit q. Multiplying by
+    U^dagger on the right is the same as applying conj(U) to the column axes.
+
+    Args:
+        density_matrix (numpy.ndarray): The 2^n x 2^n density matrix, updated in place.
+        matrix (numpy.ndarray): The 2^k x 2^k gate matrix.
+        qubits (Sequence[int]): The k target qubits, in the order used by ``matrix``.
+        num_qubits (int): Total number of qubits n.
+        scratch (numpy.ndarray, optional): Reusable buffer of the same size as rho.
+        threads (int, optional): Worker threads for each contraction. Defaults to 1.
+
+    Returns:
+        numpy.ndarray: ``density_matrix``, holding the transformed state.
+    """
+    flat = density_matrix.reshape(-1)
+    if scratch is None:
+        scratch = np.empty_like(flat)
+    row_qubits = [q + num_qubits for q in qubits]
+    apply_matrix(
+        flat,
+        matrix,
+        row_qubits,
+        2 * num_qubits,
+        out=scratch.reshape(-1),
+        threads=threads,
+    )
+    apply_matrix(
+        scratch.reshape(-1),
+        np.conj(matrix),
+        qubits,
+        2 * num_qubits,
+        out=flat,
+        overwrite_input=True,
+        threads=threads,
+    )
+    return density_matrix
+
+
+def apply_superoperator(
+    density_matrix: np.ndarray,
+    superoperator: np.ndarray,
+    qubits: Sequence[int],
+    num_qubits: int,
+    scratch: Optional[np.ndarray] = None,
+    threads: int = 1,
+) -> np.ndarray:
+    """
+    Applies a k-qubit channel to rho in place through its superoperator
+    S = sum_i K_i kron conj(K_i), a 2k-qubit matrix acting on the target row qubits
+    (q + n) followed by the target column qubits (q) of rho seen as a 2n-qubit vector.
+
+    Diagonal superoperators (dephasing channels) are applied in place without scratch.
+
+    Args:
+        density_matrix (numpy.ndarray): The 2^n x 2^n density matrix, updated in place.
+        superoperator (numpy.ndarray): The 4^k x 4^k superoperator.
+        qubits (Sequence[int]): The k target qubits, in the order used by the channel.
+        num_qubits (int): Total number of qubits n.
+        scratch (numpy.ndarray, optional): Reusable buffer of the same size as rho.
+        threads (int, optional): Worker threads for each contraction. Defaults to 1.
+
+    Returns:
+        numpy.ndarray: ``density_matrix``, holding the transformed state.
+    """
+    flat = density_matrix.reshape(-1)
+    targets = [q + num_qubits for q in qubits] + list(qubits)
+    diagonal = np.diagonal(superoperator)
+    if np.count_nonzero(superoperator) == np.count_nonzero(diagonal):
+        apply_diagonal(flat, diagonal, targets, 2 * num_qubits, threads=threads)
+        return density_matrix
+    if scratch is None:
+        scratch = np.empty_like(flat)
+    scratch = scratch.reshape(-1)
+    apply_matrix(
+        flat,
+        superoperator,
+        targets,
+        2 * num_qubits,
+        out=scratch,
+        overwrite_input=True,
+        threads=threads,
+    )
+    for_blocks(
+        threads,
+        flat.shape,
+        0,
+        lambda part: np.copyto(flat[part], scratch[part]),
+    )
+    return density_matrix
+
+
+def apply_kraus(
+    density_matrix: np.ndarray,
+    kraus_operators: Sequence[np.ndarray],
+    qubits: Sequence[int],
+    num_qubits: int,
+    scratch: Optional[np.ndarray] = None,
+    threads: int = 1,
+) -> np.ndarray:
+    """
+    Computes sum_i K_i rho K_i^dagger in place, contracting each Kraus operator with
+    the target row and column axes only. Cheaper than ``apply_superoperator`` when a
+    channel has few Kraus operators relative to its 2^k dimension.
+
+    Args:
+        density_matrix (numpy.ndarray): The 2^n x 2^n density matrix, updated in place.
+        kraus_operators (Sequence[numpy.ndarray]): The 2^k x 2^k Kraus operators.
+        qubits (Sequence[int]): The k target qubits, in the order used by the operators.
+        num_qubits (int): Total number of qubits n.
+        scratch (numpy.ndarray, optional): Reusable buffer of the same size as rho.
+        threads (int, optional): Worker threads for each contraction. Defaults to 1.
+
+    Returns:
+        numpy.ndarray: ``density_matrix``, holding the transformed state.
+    """
+    flat = density_matrix.reshape(-1)
+    if scratch is None:
+        scratch = np.empty_like(flat)
+    scratch = scratch.reshape(-1)
+    row_qubits = [q + num_qubits for q in qubits]
+    accumulator = np.zeros_like(flat)
+    term = np.empty_like(flat) if len(kraus_operators) > 1 else None
+    for position, kraus in enumerate(kraus_operators):
+        last = position == len(kraus_operators) - 1
+        # The last operator may consume rho itself, which is then overwritten
+        target = flat if last else term
+        apply_matrix(
+            flat,
+            kraus,
+            row_qubits,
+            2 * num_qubits,
+            out=scratch,
+            overwrite_input=last,
+            threads=threads,
+        )
+        apply_matrix(
+            scratch,
+            np.conj(kraus),
+            qubits,
+            2 * num_qubits,
+            out=target,
+            overwrite_input=True,
+            threads=threads,
+        )
+        if not last:
+            accumulator += term
+    flat += accumulator
+    return density_matrix
+
+
+def reduced_density_matrix(
+    state: np.ndarray,
+    qubits: Sequence[int],
+    num_qubits: int,
+    scratch: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    """
+    Traces a state vector down to the 2^k x 2^k density matrix of its target qubits.
+
+    The state is copied into a target-major (2^k, 2^(n-k)) layout ``M`` and the result
+    is the single GEMM ``M M^dagger``.
+
+    Args:
+        state (numpy.ndarray): Flat (or C-contiguous) state with 2^num_qubits entries.
+        qubits (Sequence[int]): The k target qubits; qubits[0] is the most significant
+            bit of the result's index.
+        num_qubits (int): Total number of qubits described by ``state``.
+        scratch (numpy.ndarray, optional): Reusable buffer of the same size as ``state``.
+
+    Returns:
+        numpy.ndarray: The reduced density matrix.
+    """
+    shape, axes = grouped_shape(num_qubits, qubits)
+    perm = list(axes) + [axis for axis in range(len(shape)) if axis not in axes]
+    if scratch is None:
+        scratch = np.empty_like(state)
+    np.copyto(
+        scratch.reshape(tuple(shape[axis] for axis in perm)),
+        state.reshape(shape).transpose(perm),
+    )
+    target_major = scratch.reshape(1 << len(qubits), -1)
+    return target_major @ target_major.conj().T
+
+
+def apply_matrix_batch(
+    states: np.ndarray,
+    matrices: np.ndarray,
+    qubit: int,
+    num_qubits: int,
+    out: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    """
+    Applies a different 2x2 matrix to one qubit of each state in a batch, e.g. an Rx
+    whose angle varies across a parameter sweep, as one batched BLAS call. Like
+    ``apply_matrix``, qubits with few amplitudes below them use a GEMM against
+    (U_b kron I_low) per state; the others a batched matmul on a (B, L, 2, low) view.
+
+    Args:
+        states (numpy.ndarray): B x 2^n batch of states.
+        matrices (numpy.ndarray): B x 2 x 2 matrices; entry b acts on states[b].
+        qubit (int): The target qubit.
+        num_qubits (int): Number of qubits n of each state.
+        out (numpy.ndarray, optional): Buffer for the result. Must not alias ``states``.
+
+    Returns:
+        numpy.ndarray: The transformed batch, shaped like ``states``.
+    """
+    batch = matrices.shape[0]
+    matrices = matrices.astype(states.dtype, copy=False)
+    if out is None:
+        out = np.empty_like(states)
+    low = 1 << qubit
+    if low <= _KRON_GEMM_MAX_LOW:
+        blocks = matrices
+        if low > 1:
+            blocks = np.einsum(
+                "bij,kl->bikjl", matrices, np.eye(low, dtype=matrices.dtype)
+            ).reshape(batch, 2 * low, 2 * low)
+        np.matmul(
+            states.reshape(batch, -1, 2 * low),
+            blocks.transpose(0, 2, 1),
+            out=out.reshape(batch, -1, 2 * low),
+        )
+    else:
+        np.matmul(
+            matrices[:, None],
+            states.reshape(batch, -1, 2, low),
+            out=out.reshape(batch, -1, 2, low),
+        )
+    return out
+
+
+def apply_diagonal_batch(
+    states: np.ndarray,
+    diagonals: np.ndarray,
+    qubit: int,
+    num_qubits: int,
+) -> np.ndarray:
+    """
+    Multiplies each state of a batch in place by its own single-qubit diagonal gate
+    (Rz or Ph with a swept angle).
+
+    Args:
+        states (numpy.ndarray): B x 2^n batch of states.
+        diagonals (numpy.ndarray): B x 2 diagonal entries; row b acts on states[b].
+        qubit (int): The target qubit.
+        num_qubits (int): Number of qubits n of each state.
+
+    Returns:
+        numpy.ndarray: ``states``, holding the transformed amplitudes.
+    """
+    batch = diagonals.shape[0]
+    diagonals = diagonals.astype(states.dtype, copy=False)
+    view = states.reshape(batch, -1, 2, 1 << qubit)
+    for bit in (0, 1):
+        phases = diagonals[:, bit]
+        if np.any(phases != 1):
+            view[:, :, bit] *= phases.reshape(batch, 1, 1)
+    return states
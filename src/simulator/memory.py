@@ -0,0 +1,180 @@
+import os
+from typing import Optional
+
+from src.models.gates.matrices import complex_dtype
+from src.simulator.mps_simulator import SAMPLE_CHUNK
+
+# Python objects behind one entry of a counts dict besides the bitstring characters:
+# the str and int headers and the dict slot
+COUNT_ENTRY_BYTES = 160
+
+# Allocations below this size are not checked against the available memory
+CHECK_MIN_BYTES = 1 << 26
+
+
+def available_memory() -> Optional[int]:
+    """
+    Bytes this process can still allocate: MemAvailable of the host, lowered to the
+    remaining headroom of a cgroup (v2) memory limit when the process runs in one.
+
+    Returns:
+        int | None: The available bytes, or None if the platform does not report them.
+    """
+    available = None
+    try:
+        with open("/proc/meminfo") as meminfo:
+            for line in meminfo:
+                if line.startswith("MemAvailable:"):
+                    available = int(line.split()[1]) * 1024
+                    break
+    except OSError:
+        pass
+    if available is None:
+        try:
+            available = os.sysconf("SC_AVPHYS_PAGES") * os.sysconf("SC_PAGE_SIZE")
+        except (AttributeError, ValueError, OSError):
+            return None
+    try:
+        with open("/sys/fs/cgroup/memory.max") as limit_file:
+            limit = limit_file.read().strip()
+        with open("/sys/fs/cgroup/memory.current") as current_file:
+            current = int(current_file.read().strip())
+        if limit != "max":
+            available = min(available, max(int(limit) - current, 0))
+    except (OSError, ValueError):
+        pass
+    return available
+
+
+def format_bytes(num_bytes: int) -> str:
+    """Human-readable size, e.g. 64.0 GiB (exact integers, however large)."""
+    units = ("B", "KiB", "MiB", "GiB", "TiB", "PiB")
+    value = int(num_bytes)
+    exponent = min(max(value.bit_length() - 1, 0) // 10, len(units) - 1)
+    if exponent == 0:
+        return f"{value} B"
+    if value.bit_length() > 1000:
+        return f"2^{value.bit_length() - 1} B"
+    return f"{value / (1 << 10 * exponent):.1f} {units[exponent]}"
+
+
+def check_allocation(num_bytes: int, description: str):
+    """
+    Fails fast, before anything is allocated, if ``num_bytes`` exceed the memory
+    available to the process (on Linux an oversized NumPy allocation succeeds lazily
+    and the process is OOM-killed later, when the pages are touched).
+
+    :raises MemoryError: With the estimate and the available memory.
+    """
+    if num_bytes < CHECK_MIN_BYTES:
+        return
+    available = available_memory()
+    if available is not None and num_bytes > available:
+        raise MemoryError(
+            f"{description} needs about {format_bytes(num_bytes)}, but only "
+            f"{format_bytes(available)} is available."
+        )
+
+
+def counts_bytes(num_qubits: int, outcomes: int) -> int:
+    """Size of a counts dict holding ``outcomes`` distinct bitstrings."""
+    return outcomes * (num_qubits + COUNT_ENTRY_BYTES)
+
+
+def _sampling_bytes(num_qubits: int, shots: int) -> int:
+    # sample_counts on 2^n probabilities: the float64 clip, normalized copy and
+    # cumulative sum (or multinomial counts), the per-shot draws and the counts dict
+    dim = 1 << num_qubits
+    draws = 32 * shots if shots < dim else 0
+    return 24 * dim + draws + counts_bytes(num_qubits, min(shots, dim))
+
+
+def statevector_bytes(num_qubits: int, precision="double", shots: int = 0) -> int:
+    """
+    Peak bytes of StateVectorSimulator.run: the state and its swap buffer, plus the
+    probabilities and sampling temporaries while both are alive.
+    """
+    itemsize = complex_dtype(precision).itemsize
+    dim = 1 << num_qubits
+    total = 2 * itemsize * dim
+    if shots:
+        total += itemsize // 2 * dim + _sampling_bytes(num_qubits, shots)
+    return total
+
+
+def density_matrix_bytes(
+    num_qubits: int, precision="double", shots: int = 0, noisy: bool = False
+) -> int:
+    """
+    Peak bytes of DensityMatrixSimulator.run: rho and its scratch buffer. Channels
+    contracted Kraus operator by Kraus operator keep two more rho-sized buffers (the
+    accumulator and the current term), so a noisy estimate includes them.
+    """
+    itemsize = complex_dtype(precision).itemsize
+    dim = 1 << num_qubits
+    total = (4 if noisy else 2) * itemsize * dim * dim
+    if shots:
+        total += itemsize * dim + _sampling_bytes(num_qubits, shots)
+    return total
+
+
+def mps_bond_dimensions(num_qubits: int, max_bond_dimension: Optional[int] = None):
+    """
+    Largest possible bond dimensions of an n-site MPS: bond i (between sites i and
+    i + 1) is at most 2^min(i + 1, n - i - 1), and at most ``max_bond_dimension``.
+    """
+    bonds = []
+    for bond in range(num_qubits - 1):
+        dimension = 1 << min(bond + 1, num_qubits - bond - 1)
+        if max_bond_dimension is not None:
+            dimension = min(dimension, max_bond_dimension)
+        bonds.append(dimension)
+    return bonds
+
+
+def mps_bytes(
+    num_qubits: int,
+    precision="double",
+    shots: int = 0,
+    max_bond_dimension: Optional[int] = None,
+) -> int:
+    """
+    Peak bytes of MPSSimulator.run with every bond at its largest possible dimension:
+    the site tensors, the two-site contraction and its SVD factors on the widest
+    pair, and the sampler's per-chunk environments.
+    """
+    itemsize = complex_dtype(precision).itemsize
+    bonds = [1] + mps_bond_dimensions(num_qubits, max_bond_dimension) + [1]
+    tensors = sum(2 * bonds[i] * bonds[i + 1] for i in range(num_qubits))
+    # Pair tensor (two copies), SVD input, U, Vh and LAPACK workspace
+    pair = max((4 * bonds[i] * bonds[i + 2] for i in range(num_qubits - 1)), default=0)
+    total = itemsize * (tensors + 6 * pair)
+    if shots:
+        chunk = min(shots, SAMPLE_CHUNK)
+        widest = max(bonds)
+        total += chunk * (4 * widest * itemsize + 3 * num_qubits)
+        total += counts_bytes(num_qubits, min(shots, 1 << num_qubits))
+    return total
+
+
+def stabilizer_bytes(num_qubits: int, shots: int = 0) -> int:
+    """
+    Peak bytes of StabilizerSimulator.run: the packed 2n-row tableau, the copy and
+    row temporaries of the elimination, and the sampled outcomes with their counts.
+    """
+    words = max(1, (num_qubits + 63) // 64)
+    row_bytes = 8 * words
+    tableau = 2 * (2 * num_qubits * row_bytes) + 2 * num_qubits
+    elimination = 12 * num_qubits * row_bytes
+    total = 2 * tableau + elimination
+    if shots:
+        outcomes = min(shots, 1 << num_qubits)
+        # One multinomial over the 2^k outcomes, or one integer draw per shot (and
+        # their sort); k is at most n
+        if num_qubits <= 20 and shots >= 1 << num_qubits:
+            total += 8 * outcomes
+        else:
+            total += 24 * shots
+        total += outcomes * (9 * row_bytes)
+        total += counts_bytes(num_qubits, outcomes)
+    return total
@@ -0,0 +1,409 @@
+import numpy as np
+from typing import List, Dict, Union, Optional
+from src.models.PauliSum import PauliSum, pauli_qubits
+from src.models.gates.matrices import (
+    I_MATRIX,
+    X_MATRIX,
+    Y_MATRIX,
+    Z_MATRIX,
+    complex_dtype,
+    gate_matrix,
+)
+from src.simulator.qestkit_simulator import QuantumSimulator
+from src.simulator.kernels import controlled_matrix, reorder_matrix
+from typing import Any
+
+# Shots sampled together; bounds the (shots x bond dimension) environment array
+SAMPLE_CHUNK = 8192
+
+SWAP_MATRIX = np.array(
+    [[1, 0, 0, 0], [0, 0, 1, 0], [0, 1, 0, 0], [0, 0, 0, 1]], dtype=complex
+)
+SWAP_MATRIX.setflags(write=False)
+
+# Single-site factor of a Pauli string for each (x, z) bit pair; Y = i X Z
+_PAULI_FACTORS = {
+    (0, 0): I_MATRIX,
+    (1, 0): X_MATRIX,
+    (0, 1): Z_MATRIX,
+    (1, 1): Y_MATRIX,
+}
+
+
+class MPSSimulator(QuantumSimulator):
+    """
+    Matrix-product-state simulator: qubit q is site q, a tensor of shape
+    (left bond, 2, right bond), and memory grows linearly in n for bounded bonds.
+
+    The MPS is kept in mixed canonical form around an orthogonality center, so every
+    SVD truncation is optimal and single-site quantities only touch the center.
+    Two-qubit gates contract the two sites, apply the 4x4 matrix and split them again
+    by SVD, keeping at most ``max_bond_dimension`` singular values and discarding at
+    most a ``cutoff`` fraction of the norm; the discarded weight is accumulated in
+    ``truncation_error``. Gates on non-adjacent qubits are routed with SWAPs, which
+    are undone afterwards so site q always holds qubit q.
+
+    With ``precision="single"`` the tensors (and every gate, SWAP and SVD) are
+    complex64; ``renormalize=True`` rescales the center to unit norm after each circuit.
+    """
+
+    def __init__(
+        self,
+        num_qubits: int,
+        max_bond_dimension: Optional[int] = None,
+        cutoff: float = 1e-12,
+        rng: Optional[np.random.Generator] = None,
+        noise_model: Optional[Any] = None,
+        precision: str = "double",
+        renormalize: bool = False,
+    ):
+        self.num_qubits = num_qubits
+        self.dtype = complex_dtype(precision)
+        self.renormalize = renormalize
+        self.max_bond_dimension = max_bond_dimension
+        self.cutoff = cutoff
+        self.rng = rng if rng is not None else np.random.default_rng()
+        # Optional NoiseModel sampled once per run (one trajectory), as for state vectors
+        self.noise_model = noise_model
+        self.reset()
+
+    def reset(self):
+        # Product state |0...0⟩ with bond dimension 1
+        self.tensors: List[np.ndarray] = []
+        for _ in range(self.num_qubits):
+            tensor = np.zeros((1, 2, 1), dtype=self.dtype)
+            tensor[0, 0, 0] = 1.0
+            self.tensors.append(tensor)
+        self._center = 0
+        self.truncation_error = 0.0
+        self.circuit_position = 0
+
+    def get_num_qubits(self) -> int:
+        return self.num_qubits
+
+    @property
+    def bond_dimensions(self) -> List[int]:
+        """The n - 1 bond dimensions between neighbouring sites."""
+        return [tensor.shape[2] for tensor in self.tensors[:-1]]
+
+    def nbytes(self) -> int:
+        """Memory held by the site tensors."""
+        return sum(tensor.nbytes for tensor in self.tensors)
+
+    def apply_gate(
+        self,
+        gate_name: str,
+        targets: Union[int, List[int]],
+        controls: Optional[Union[int, List[int]]] = None,
+        params: Optional[List[float]] = None,
+    ):
+        self.apply_custom_gate(
+            gate_matrix(gate_name, params, self.dtype), targets, controls
+        )
+
+    def apply_custom_gate(
+        self,
+        gate_matrix: np.ndarray,
+        targets: Union[int, List[int]],
+        controls: Optional[Union[int, List[int]]] = None,
+    ):
+        # Same conventions as the other simulators: a 2x2 matrix is broadcast over every
+        # target, and controls are prepended as the most significant qubits
+        if isinstance(targets, int):
+            targets = [targets]
+        if controls is None:
+            controls = []
+        elif isinstance(controls, int):
+            controls = [controls]
+
+        if gate_matrix.shape == (2, 2) and len(targets) > 1:
+            groups = [[target] for target in targets]
+        else:
+            groups = [list(targets)]
+
+        matrix = controlled_matrix(gate_matrix, len(controls))
+        for group in groups:
+            self._apply_local_gate(matrix, list(controls) + group)
+
+    def apply_channel(self, channel: Any, qubits: Union[int, List[int]]):
+        # One trajectory step: sample a Kraus branch from the reduced state of the
+        # targets and apply it as a (renormalized) gate
+        for group in channel.target_groups(qubits, self.num_qubits):
+            operator = channel.sample_with(
+                lambda: self.reduced_density_matrix(group), self.rng
+            )
+            if operator is not None:
+                self._apply_local_gate(operator, group)
+
+    def apply_circuit(self, circuit: Any):
+        if self.noise_model is None:
+            super().apply_circuit(circuit)
+        else:
+            for gate in circuit.gates:
+                self.apply_custom_gate(gate.matrix, gate.qubits)
+                for channel, qubits in self.noise_model.channels_for(gate):
+                    self.apply_channel(channel, qubits)
+        if self.renormalize:
+            self._renormalize()
+
+    def run(
+        self,
+        circuit: Any,
+        shots: int = 1024,
+        rng: Optional[np.random.Generator] = None,
+    ) -> Dict[str, int]:
+        # Execute the circuit from |0...0⟩ (if given), then sample site by site
+        if circuit is not None:
+            self.reset()
+            self.apply_circuit(circuit)
+        return self.sample_counts(shots, rng)
+
+    def sample_counts(
+        self, shots: int, rng: Optional[np.random.Generator] = None
+    ) -> Dict[str, int]:
+        """
+        Samples measurement outcomes without building the state vector. With the
+        center on site 0 every later site is right-canonical, so the marginal of each
+        qubit given the earlier outcomes is read off one site: O(shots * n * chi^2).
+
+        Returns:
+            dict: Counts of the observed bitstrings (qubit 0 rightmost).
+        """
+        rng = rng if rng is not None else self.rng
+        self._move_center(0)
+        counts: Dict[str, int] = {}
+        for start in range(0, shots, SAMPLE_CHUNK):
+            size = min(SAMPLE_CHUNK, shots - start)
+            bits = np.empty((size, self.num_qubits), dtype=np.uint8)
+            environment = np.ones((size, 1), dtype=self.dtype)
+            for site, tensor in enumerate(self.tensors):
+                amplitudes = np.einsum("sa,aib->sib", environment, tensor)
+                weights = np.einsum("sib,sib->si", amplitudes, amplitudes.conj()).real
+                total = weights.sum(axis=1)
+                outcome = rng.random(size) * total < weights[:, 1]
+                bits[:, site] = outcome
+                chosen = amplitudes[np.arange(size), outcome.astype(np.intp)]
+                norms = np.sqrt(weights[np.arange(size), outcome.astype(np.intp)])
+                environment = chosen / norms[:, None]
+            rows, row_counts = np.unique(bits[:, ::-1], axis=0, return_counts=True)
+            for row, count in zip(rows, row_counts):
+                key = "".join("1" if bit else "0" for bit in row)
+                counts[key] = counts.get(key, 0) + int(count)
+        return counts
+
+    def calculate_expectation_value(
+        self,
+        observable: Union[np.ndarray, PauliSum],
+        state_vector: Optional[np.ndarray] = None,
+    ) -> float:
+        # A PauliSum is contracted term by term on the MPS; a dense observable (small
+        # systems only) goes through the full state vector
+        if state_vector is None and isinstance(observable, PauliSum):
+            return self.pauli_expectation(observable)
+        if state_vector is None:
+            state_vector = self.to_state_vector()
+        if isinstance(observable, PauliSum):
+            return observable.expectation_value(state_vector)
+        return float(np.real(np.vdot(state_vector, observable @ state_vector)))
+
+    def pauli_expectation(self, observable: PauliSum) -> float:
+        """
+        Evaluates a PauliSum on the MPS. For each term the center is moved into the
+        term's support, so only the sites between its first and last non-identity
+        factor are contracted: O(support * chi^3) per term.
+        """
+        if observable.num_qubits > self.num_qubits:
+            raise ValueError(
+                f"Observable on {observable.num_qubits} qubits does not fit {self.num_qubits}."
+            )
+        terms = []
+        for x, z, coefficient in zip(
+            observable.x_masks.tolist(),
+            observable.z_masks.tolist(),
+            observable.coefficients,
+        ):
+            support = pauli_qubits(int(x) | int(z))
+            first = support[0] if support else 0
+            terms.append((first, support, int(x), int(z), coefficient))
+        # Visiting terms by their first site keeps center moves short
+        terms.sort(key=lambda term: term[0])
+        total = 0j
+        for first, support, x, z, coefficient in terms:
+            if not support:
+                total += coefficient * self._norm_squared()
+                continue
+            self._move_center(first)
+            environment = None
+            for site in range(first, support[-1] + 1):
+                tensor = self.tensors[site]
+                factor = _PAULI_FACTORS[((x >> site) & 1, (z >> site) & 1)].astype(
+                    self.dtype, copy=False
+                )
+                transformed = np.einsum("ij,ajb->aib", factor, tensor)
+                if environment is None:
+                    environment = np.einsum("aib,aic->bc", tensor.conj(), transformed)
+                else:
+                    environment = np.einsum(
+                        "ab,aic,bid->cd", environment, tensor.conj(), transformed
+                    )
+            total += coefficient * np.trace(environment)
+        return float(total.real)
+
+    def reduced_density_matrix(self, qubits: List[int]) -> np.ndarray:
+        """
+        The reduced density matrix of one qubit or two qubits (qubits[0] is the most
+        significant bit), read from the center without touching other sites.
+        """
+        if len(qubits) == 1:
+            self._move_center(qubits[0])
+            tensor = self.tensors[qubits[0]]
+            return np.einsum("aib,ajb->ij", tensor, tensor.conj())
+        if len(qubits) != 2:
+            raise ValueError("MPSSimulator supports channels on at most two qubits.")
+        low, high = sorted(qubits)
+        self._route(low, high)
+        self._move_center(low)
+        pair = np.einsum("aib,bjc->aijc", self.tensors[low], self.tensors[low + 1])
+        reduced = np.einsum("aijc,aklc->ijkl", pair, pair.conj()).reshape(4, 4)
+        self._unroute(low, high)
+        # Sites low, low + 1 hold qubits low, high; reorder to the requested order
+        return reorder_matrix(reduced, [low, high], qubits)
+
+    def to_state_vector(self) -> np.ndarray:
+        """Contracts the MPS into the full 2^n state vector (small systems only)."""
+        state = np.ones((1, 1), dtype=self.dtype)
+        for tensor in self.tensors:
+            # The new qubit becomes the most significant bit of the index
+            state = np.einsum("da,aib->idb", state, tensor)
+            state = state.reshape(-1, tensor.shape[2])
+        return state.reshape(-1)
+
+    def _norm_squared(self) -> float:
+        # With the center anywhere, the norm is that of the center tensor
+        center = self.tensors[self._center]
+        return float(np.real(np.vdot(center, center)))
+
+    def _snapshot_state(self):
+        options = {
+            "max_bond_dimension": self.max_bond_dimension,
+            "cutoff": self.cutoff,
+            "renormalize": self.renormalize,
+            "center": self._center,
+            "truncation_error": self.truncation_error,
+        }
+        arrays = {f"site_{q}": tensor for q, tensor in enumerate(self.tensors)}
+        return options, arrays
+
+    @classmethod
+    def _from_snapshot(cls, snapshot, rng, noise_model):
+        options = dict(snapshot.options)
+        center = options.pop("center")
+        truncation_error = options.pop("truncation_error")
+        simulator = cls(
+            snapshot.num_qubits,
+            rng=rng,
+            noise_model=noise_model,
+            precision=snapshot.precision,
+            **options,
+        )
+        # Copy-on-write maps; gates replace the tensors they touch
+        simulator.tensors = [
+            snapshot.array(f"site_{q}") for q in range(snapshot.num_qubits)
+        ]
+        simulator._center = center
+        simulator.truncation_error = truncation_error
+        return simulator
+
+    def _renormalize(self):
+        # Rescaling the center rescales the whole state
+        norm = np.sqrt(self._norm_squared())
+        if norm > 0:
+            self.tensors[self._center] *= self.dtype.type(1.0 / norm)
+
+    def _apply_local_gate(self, gate_matrix: np.ndarray, qubits: List[int]):
+        if any(q >= self.num_qubits or q < 0 for q in qubits):
+            raise ValueError(
+                f"Invalid qubit indices {qubits} for a system with {self.num_qubits} qubits."
+            )
+        if len(set(qubits)) != len(qubits):
+            raise ValueError(f"Target qubits {qubits} must be distinct.")
+        # Gates are rounded to the tensors' precision, never the other way round
+        gate_matrix = gate_matrix.astype(self.dtype, copy=False)
+        if len(qubits) == 1:
+            site = qubits[0]
+            self.tensors[site] = np.einsum(
+                "ij,ajb->aib", gate_matrix, self.tensors[site]
+            )
+            return
+        if len(qubits) != 2:
+            raise ValueError("MPSSimulator supports gates on at most two qubits.")
+        low, high = sorted(qubits)
+        matrix = reorder_matrix(gate_matrix, qubits, [low, high])
+        self._route(low, high)
+        self._apply_adjacent(matrix, low)
+        self._unroute(low, high)
+
+    def _route(self, low: int, high: int):
+        # SWAP qubit ``high`` leftwards until it sits on site low + 1
+        for site in range(high - 1, low, -1):
+            self._apply_adjacent(SWAP_MATRIX, site)
+
+    def _unroute(self, low: int, high: int):
+        for site in range(low + 1, high):
+            self._apply_adjacent(SWAP_MATRIX, site)
+
+    def _apply_adjacent(self, matrix: np.ndarray, site: int):
+        # Contract sites (site, site + 1), apply the gate (site is the most significant
+        # bit of ``matrix``) and split by truncated SVD; the center ends on site + 1
+        self._move_center(site)
+        left, right = self.tensors[site], self.tensors[site + 1]
+        pair = np.einsum("aib,bjc->aijc", left, right)
+        matrix = matrix.astype(self.dtype, copy=False).reshape(2, 2, 2, 2)
+        pair = np.einsum("ijkl,aklc->aijc", matrix, pair)
+        bond_left, bond_right = left.shape[0], right.shape[2]
+        u, s, vh = np.linalg.svd(
+            pair.reshape(bond_left * 2, 2 * bond_right), full_matrices=False
+        )
+        weights = s**2
+        total = weights.sum()
+        keep = len(s)
+        if total > 0:
+            # Drop the smallest values while their total weight stays within the cutoff
+            discarded = np.cumsum(weights[::-1])
+            keep = len(s) - int(
+                np.searchsorted(discarded, self.cutoff * total, "right")
+            )
+        if self.max_bond_dimension is not None:
+            keep = min(keep, self.max_bond_dimension)
+        keep = max(keep, 1)
+        kept = weights[:keep].sum()
+        if total > 0 and keep < len(s):
+            self.truncation_error += float((total - kept) / total)
+            s = s[:keep] * np.sqrt(total / kept)  # keep the state normalized
+        else:
+            s = s[:keep]
+        self.tensors[site] = u[:, :keep].reshape(bond_left, 2, keep)
+        self.tensors[site + 1] = (s[:, None] * vh[:keep]).reshape(keep, 2, bond_right)
+        self._center = site + 1
+
+    def _move_center(self, site: int):
+        # QR sweeps: tensors left of the center are left-canonical, right of it
+        # right-canonical
+        while self._center < site:
+            tensor = self.tensors[self._center]
+            bond_left, _, bond_right = tensor.shape
+            q, r = np.linalg.qr(tensor.reshape(bond_left * 2, bond_right))
+            self.tensors[self._center] = q.reshape(bond_left, 2, q.shape[1])
+            self.tensors[self._center + 1] = np.einsum(
+                "ab,bjc->ajc", r, self.tensors[self._center + 1]
+            )
+            self._center += 1
+        while self._center > site:
+            tensor = self.tensors[self._center]
+            bond_left, _, bond_right = tensor.shape
+            q, r = np.linalg.qr(tensor.reshape(bond_left, 2 * bond_right).T)
+            self.tensors[self._center] = q.T.reshape(q.shape[1], 2, bond_right)
+            self.tensors[self._center - 1] = np.einsum(
+                "aib,bc->aic", self.tensors[self._center - 1], r.T
+            )
+            self._center -= 1
@@ -0,0 +1,569 @@
+import os
+import shutil
+import tempfile
+import time
+import weakref
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+from src.models.PauliSum import PauliSum, _parity_sum, pauli_qubits
+from src.models.gates.matrices import complex_dtype, gate_matrix
+from src.simulator.kernels import (
+    apply_diagonal,
+    apply_matrix,
+    controlled_matrix,
+    grouped_shape,
+)
+from src.simulator.memory import check_allocation, format_bytes
+from src.simulator.qestkit_simulator import QuantumSimulator
+from src.simulator.sampling import sample_counts
+
+# Target size of one block of amplitudes moved between the file and memory: large
+# enough for long sequential reads, small enough to stay cheap in RAM
+BLOCK_BYTES = 1 << 26
+
+
+def _remove_file(path: str):
+    # Finalizer of a temporary amplitude file; it may already be gone
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
+class PassIO:
+    """
+    One sweep over the amplitude file, applying a group of gates to every block.
+
+    Attributes:
+        gates (list): (name, qubits) of each gate applied in the pass, in order.
+        high_qubits (list): Qubits above the block whose blocks were loaded together.
+        bytes_read (int): Bytes copied from the file into memory.
+        bytes_written (int): Bytes copied from memory back to the file.
+        seconds (float): Wall time of the pass.
+    """
+
+    def __init__(
+        self,
+        gates: List[Tuple[str, List[int]]],
+        high_qubits: List[int],
+        bytes_read: int,
+        bytes_written: int,
+        seconds: float,
+    ):
+        self.gates = gates
+        self.high_qubits = high_qubits
+        self.bytes_read = bytes_read
+        self.bytes_written = bytes_written
+        self.seconds = seconds
+
+    @property
+    def bytes_per_gate(self) -> float:
+        """Read plus written bytes, shared evenly by the gates of the pass."""
+        return (self.bytes_read + self.bytes_written) / max(len(self.gates), 1)
+
+    def __repr__(self):
+        return (
+            f"PassIO(gates={len(self.gates)}, high_qubits={self.high_qubits}, "
+            f"read={format_bytes(self.bytes_read)}, "
+            f"written={format_bytes(self.bytes_written)}, seconds={self.seconds:.3f})"
+        )
+
+
+def schedule_passes(
+    gate_qubits: Sequence[Sequence[int]], block_qubits: int, max_high_qubits: int
+) -> List[List[int]]:
+    """
+    Groups gates into passes over a blocked state, so that each pass touches at most
+    ``max_high_qubits`` qubits above the block (a pass loads 2^h blocks at a time).
+
+    Gates are scanned in order; a gate joins the current pass unless it shares a
+    qubit with a gate already deferred to a later pass (then it must stay behind
+    it) or it would widen the pass past ``max_high_qubits``. A gate only ever moves
+    ahead of gates on disjoint qubits, with which it commutes, so the result is the
+    same state. The first gate of a pass is always taken, however wide.
+
+    Args:
+        gate_qubits (Sequence[Sequence[int]]): The qubits of each gate, in order.
+        block_qubits (int): Qubits inside one block (the low qubits).
+        max_high_qubits (int): Largest number of high qubits one pass may touch.
+
+    Returns:
+        list: The gate indices of each pass, in execution order.
+    """
+    remaining = list(range(len(gate_qubits)))
+    passes = []
+    while remaining:
+        members: List[int] = []
+        deferred: List[int] = []
+        high: set = set()
+        blocked: set = set()
+        for index in remaining:
+            qubits = set(gate_qubits[index])
+            wider = high | {q for q in qubits if q >= block_qubits}
+            if not members or (not qubits & blocked and len(wider) <= max_high_qubits):
+                members.append(index)
+                high = wider
+            else:
+                deferred.append(index)
+                blocked |= qubits
+        passes.append(members)
+        remaining = deferred
+    return passes
+
+
+class OutOfCoreSimulator(QuantumSimulator):
+    """
+    State-vector simulator whose 2^n amplitudes live in a file mapped with
+    ``np.memmap``, for states larger than RAM (32-34 qubits are 64-256 GiB).
+
+    The file is a sequence of blocks of 2^b contiguous amplitudes (b low qubits,
+    BLOCK_BYTES per block by default). A gate on low qubits only is applied block by
+    block; a gate on h qubits above the block loads the 2^h blocks that differ in
+    those qubits into memory together and applies the gate to them as one
+    (b + h)-qubit state. ``apply_circuit`` groups the gates into as few passes over
+    the file as it can (see ``schedule_passes``): every gate of a pass is applied to
+    a group of blocks while it is in memory, so a layer of gates costs one read and
+    one write of the file instead of one per gate. Each pass is recorded in
+    ``io_log`` (``io_per_gate`` splits it by gate).
+
+    Sampling, marginal probabilities and Pauli expectation values stream over the
+    file one block (or pair of blocks) at a time.
+
+    The file is temporary unless ``path`` is given: it is removed by ``close``, or
+    when the simulator is garbage-collected without being closed. Use the simulator
+    as a context manager to close it.
+    """
+
+    def __init__(
+        self,
+        num_qubits: int,
+        path: Optional[str] = None,
+        directory: Optional[str] = None,
+        rng: Optional[np.random.Generator] = None,
+        precision: str = "double",
+        block_qubits: Optional[int] = None,
+        max_high_qubits: int = 2,
+        num_threads: int = 1,
+    ):
+        """
+        Args:
+            num_qubits (int): Number of qubits n.
+            path (str, optional): File holding the amplitudes, created (or truncated)
+                here and kept after ``close``. Defaults to a temporary file.
+            directory (str, optional): Where the temporary file is created.
+            rng (np.random.Generator, optional): Random generator for sampling.
+            precision (str, optional): "double" (complex128) or "single" (complex64).
+            block_qubits (int, optional): Qubits per block (at least 1); defaults to
+                the largest block of at most BLOCK_BYTES.
+            max_high_qubits (int, optional): Qubits above the block one pass may
+                touch; a pass holds 2^(b + h) amplitudes (twice) in memory.
+            num_threads (int, optional): Worker threads for the gate kernels.
+
+        Raises:
+            ValueError: If ``block_qubits`` is less than 1.
+            MemoryError: If the in-memory buffers do not fit.
+            OSError: If the file system has no room for the amplitudes.
+        """
+        self.num_qubits = num_qubits
+        self.rng = rng if rng is not None else np.random.default_rng()
+        self.dtype = complex_dtype(precision)
+        if block_qubits is None:
+            block_qubits = (BLOCK_BYTES // self.dtype.itemsize).bit_length() - 1
+        elif block_qubits < 1:
+            raise ValueError(f"block_qubits must be at least 1, got {block_qubits}.")
+        self.block_qubits = min(block_qubits, num_qubits)
+        self.max_high_qubits = max_high_qubits
+        self.num_threads = num_threads
+        self.io_log: List[PassIO] = []
+
+        self.nbytes = self.dtype.itemsize << num_qubits
+        buffer_qubits = min(self.block_qubits + max_high_qubits, num_qubits)
+        check_allocation(
+            2 * self.dtype.itemsize << buffer_qubits,
+            f"The block buffers of {buffer_qubits} qubits",
+        )
+        self._temporary = path is None
+        if path is None:
+            handle, path = tempfile.mkstemp(
+                prefix="qestkit-", suffix=".amp", dir=directory
+            )
+            os.close(handle)
+        free = shutil.disk_usage(os.path.dirname(os.path.abspath(path))).free
+        if self.nbytes > free:
+            if self._temporary:
+                os.remove(path)
+            raise OSError(
+                f"A {num_qubits}-qubit state needs {format_bytes(self.nbytes)} on disk, "
+                f"but only {format_bytes(free)} is free."
+            )
+        self.path = path
+        self._finalizer = (
+            weakref.finalize(self, _remove_file, path) if self._temporary else None
+        )
+        # A new file reads as zeros, so only the first amplitude needs writing
+        self.amplitudes = np.memmap(
+            path, dtype=self.dtype, mode="w+", shape=1 << num_qubits
+        )
+        self.amplitudes[0] = 1
+        self._buffers = None
+
+    @property
+    def num_blocks(self) -> int:
+        return 1 << (self.num_qubits - self.block_qubits)
+
+    def _block(self, index: int) -> np.ndarray:
+        size = 1 << self.block_qubits
+        return self.amplitudes[index * size : (index + 1) * size]
+
+    def reset(self):
+        # |0...0⟩, written block by block
+        for index in range(self.num_blocks):
+            self._block(index).fill(0)
+        self.amplitudes[0] = 1
+        self.circuit_position = 0
+
+    def get_num_qubits(self) -> int:
+        return self.num_qubits
+
+    def apply_gate(
+        self,
+        gate_name: str,
+        targets: Union[int, List[int]],
+        controls: Optional[Union[int, List[int]]] = None,
+        params: Optional[List[float]] = None,
+    ):
+        matrix = gate_matrix(gate_name, params, self.dtype)
+        self._run(
+            [
+                (gate_name, *operation)
+                for operation in self._operations(matrix, targets, controls)
+            ]
+        )
+
+    def apply_custom_gate(
+        self,
+        gate_matrix: np.ndarray,
+        targets: Union[int, List[int]],
+        controls: Optional[Union[int, List[int]]] = None,
+    ):
+        self._run(
+            [
+                ("custom", *operation)
+                for operation in self._operations(gate_matrix, targets, controls)
+            ]
+        )
+
+    def apply_circuit(self, circuit: Any):
+        """
+        Applies the circuit's gates in as few passes over the file as the pass width
+        allows, reordering gates on disjoint qubits (see ``schedule_passes``).
+        """
+        operations = []
+        for gate in circuit.gates:
+            for operation in self._operations(gate.matrix, gate.qubits, None):
+                operations.append((gate.name, *operation))
+        self._run(operations)
+
+    def _operations(
+        self,
+        matrix: np.ndarray,
+        targets: Union[int, List[int]],
+        controls: Optional[Union[int, List[int]]],
+    ) -> List[Tuple[np.ndarray, List[int]]]:
+        # Same semantics as the other backends: a 2x2 matrix is broadcast over every
+        # target and controls are prepended as the most significant qubits
+        if isinstance(targets, int):
+            targets = [targets]
+        if controls is None:
+            controls = []
+        elif isinstance(controls, int):
+            controls = [controls]
+        if matrix.shape == (2, 2) and len(targets) > 1:
+            groups = [[target] for target in targets]
+        else:
+            groups = [list(targets)]
+        matrix = controlled_matrix(matrix, len(controls)).astype(self.dtype, copy=False)
+        operations = []
+        for group in groups:
+            qubits = list(controls) + group
+            if any(q >= self.num_qubits or q < 0 for q in qubits):
+                raise ValueError(
+                    f"Invalid qubit indices {qubits} for a system with {self.num_qubits} qubits."
+                )
+            operations.append((matrix, qubits))
+        return operations
+
+    def _run(self, operations: List[Tuple[str, np.ndarray, List[int]]]):
+        passes = schedule_passes(
+            [qubits for _, _, qubits in operations],
+            self.block_qubits,
+            self.max_high_qubits,
+        )
+        for members in passes:
+            self._apply_pass([operations[index] for index in members])
+
+    def _buffer_pair(self, size: int) -> Tuple[np.ndarray, np.ndarray]:
+        # Two reusable in-memory buffers, grown to the widest pass seen so far
+        if self._buffers is None or self._buffers[0].size < size:
+            self._buffers = (
+                np.empty(size, dtype=self.dtype),
+                np.empty(size, dtype=self.dtype),
+            )
+        return self._buffers[0][:size], self._buffers[1][:size]
+
+    def _apply_pass(self, operations: List[Tuple[str, np.ndarray, List[int]]]):
+        start = time.perf_counter()
+        b = self.block_qubits
+        high = sorted({q for _, _, qubits in operations for q in qubits if q >= b})
+        # High qubit high[i] becomes qubit b + i of the in-memory group of blocks
+        local = {q: b + i for i, q in enumerate(high)}
+        local_qubits = b + len(high)
+        steps = []
+        for _, matrix, qubits in operations:
+            diagonal = np.diagonal(matrix)
+            is_diagonal = np.count_nonzero(matrix) == np.count_nonzero(diagonal)
+            steps.append(
+                (
+                    diagonal if is_diagonal else None,
+                    matrix,
+                    [local.get(q, q) for q in qubits],
+                )
+            )
+
+        # Block j of a group is the base block plus the high bits of j
+        offsets = np.zeros(1 << len(high), dtype=np.int64)
+        for i, q in enumerate(high):
+            offsets[1 << i : 2 << i] = offsets[: 1 << i] + (1 << (q - b))
+        high_mask = sum(1 << (q - b) for q in high)
+        size = 1 << b
+        state, scratch = self._buffer_pair(size << len(high))
+        groups = state.reshape(-1, size)
+        for base in range(self.num_blocks):
+            if base & high_mask:
+                continue
+            for j, offset in enumerate(offsets):
+                np.copyto(groups[j], self._block(base + int(offset)))
+            for diagonal, matrix, qubits in steps:
+                if diagonal is not None:
+                    apply_diagonal(
+                        state, diagonal, qubits, local_qubits, threads=self.num_threads
+                    )
+                    continue
+                apply_matrix(
+                    state,
+                    matrix,
+                    qubits,
+                    local_qubits,
+                    out=scratch,
+                    overwrite_input=True,
+                    threads=self.num_threads,
+                )
+                state, scratch = scratch, state
+            groups = state.reshape(-1, size)
+            for j, offset in enumerate(offsets):
+                np.copyto(self._block(base + int(offset)), groups[j])
+        self.io_log.append(
+            PassIO(
+                [(name, list(qubits)) for name, _, qubits in operations],
+                high,
+                self.nbytes,
+                self.nbytes,
+                time.perf_counter() - start,
+            )
+        )
+
+    def io_per_gate(self) -> List[Dict[str, Any]]:
+        """
+        I/O volume of every gate applied so far, in execution order: each gate's
+        share of the bytes its pass moved between the file and memory.
+        """
+        return [
+            {
+                "name": name,
+                "qubits": qubits,
+                "pass": index,
+                "bytes": record.bytes_per_gate,
+            }
+            for index, record in enumerate(self.io_log)
+            for name, qubits in record.gates
+        ]
+
+    @property
+    def bytes_read(self) -> int:
+        return sum(record.bytes_read for record in self.io_log)
+
+    @property
+    def bytes_written(self) -> int:
+        return sum(record.bytes_written for record in self.io_log)
+
+    def block_probabilities(self) -> np.ndarray:
+        """Total probability of each block, from one streaming pass."""
+        totals = np.empty(self.num_blocks)
+        for index in range(self.num_blocks):
+            block = self._block(index)
+            totals[index] = np.real(np.vdot(block, block))
+        return totals
+
+    def sample_counts(
+        self, shots: int, rng: Optional[np.random.Generator] = None
+    ) -> Dict[str, int]:
+        """
+        Samples measurement outcomes without loading the state: one pass sums the
+        probability of every block, a multinomial splits the shots over the blocks,
+        and only blocks that received shots are read again to sample within them.
+        """
+        rng = rng if rng is not None else self.rng
+        if shots <= 0:
+            return {}
+        totals = self.block_probabilities()
+        per_block = rng.multinomial(shots, totals / totals.sum())
+        width = self.num_qubits - self.block_qubits
+        counts = {}
+        for index in np.flatnonzero(per_block):
+            block = self._block(int(index))
+            if self.block_qubits == 0:
+                # A 0-qubit register: the block index is the whole outcome
+                local = {"": int(per_block[index])}
+            else:
+                local = sample_counts(
+                    np.abs(block) ** 2, int(per_block[index]), self.block_qubits, rng
+                )
+            prefix = format(int(index), f"0{width}b") if width else ""
+            for bitstring, count in local.items():
+                counts[prefix + bitstring] = count
+        return counts
+
+    def marginal_probabilities(self, qubits: Sequence[int]) -> np.ndarray:
+        """
+        Probabilities of the 2^k outcomes of ``qubits`` (the first listed qubit is the
+        most significant bit of the outcome index), in one streaming pass.
+        """
+        qubits = list(qubits)
+        if any(q >= self.num_qubits or q < 0 for q in qubits) or len(
+            set(qubits)
+        ) != len(qubits):
+            raise ValueError(
+                f"Invalid qubit indices {qubits} for a system with {self.num_qubits} qubits."
+            )
+        b = self.block_qubits
+        k = len(qubits)
+        low = [q for q in qubits if q < b]
+        high = [(i, q) for i, q in enumerate(qubits) if q >= b]
+        marginal = np.zeros((2,) * k)
+        # Sum each block over the qubits not asked for; the remaining axes follow
+        # descending qubit order and are permuted into the order of ``low``
+        shape, axes = grouped_shape(b, low)
+        others = tuple(axis for axis in range(len(shape)) if axis not in axes)
+        order = np.argsort(np.argsort(axes)) if low else []
+        selector: List[Any] = [slice(None)] * k
+        for index in range(self.num_blocks):
+            probabilities = np.abs(self._block(index)) ** 2
+            reduced = probabilities.reshape(shape).sum(axis=others)
+            if low:
+                reduced = reduced.reshape((2,) * len(low)).transpose(order)
+            for i, q in high:
+                selector[i] = (index >> (q - b)) & 1
+            marginal[tuple(selector)] += reduced
+        return marginal.reshape(-1)
+
+    def run(
+        self,
+        circuit: Any,
+        shots: int = 1024,
+        rng: Optional[np.random.Generator] = None,
+    ) -> Dict[str, int]:
+        # Execute the circuit from |0...0⟩ (if given), then sample by streaming
+        if circuit is not None:
+            self.reset()
+            self.apply_circuit(circuit)
+        return self.sample_counts(shots, rng)
+
+    def calculate_expectation_value(
+        self, observable: PauliSum, state_vector: Optional[np.ndarray] = None
+    ) -> float:
+        """
+        <psi|O|psi> for a PauliSum, streamed block by block: each x-mask group reads
+        the file once (twice when X flips qubits above the block, which pairs every
+        block with a partner).
+        """
+        if not isinstance(observable, PauliSum) or state_vector is not None:
+            raise ValueError(
+                "The out-of-core simulator evaluates PauliSum observables only."
+            )
+        if observable.num_qubits != self.num_qubits:
+            raise ValueError(
+                f"Observable on {observable.num_qubits} qubits does not match "
+                f"{self.num_qubits} qubits."
+            )
+        b = self.block_qubits
+        low_mask = (1 << b) - 1
+        total = 0j
+        for x, (z_masks, coefficients) in observable.groups().items():
+            x_low, x_high = x & low_mask, x >> b
+            terms = [
+                (z & low_mask, z >> b, coefficient)
+                for z, coefficient in zip(z_masks, coefficients)
+            ]
+            if x_low:
+                shape, axes = grouped_shape(b, pauli_qubits(x_low))
+            for index in range(self.num_blocks):
+                block = self._block(index)
+                partner = self._block(index ^ x_high) if x_high else block
+                if x_low:
+                    partner = np.flip(partner.reshape(shape), axis=axes).reshape(-1)
+                products = np.conj(partner) * block
+                for z_low, z_high, coefficient in terms:
+                    sign = -1 if (index & z_high).bit_count() % 2 else 1
+                    total += sign * coefficient * _parity_sum(products, z_low, b)
+        return float(total.real)
+
+    def _snapshot_state(self):
+        options = {
+            "block_qubits": self.block_qubits,
+            "max_high_qubits": self.max_high_qubits,
+            "num_threads": self.num_threads,
+        }
+        return options, {"amplitudes": self.amplitudes}
+
+    @classmethod
+    def _from_snapshot(cls, snapshot, rng, noise_model):
+        # The amplitudes must live in a writable file of their own (a copy-on-write
+        # map would pull every modified page into RAM), so they are copied block by
+        # block into a new temporary file
+        if noise_model is not None:
+            raise ValueError("The out-of-core simulator does not take a noise model.")
+        simulator = cls(
+            snapshot.num_qubits,
+            rng=rng,
+            precision=snapshot.precision,
+            **snapshot.options,
+        )
+        source = snapshot.array("amplitudes")
+        size = 1 << simulator.block_qubits
+        for index in range(simulator.num_blocks):
+            np.copyto(
+                simulator._block(index), source[index * size : (index + 1) * size]
+            )
+        return simulator
+
+    def flush(self):
+        """Writes modified pages of the amplitude file to disk."""
+        self.amplitudes.flush()
+
+    def close(self):
+        """Unmaps the amplitude file and removes it if it is temporary."""
+        if self.amplitudes is None:
+            return
+        self.amplitudes.flush()
+        self.amplitudes = None
+        self._buffers = None
+        if self._finalizer is not None:
+            # Removes the file now and detaches the finalizer
+            self._finalizer()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
@@ -1,9 +1,28 @@
 from abc import ABC, abstractmethod
 from typing import List, Dict, Union, Optional, Tuple, Any
 import numpy as np
+from src.simulator.snapshot import Snapshot, write_snapshot
+
+
+class _CircuitRange:
+    # Gates start..stop of a circuit, for the apply_circuit of any backend
+    def __init__(self, circuit: Any, start: int, stop: int):
+        self.circuit = circuit
+        self.qubits = circuit.qubits
+        self.start = start
+        self.stop = stop
+
+    @property
+    def gates(self):
+        gates = self.circuit.gates
+        for index in range(self.start, self.stop):
+            yield gates[index]
 
 
 class QuantumSimulator(ABC):
+    # Gates of the circuit being resumed that the state already includes
+    circuit_position = 0
+
     @abstractmethod
     def run(self, circuit: Any, shots: int = 1024) -> Dict[str, int]:
         pass
@@ -35,6 +54,84 @@ class QuantumSimulator(ABC):
     ):
         pass
 
+    def apply_circuit(self, circuit: Any):
+        """
+        Applies every gate of a QuantumCircuit, in order, using the gate's registry
+        matrix on its qubits (e.g. CNOT's 4x4 matrix on [control, target]).
+        """
+        for gate in circuit.gates:
+            self.apply_custom_gate(gate.matrix, gate.qubits)
+
+    def resume(self, circuit: Any, stop: Optional[int] = None):
+        """
+        Applies gates ``circuit_position`` to ``stop`` (default: the end) of the
+        circuit and advances ``circuit_position`` to ``stop``. Calling it in steps,
+        with a snapshot after each, checkpoints a long run; after ``restore`` it
+        continues the circuit where the snapshot was taken.
+        """
+        if stop is None:
+            stop = len(circuit.gates)
+        if not self.circuit_position <= stop <= len(circuit.gates):
+            raise ValueError(
+                f"Cannot resume from gate {self.circuit_position} to gate {stop} of a "
+                f"{len(circuit.gates)}-gate circuit."
+            )
+        self.apply_circuit(_CircuitRange(circuit, self.circuit_position, stop))
+        self.circuit_position = stop
+
+    def snapshot(self, path: str, position: Optional[int] = None):
+        """
+        Writes the state, circuit position, RNG state, precision and backend options
+        to a versioned binary snapshot file (see ``restore``).
+
+        Args:
+            path (str): Destination file, replaced atomically.
+            position (int, optional): Circuit gates the state includes. Defaults to
+                ``circuit_position``.
+        """
+        write_snapshot(
+            path, self, self.circuit_position if position is None else position
+        )
+
+    @classmethod
+    def restore(
+        cls,
+        path: str,
+        rng: Optional[np.random.Generator] = None,
+        noise_model: Optional[Any] = None,
+    ) -> "QuantumSimulator":
+        """
+        Rebuilds a simulator from a snapshot file. The state is memory-mapped
+        copy-on-write, not copied, and the file is never modified, so a prefix can
+        be restored any number of times (open it once with ``Snapshot`` to skip
+        re-reading the header). Continue with ``resume(circuit)``.
+
+        Args:
+            path (str): A file written by ``snapshot``.
+            rng (np.random.Generator, optional): Generator of the continuation.
+                Defaults to the saved generator state; pass distinct ones to branch.
+            noise_model (NoiseModel, optional): Noise of the continuation.
+
+        Returns:
+            QuantumSimulator: A simulator of the class the snapshot was taken from.
+        """
+        snapshot = Snapshot(path)
+        if cls is not QuantumSimulator and snapshot.simulator != cls.__name__:
+            raise ValueError(
+                f"Snapshot holds a {snapshot.simulator}, not a {cls.__name__}."
+            )
+        return snapshot.restore(rng, noise_model)
+
+    def _snapshot_state(self) -> Tuple[Dict[str, Any], Dict[str, np.ndarray]]:
+        # Backend options (JSON values) and the arrays holding the state
+        raise NotImplementedError(f"{type(self).__name__} does not support snapshots.")
+
+    @classmethod
+    def _from_snapshot(
+        cls, snapshot: Snapshot, rng: np.random.Generator, noise_model: Any
+    ) -> "QuantumSimulator":
+        raise NotImplementedError(f"{cls.__name__} does not support snapshots.")
+
     @abstractmethod
     def calculate_expectation_value(
         self, observable: np.ndarray, state_vector: np.ndarray
@@ -0,0 +1,71 @@
+import numpy as np
+from typing import Dict, Optional
+
+
+def normalized_probabilities(probabilities: np.ndarray) -> np.ndarray:
+    """
+    Clips the rounding noise of a probability vector (tiny negative entries, a total
+    slightly off 1) so it can be handed to the NumPy samplers.
+    """
+    probabilities = np.clip(np.asarray(probabilities, dtype=np.float64), 0.0, None)
+    total = probabilities.sum()
+    if total <= 0:
+        raise ValueError("Cannot sample from a state with zero total probability.")
+    return probabilities / total
+
+
+def sample_indices(
+    probabilities: np.ndarray, shots: int, rng: np.random.Generator
+) -> np.ndarray:
+    """
+    Draws ``shots`` basis-state indices in one vectorized call.
+
+    Returns:
+        numpy.ndarray: The sampled indices (unsorted), one per shot.
+    """
+    cumulative = np.cumsum(normalized_probabilities(probabilities))
+    samples = np.searchsorted(cumulative, rng.random(shots), side="right")
+    # Guard against a final cumulative value that rounds to just below 1.0
+    return np.minimum(samples, len(cumulative) - 1)
+
+
+def sample_counts(
+    probabilities: np.ndarray,
+    shots: int,
+    num_qubits: int,
+    rng: Optional[np.random.Generator] = None,
+) -> Dict[str, int]:
+    """
+    Samples measurement outcomes and returns counts for the outcomes that occurred.
+
+    A single multinomial draw is used when there are at least as many shots as basis
+    states; otherwise the shots are drawn by inverse-CDF search, which does not touch
+    every basis state per shot. Bitstrings are only formatted for observed outcomes,
+    with qubit 0 as the rightmost character.
+
+    Args:
+        probabilities (numpy.ndarray): Probability of each of the 2^n basis states.
+        shots (int): Number of measurement shots.
+        num_qubits (int): Number of qubits n, used as the bitstring width.
+        rng (numpy.random.Generator, optional): Source of randomness. Defaults to a fresh
+            unseeded generator.
+
+    Returns:
+        dict: Mapping of bitstring to number of occurrences, without zero entries.
+    """
+    if rng is None:
+        rng = np.random.default_rng()
+    if shots <= 0:
+        return {}
+    if shots >= len(probabilities):
+        counts = rng.multinomial(shots, normalized_probabilities(probabilities))
+        indices = np.flatnonzero(counts)
+        counts = counts[indices]
+    else:
+        indices, counts = np.unique(
+            sample_indices(probabilities, shots, rng), return_counts=True
+        )
+    return {
+        format(int(index), f"0{num_qubits}b"): int(count)
+        for index, count in zip(indices, counts)
+    }
@@ -0,0 +1,210 @@
+import importlib
+import json
+import os
+import struct
+import tempfile
+from typing import Any, Optional
+
+import numpy as np
+from src.models.gates.matrices import PRECISIONS
+
+# Simulation snapshot file, little-endian:
+#
+#   header     magic, format version, flags (reserved), length of the metadata
+#   metadata   UTF-8 JSON: simulator class, qubits, precision, circuit position,
+#              RNG state, backend options and the layout of every array
+#   arrays     raw C-order data, each aligned to _ALIGNMENT bytes (a page), so they
+#              are memory-mapped in place on restore
+SNAPSHOT_MAGIC = b"QESTSNAP"
+SNAPSHOT_VERSION = 1
+_HEADER = struct.Struct("<8sIIQ")
+_ALIGNMENT = 4096
+# Bytes written per call, so huge (e.g. memory-mapped) arrays are never copied whole
+_WRITE_CHUNK = 1 << 26
+
+# Module of each simulator class that can be restored
+_SIMULATORS = {
+    "StateVectorSimulator": "src.simulator.sv_simulator",
+    "DensityMatrixSimulator": "src.simulator.dm_simulator",
+    "MPSSimulator": "src.simulator.mps_simulator",
+    "StabilizerSimulator": "src.simulator.stabilizer_simulator",
+    "OutOfCoreSimulator": "src.simulator.out_of_core_simulator",
+}
+
+
+def _aligned(position: int) -> int:
+    return -(-position // _ALIGNMENT) * _ALIGNMENT
+
+
+def write_snapshot(path: str, simulator: Any, position: int) -> None:
+    """
+    Writes a simulator's state to a snapshot file (see QuantumSimulator.snapshot).
+
+    The file is written next to ``path`` under a temporary name and renamed into
+    place, so a run pre-empted while writing leaves any earlier snapshot intact.
+
+    :param path: Destination file.
+    :param simulator: A simulator implementing ``_snapshot_state``.
+    :param position: Number of circuit gates the state already includes.
+    """
+    options, arrays = simulator._snapshot_state()
+    dtype = getattr(simulator, "dtype", None)
+    metadata = {
+        "simulator": type(simulator).__name__,
+        "num_qubits": simulator.num_qubits,
+        "precision": (
+            None
+            if dtype is None
+            else next(name for name, value in PRECISIONS.items() if value == dtype)
+        ),
+        "position": position,
+        "rng": simulator.rng.bit_generator.state,
+        "options": options,
+        "arrays": [],
+    }
+    # The metadata records the offsets, which depend on its own length: lay the
+    # arrays out after a generous estimate, then pad the metadata to fill it
+    layout = {
+        name: (np.dtype(array.dtype).str, list(array.shape))
+        for name, array in arrays.items()
+    }
+    estimate = len(json.dumps(metadata)) + 128 * (len(arrays) + 1)
+    offset = _aligned(_HEADER.size + estimate)
+    for name, (dtype_code, shape) in layout.items():
+        metadata["arrays"].append(
+            {"name": name, "dtype": dtype_code, "shape": shape, "offset": offset}
+        )
+        offset = _aligned(offset + arrays[name].nbytes)
+    encoded = json.dumps(metadata).encode("utf-8")
+    if arrays and _HEADER.size + len(encoded) > metadata["arrays"][0]["offset"]:
+        raise ValueError("Snapshot metadata is too large for its reserved space.")
+
+    directory = os.path.dirname(os.path.abspath(path))
+    handle, temporary = tempfile.mkstemp(dir=directory, prefix=".tmp-", suffix=".snap")
+    try:
+        with os.fdopen(handle, "wb") as output:
+            output.write(
+                _HEADER.pack(SNAPSHOT_MAGIC, SNAPSHOT_VERSION, 0, len(encoded))
+            )
+            output.write(encoded)
+            for entry in metadata["arrays"]:
+                output.write(b"\x00" * (entry["offset"] - output.tell()))
+                data = np.ascontiguousarray(arrays[entry["name"]]).reshape(-1)
+                data = data.view(np.uint8)
+                for start in range(0, data.size, _WRITE_CHUNK):
+                    output.write(data[start : start + _WRITE_CHUNK])
+        os.replace(temporary, path)
+    except BaseException:
+        if os.path.exists(temporary):
+            os.remove(temporary)
+        raise
+
+
+class Snapshot:
+    """
+    A snapshot file opened for restoring: the header and metadata are read once,
+    and every ``restore`` maps the state arrays copy-on-write (mode "c"). Nothing is
+    copied up front; pages are read on first access, and a page the continuation
+    modifies becomes private to it. The file never changes, so any number of
+    continuations can start from one snapshot, one after another or side by side.
+
+    Attributes:
+        path (str): The snapshot file.
+        version (int): Format version it was written with.
+        simulator (str): Class name of the simulator it holds.
+        num_qubits (int): Register size.
+        precision (str | None): "double" or "single" (None for the stabilizer
+            tableau, which holds exact bits).
+        position (int): Circuit gates the state already includes.
+        options (dict): Backend options (bond cap, renormalization, ...).
+    """
+
+    def __init__(self, path: str):
+        """
+        :param path: A file written by ``QuantumSimulator.snapshot``.
+        :raises ValueError: If the file is not a snapshot, has an unsupported version
+            or is truncated.
+        """
+        with open(path, "rb") as source:
+            header = source.read(_HEADER.size)
+            if len(header) < _HEADER.size:
+                raise ValueError("File is too short to be a simulation snapshot.")
+            magic, version, _, length = _HEADER.unpack(header)
+            if magic != SNAPSHOT_MAGIC:
+                raise ValueError("Not a simulation snapshot (bad magic number).")
+            if version != SNAPSHOT_VERSION:
+                raise ValueError(
+                    f"Unsupported snapshot version {version}; expected {SNAPSHOT_VERSION}."
+                )
+            metadata = json.loads(source.read(length).decode("utf-8"))
+        size = os.path.getsize(path)
+        self._arrays = {}
+        for entry in metadata["arrays"]:
+            dtype = np.dtype(entry["dtype"])
+            end = entry["offset"] + dtype.itemsize * int(np.prod(entry["shape"]))
+            if end > size:
+                raise ValueError(
+                    f"Corrupt snapshot: array {entry['name']} is truncated."
+                )
+            self._arrays[entry["name"]] = (
+                dtype,
+                tuple(entry["shape"]),
+                entry["offset"],
+            )
+        self.path = path
+        self.version = version
+        self.simulator = metadata["simulator"]
+        self.num_qubits = metadata["num_qubits"]
+        self.precision = metadata["precision"]
+        self.position = metadata["position"]
+        self.options = metadata["options"]
+        self._rng_state = metadata["rng"]
+
+    @property
+    def array_names(self):
+        return list(self._arrays)
+
+    def array(self, name: str) -> np.ndarray:
+        """A fresh copy-on-write memory map of one state array."""
+        dtype, shape, offset = self._arrays[name]
+        if 0 in shape:
+            return np.zeros(shape, dtype=dtype)
+        return np.memmap(self.path, dtype=dtype, mode="c", offset=offset, shape=shape)
+
+    def rng(self) -> np.random.Generator:
+        """A generator in the state the simulator's generator had at snapshot time."""
+        bit_generator = getattr(np.random, self._rng_state["bit_generator"])()
+        bit_generator.state = self._rng_state
+        return np.random.Generator(bit_generator)
+
+    def restore(
+        self,
+        rng: Optional[np.random.Generator] = None,
+        noise_model: Any = None,
+    ) -> Any:
+        """
+        Builds a simulator holding the snapshot state, positioned after
+        ``position`` gates; continue it with ``resume(circuit)``.
+
+        :param rng: Random generator of the continuation. Defaults to the generator
+            state saved in the snapshot, so a restored run draws exactly what the
+            original would have; pass distinct generators to branch.
+        :param noise_model: Noise model of the continuation (noise models are not
+            stored in snapshots). Only for backends that take one.
+        :return: A simulator of the class the snapshot was taken from.
+        """
+        module = _SIMULATORS.get(self.simulator)
+        if module is None:
+            raise ValueError(f"Unknown simulator {self.simulator} in snapshot.")
+        cls = getattr(importlib.import_module(module), self.simulator)
+        simulator = cls._from_snapshot(
+            self, rng if rng is not None else self.rng(), noise_model
+        )
+        simulator.circuit_position = self.position
+        return simulator
+
+    def __repr__(self):
+        return (
+            f"Snapshot(simulator={self.simulator}, num_qubits={self.num_qubits}, "
+            f"precision={self.precision}, position={self.position})"
+        )
@@ -0,0 +1,405 @@
+import numpy as np
+from typing import List, Dict, Union, Optional
+from src.models.PauliSum import PauliSum
+from src.models.gates.matrices import FIXED_GATES, canonical_name
+from src.simulator.qestkit_simulator import QuantumSimulator
+from typing import Any
+
+# Gates the tableau can apply; a circuit made only of these is a Clifford circuit
+CLIFFORD_GATES = frozenset({"I", "X", "Y", "Z", "H", "S", "CNOT", "CZ"})
+
+# Largest number of random outcome bits sampled as one integer per shot
+_MAX_INTEGER_BITS = 62
+
+_ONE = np.uint64(1)
+
+# Maps unpacked 0/1 bytes to the characters of a bitstring
+_BITSTRING_TABLE = bytes.maketrans(b"\x00\x01", b"01")
+
+if hasattr(np, "bitwise_count"):
+
+    def _popcount(words: np.ndarray) -> np.ndarray:
+        return np.bitwise_count(words).sum(axis=-1, dtype=np.int64)
+
+else:
+    _BYTE_COUNTS = np.array([bin(i).count("1") for i in range(256)], dtype=np.int64)
+
+    def _popcount(words: np.ndarray) -> np.ndarray:
+        octets = np.ascontiguousarray(words).view(np.uint8)
+        return _BYTE_COUNTS[octets].sum(axis=-1)
+
+
+def _rowsum(x, z, r, targets, source):
+    """
+    Multiplies the Pauli rows ``targets`` by row ``source`` in place (Aaronson and
+    Gottesman's rowsum, for many target rows at once). The phase exponent of the
+    product is 2 r_h + 2 r_i + sum_j g_j, where g_j in {-1, 0, 1} comes from the
+    Pauli product on qubit j; the +1 and -1 cases are counted with popcounts over the
+    packed words.
+    """
+    x1, z1 = x[source], z[source]
+    x2, z2 = x[targets], z[targets]
+    plus = (x1 & z1 & z2 & ~x2) | (x1 & ~z1 & z2 & x2) | (~x1 & z1 & x2 & ~z2)
+    minus = (x1 & z1 & x2 & ~z2) | (x1 & ~z1 & z2 & ~x2) | (~x1 & z1 & x2 & z2)
+    exponent = (
+        2 * r[targets].astype(np.int64)
+        + 2 * int(r[source])
+        + _popcount(plus)
+        - _popcount(minus)
+    )
+    r[targets] = (exponent % 4) // 2
+    x[targets] = x2 ^ x1
+    z[targets] = z2 ^ z1
+
+
+class StabilizerSimulator(QuantumSimulator):
+    """
+    CHP stabilizer-tableau simulator (Aaronson and Gottesman) for Clifford circuits.
+
+    Rows 0..n-1 of the tableau are destabilizers and rows n..2n-1 stabilizers; each
+    row is a signed Pauli string with its X and Z bits packed 64 qubits per uint64
+    word. A Clifford gate updates one or two bit columns of all 2n rows (O(n) word
+    operations) and a collapsing measurement costs O(n^2).
+
+    Sampling does not collapse the state: the Z-basis outcomes of a stabilizer state
+    are uniform over an affine space v0 + span(X parts of the stabilizers). Both are
+    found once by Gaussian elimination of the stabilizers, after which each shot is
+    a uniformly random combination of at most n basis vectors.
+    """
+
+    def __init__(self, num_qubits: int, rng: Optional[np.random.Generator] = None):
+        self.num_qubits = num_qubits
+        self.rng = rng if rng is not None else np.random.default_rng()
+        self._words = max(1, (num_qubits + 63) // 64)
+        self.reset()
+
+    def reset(self):
+        # |0...0⟩: destabilizer i is X_i and stabilizer i is Z_i
+        n = self.num_qubits
+        self.x = np.zeros((2 * n, self._words), dtype=np.uint64)
+        self.z = np.zeros((2 * n, self._words), dtype=np.uint64)
+        self.r = np.zeros(2 * n, dtype=np.uint8)
+        for q in range(n):
+            self.x[q, q >> 6] |= _ONE << np.uint64(q & 63)
+            self.z[n + q, q >> 6] |= _ONE << np.uint64(q & 63)
+        self.circuit_position = 0
+
+    def get_num_qubits(self) -> int:
+        return self.num_qubits
+
+    def apply_gate(
+        self,
+        gate_name: str,
+        targets: Union[int, List[int]],
+        controls: Optional[Union[int, List[int]]] = None,
+        params: Optional[List[float]] = None,
+    ):
+        if isinstance(targets, int):
+            targets = [targets]
+        if controls is None:
+            controls = []
+        elif isinstance(controls, int):
+            controls = [controls]
+        name = canonical_name(gate_name)
+        if controls:
+            # Singly controlled X and Z are the Clifford CNOT and CZ
+            controlled = {"X": "CNOT", "Z": "CZ"}.get(name)
+            if controlled is None or len(controls) != 1:
+                raise ValueError(f"Controlled {gate_name} is not a Clifford gate.")
+            for target in targets:
+                self._apply_clifford(controlled, [controls[0], target])
+            return
+        if name in ("CNOT", "CZ"):
+            self._apply_clifford(name, targets)
+            return
+        for target in targets:
+            self._apply_clifford(name, [target])
+
+    def apply_custom_gate(
+        self,
+        gate_matrix: np.ndarray,
+        targets: Union[int, List[int]],
+        controls: Optional[Union[int, List[int]]] = None,
+    ):
+        # Only matrices of the registry's Clifford gates can be applied
+        for name in CLIFFORD_GATES:
+            matrix = FIXED_GATES[name]
+            if matrix.shape == gate_matrix.shape and np.allclose(matrix, gate_matrix):
+                self.apply_gate(name, targets, controls)
+                return
+        raise ValueError("The tableau simulator only applies Clifford gates.")
+
+    def apply_circuit(self, circuit: Any):
+        # Dispatch on gate names; no matrix is looked at
+        for gate in circuit.gates:
+            self.apply_gate(gate.name, gate.qubits)
+
+    def run(
+        self,
+        circuit: Any,
+        shots: int = 1024,
+        rng: Optional[np.random.Generator] = None,
+    ) -> Dict[str, int]:
+        # Execute the circuit from |0...0⟩ (if given), then sample without collapsing
+        if circuit is not None:
+            self.reset()
+            self.apply_circuit(circuit)
+        return self.sample_counts(shots, rng)
+
+    def _apply_clifford(self, name: str, qubits: List[int]):
+        if any(q >= self.num_qubits or q < 0 for q in qubits):
+            raise ValueError(
+                f"Invalid qubit indices {qubits} for a system with {self.num_qubits} qubits."
+            )
+        if name not in CLIFFORD_GATES:
+            raise ValueError(f"Gate {name} is not a Clifford gate.")
+        if name == "I":
+            return
+        if name in ("CNOT", "CZ"):
+            control, target = qubits
+            if control == target:
+                raise ValueError(f"Target qubits {qubits} must be distinct.")
+            if name == "CZ":
+                # CZ = (I x H) CNOT (I x H)
+                self._hadamard(target)
+                self._cnot(control, target)
+                self._hadamard(target)
+            else:
+                self._cnot(control, target)
+            return
+        qubit = qubits[0]
+        word, shift = qubit >> 6, np.uint64(qubit & 63)
+        x_bits = (self.x[:, word] >> shift) & _ONE
+        z_bits = (self.z[:, word] >> shift) & _ONE
+        if name == "H":
+            self._hadamard(qubit)
+        elif name == "S":
+            self.r ^= (x_bits & z_bits).astype(np.uint8)
+            self.z[:, word] ^= x_bits << shift
+        elif name == "X":
+            self.r ^= z_bits.astype(np.uint8)
+        elif name == "Z":
+            self.r ^= x_bits.astype(np.uint8)
+        else:  # Y
+            self.r ^= (x_bits ^ z_bits).astype(np.uint8)
+
+    def _hadamard(self, qubit: int):
+        word, shift = qubit >> 6, np.uint64(qubit & 63)
+        mask = _ONE << shift
+        x_column = self.x[:, word] & mask
+        z_column = self.z[:, word] & mask
+        self.r ^= ((x_column & z_column) >> shift).astype(np.uint8)
+        self.x[:, word] ^= x_column ^ z_column
+        self.z[:, word] ^= x_column ^ z_column
+
+    def _cnot(self, control: int, target: int):
+        cw, cs = control >> 6, np.uint64(control & 63)
+        tw, ts = target >> 6, np.uint64(target & 63)
+        x_c = (self.x[:, cw] >> cs) & _ONE
+        z_c = (self.z[:, cw] >> cs) & _ONE
+        x_t = (self.x[:, tw] >> ts) & _ONE
+        z_t = (self.z[:, tw] >> ts) & _ONE
+        self.r ^= (x_c & z_t & (x_t ^ z_c ^ _ONE)).astype(np.uint8)
+        self.x[:, tw] ^= x_c << ts
+        self.z[:, cw] ^= z_t << cs
+
+    def measure(self, qubit: int, rng: Optional[np.random.Generator] = None) -> int:
+        """
+        Measures one qubit in the Z basis and collapses the state, O(n^2).
+
+        Returns:
+            int: The outcome, 0 or 1.
+        """
+        rng = rng if rng is not None else self.rng
+        n = self.num_qubits
+        word, shift = qubit >> 6, np.uint64(qubit & 63)
+        x_column = ((self.x[:, word] >> shift) & _ONE).astype(bool)
+        anticommuting = np.flatnonzero(x_column[n:])
+        if len(anticommuting):
+            # Random outcome: stabilizer p anticommutes with Z_qubit
+            p = n + anticommuting[0]
+            others = np.flatnonzero(x_column)
+            others = others[others != p]
+            if len(others):
+                _rowsum(self.x, self.z, self.r, others, p)
+            self.x[p - n], self.z[p - n], self.r[p - n] = (
+                self.x[p],
+                self.z[p],
+                self.r[p],
+            )
+            self.x[p] = 0
+            self.z[p] = 0
+            self.z[p, word] = _ONE << shift
+            outcome = int(rng.integers(2))
+            self.r[p] = outcome
+            return outcome
+        # Deterministic: Z_qubit is the product of the stabilizers paired with the
+        # destabilizers that anticommute with it
+        x, z, r = self._scratch_rows()
+        for i in np.flatnonzero(x_column[:n]):
+            self._multiply_into(x, z, r, n + i)
+        return int(r[-1])
+
+    def _scratch_rows(self):
+        # The tableau plus one identity row used to accumulate products
+        x = np.vstack([self.x, np.zeros((1, self._words), dtype=np.uint64)])
+        z = np.vstack([self.z, np.zeros((1, self._words), dtype=np.uint64)])
+        r = np.append(self.r, np.uint8(0))
+        return x, z, r
+
+    @staticmethod
+    def _multiply_into(x, z, r, row):
+        _rowsum(x, z, r, np.array([len(r) - 1]), row)
+
+    def pauli_expectation(self, observable: PauliSum) -> float:
+        """
+        Evaluates a PauliSum: each Pauli string has expectation 0 if it anticommutes
+        with a stabilizer, otherwise +-1 from the sign of the stabilizer product that
+        equals it.
+        """
+        if observable.num_qubits > self.num_qubits:
+            raise ValueError(
+                f"Observable on {observable.num_qubits} qubits does not fit {self.num_qubits}."
+            )
+        n = self.num_qubits
+        total = 0.0
+        for x_mask, z_mask, coefficient in zip(
+            observable.x_masks.tolist(),
+            observable.z_masks.tolist(),
+            observable.coefficients,
+        ):
+            x_term = self._pack(int(x_mask))
+            z_term = self._pack(int(z_mask))
+            # Symplectic product with every row: odd means anticommuting
+            parity = (_popcount((self.x & z_term) ^ (self.z & x_term)) & 1).astype(bool)
+            if parity[n:].any():
+                continue
+            x, z, r = self._scratch_rows()
+            for i in np.flatnonzero(parity[:n]):
+                self._multiply_into(x, z, r, n + i)
+            total += float(np.real(coefficient)) * (-1.0 if r[-1] else 1.0)
+        return total
+
+    def calculate_expectation_value(
+        self, observable: PauliSum, state_vector: Optional[np.ndarray] = None
+    ) -> float:
+        if not isinstance(observable, PauliSum) or state_vector is not None:
+            raise ValueError(
+                "The tableau simulator evaluates PauliSum observables only."
+            )
+        return self.pauli_expectation(observable)
+
+    def _snapshot_state(self):
+        return {}, {"x": self.x, "z": self.z, "r": self.r}
+
+    @classmethod
+    def _from_snapshot(cls, snapshot, rng, noise_model):
+        if noise_model is not None:
+            raise ValueError("The tableau simulator does not take a noise model.")
+        simulator = cls(snapshot.num_qubits, rng=rng)
+        # Copy-on-write maps, updated in place by the gates
+        simulator.x = snapshot.array("x")
+        simulator.z = snapshot.array("z")
+        simulator.r = snapshot.array("r")
+        return simulator
+
+    def _pack(self, mask: int) -> np.ndarray:
+        words = np.zeros(self._words, dtype=np.uint64)
+        for i in range(self._words):
+            words[i] = (mask >> (64 * i)) & ((1 << 64) - 1)
+        return words
+
+    def support(self):
+        """
+        The affine space of Z-basis outcomes, found by Gaussian elimination of the
+        stabilizers. Eliminating their X parts leaves k rows whose X parts span the
+        linear part; the remaining n - k rows are signed Z strings whose eigenvalue
+        equations z . v = r (mod 2) fix the offset v0 by back-substitution.
+
+        Only rows below each pivot are eliminated (row echelon form); reducing above
+        the pivots as well fills in chain-like tableaus (GHZ) at O(n^3) word cost.
+
+        Returns:
+            tuple: v0 as packed words and the k x words basis of the linear part.
+        """
+        n = self.num_qubits
+        x, z, r = self.x[n:].copy(), self.z[n:].copy(), self.r[n:].copy()
+        row = 0
+        for qubit in range(n):
+            row = self._eliminate(x, z, r, x, qubit, row)
+        basis = x[:row].copy()
+        pivots = []
+        for qubit in range(n):
+            pivot = self._eliminate(x, z, r, z, qubit, row)
+            if pivot > row:
+                pivots.append((qubit, row))
+                row = pivot
+        # Each equation holds its pivot and later qubits only; with the free qubits
+        # set to 0, solve from the last pivot back
+        offset = np.zeros(self._words, dtype=np.uint64)
+        for qubit, row in reversed(pivots):
+            if (int(r[row]) + int(_popcount(z[row] & offset))) & 1:
+                offset[qubit >> 6] |= _ONE << np.uint64(qubit & 63)
+        return offset, basis
+
+    @staticmethod
+    def _eliminate(x, z, r, bits, qubit, row):
+        # One forward-elimination step on column ``qubit`` of ``bits`` (x or z) among
+        # rows row.. ; returns the next free row
+        word, shift = qubit >> 6, np.uint64(qubit & 63)
+        column = ((bits[row:, word] >> shift) & _ONE).astype(bool)
+        candidates = np.flatnonzero(column)
+        if not len(candidates):
+            return row
+        pivot = row + candidates[0]
+        if pivot != row:
+            for array in (x, z, r):
+                array[[row, pivot]] = array[[pivot, row]]
+            column[[0, candidates[0]]] = column[[candidates[0], 0]]
+        below = row + 1 + np.flatnonzero(column[1:])
+        if len(below):
+            _rowsum(x, z, r, below, row)
+        return row + 1
+
+    def sample_counts(
+        self, shots: int, rng: Optional[np.random.Generator] = None
+    ) -> Dict[str, int]:
+        """
+        Samples Z-basis measurements of every qubit without collapsing the state.
+        The outcome of a shot is v0 XOR a uniformly random subset of the k basis
+        vectors, so after one elimination each shot costs O(k n / 64).
+
+        Returns:
+            dict: Counts of the observed bitstrings (qubit 0 rightmost).
+        """
+        rng = rng if rng is not None else self.rng
+        offset, basis = self.support()
+        k = len(basis)
+        if k <= _MAX_INTEGER_BITS:
+            # Draw each shot's subset as one integer; equal draws share an outcome
+            if k <= 20 and shots >= 1 << k:
+                multiplicities = rng.multinomial(shots, np.full(1 << k, 1.0 / (1 << k)))
+                draws = np.flatnonzero(multiplicities)
+                multiplicities = multiplicities[draws]
+            else:
+                draws, multiplicities = np.unique(
+                    rng.integers(0, 1 << k, size=shots, dtype=np.int64),
+                    return_counts=True,
+                )
+            outcomes = np.tile(offset, (len(draws), 1))
+            for j in range(k):
+                selected = ((draws >> j) & 1).astype(bool)
+                outcomes[selected] ^= basis[j]
+        else:
+            outcomes = np.tile(offset, (shots, 1))
+            for j in range(k):
+                outcomes[rng.integers(0, 2, size=shots).astype(bool)] ^= basis[j]
+            outcomes, multiplicities = np.unique(outcomes, axis=0, return_counts=True)
+        bits = np.unpackbits(
+            outcomes.astype("<u8").view(np.uint8), axis=1, bitorder="little"
+        )[:, : self.num_qubits]
+        counts: Dict[str, int] = {}
+        for row, count in zip(bits[:, ::-1], multiplicities):
+            key = row.tobytes().translate(_BITSTRING_TABLE).decode("ascii")
+            counts[key] = counts.get(key, 0) + int(count)
+        return counts
@@ -0,0 +1,225 @@
+import numpy as np
+from typing import List, Dict, Union, Optional
+from src.models.PauliSum import PauliSum
+from src.models.gates.matrices import complex_dtype, gate_matrix
+from src.simulator.qestkit_simulator import QuantumSimulator
+from src.simulator.kernels import (
+    PARALLEL_THRESHOLD,
+    apply_diagonal,
+    apply_matrix,
+    controlled_matrix,
+)
+from src.simulator.memory import check_allocation, statevector_bytes
+from src.simulator.sampling import sample_counts
+from typing import Any
+
+
+class StateVectorSimulator(QuantumSimulator):
+    """
+    Pure-state simulator holding 2^n amplitudes (qubit 0 is the least significant bit).
+
+    Gates are applied by contracting the gate matrix with the target axes of a reshaped
+    view of the state. The result is written into a second, preallocated buffer and the
+    two buffers are swapped, so applying a gate never allocates a new state. Diagonal
+    gates are applied in place on strided views without touching the second buffer.
+
+    With a noise model, each run is one quantum trajectory: after every gate, each
+    channel samples one of its Kraus branches and applies it as a (renormalized) gate.
+
+    ``precision="single"`` stores complex64 amplitudes (half the memory, so one more
+    qubit fits); gate matrices are looked up or rounded to the same dtype, so nothing
+    is computed in double. ``renormalize=True`` rescales the state to unit norm after
+    each circuit, removing the norm drift that rounding accumulates.
+
+    ``num_threads`` splits every gate into independent blocks along the untouched
+    qubit axes and runs them on a shared thread pool, once the state has at least
+    ``parallel_threshold`` amplitudes (smaller states stay on the calling thread).
+    """
+
+    def __init__(
+        self,
+        num_qubits: int,
+        rng: Optional[np.random.Generator] = None,
+        initial_state: Optional[np.ndarray] = None,
+        noise_model: Optional[Any] = None,
+        precision: str = "double",
+        renormalize: bool = False,
+        num_threads: int = 1,
+        parallel_threshold: int = PARALLEL_THRESHOLD,
+    ):
+        if num_threads < 1:
+            raise ValueError(f"num_threads must be at least 1, got {num_threads}.")
+        self.num_qubits = num_qubits
+        self.rng = rng if rng is not None else np.random.default_rng()
+        # Optional NoiseModel sampled once per run (one trajectory)
+        self.noise_model = noise_model
+        self.dtype = complex_dtype(precision)
+        self.renormalize = renormalize
+        self.num_threads = num_threads
+        # Worker threads per gate: the state size never changes, so decide once
+        self._threads = num_threads if 2**num_qubits >= parallel_threshold else 1
+        check_allocation(
+            statevector_bytes(num_qubits, self.dtype),
+            f"A {num_qubits}-qubit state vector",
+        )
+        self.state_vector = np.zeros(2**num_qubits, dtype=self.dtype)
+        self._scratch = np.empty_like(self.state_vector)
+        if initial_state is None:
+            # Already zero: leaving the other pages untouched keeps a restored
+            # snapshot, which replaces this buffer, from paying for it
+            self.state_vector[0] = 1.0
+        else:
+            if initial_state.size != 2**num_qubits:
+                raise ValueError(
+                    f"Initial state has {initial_state.size} amplitudes, expected {2**num_qubits}."
+                )
+            self.state_vector[:] = initial_state.reshape(-1)
+
+    def reset(self):
+        # Initialize the state vector to |0...0⟩ without reallocating it
+        self.state_vector.fill(0)
+        self.state_vector[0] = 1.0
+        self.circuit_position = 0
+
+    def get_num_qubits(self) -> int:
+        return self.num_qubits
+
+    def apply_gate(
+        self,
+        gate_name: str,
+        targets: Union[int, List[int]],
+        controls: Optional[Union[int, List[int]]] = None,
+        params: Optional[List[float]] = None,
+    ):
+        gate_matrix = self._get_gate_matrix(gate_name, params)
+        self.apply_custom_gate(gate_matrix, targets, controls)
+
+    def apply_custom_gate(
+        self,
+        gate_matrix: np.ndarray,
+        targets: Union[int, List[int]],
+        controls: Optional[Union[int, List[int]]] = None,
+    ):
+        # Same conventions as DensityMatrixSimulator: a 2x2 matrix is broadcast over
+        # every target, and controls are prepended as the most significant qubits.
+        if isinstance(targets, int):
+            targets = [targets]
+        if controls is None:
+            controls = []
+        elif isinstance(controls, int):
+            controls = [controls]
+
+        if gate_matrix.shape == (2, 2) and len(targets) > 1:
+            groups = [[target] for target in targets]
+        else:
+            groups = [list(targets)]
+
+        matrix = controlled_matrix(gate_matrix, len(controls))
+        for group in groups:
+            self._apply_local_gate(matrix, list(controls) + group)
+
+    def apply_channel(self, channel: Any, qubits: Union[int, List[int]]):
+        # Sample one Kraus branch per target group and apply it as a gate
+        for group in channel.target_groups(qubits, self.num_qubits):
+            operator = channel.sample_operator(
+                self.state_vector, group, self.num_qubits, self.rng, self._scratch
+            )
+            if operator is not None:
+                self._apply_local_gate(operator, group)
+
+    def apply_circuit(self, circuit: Any):
+        if self.noise_model is None:
+            super().apply_circuit(circuit)
+        else:
+            for gate in circuit.gates:
+                self.apply_custom_gate(gate.matrix, gate.qubits)
+                for channel, qubits in self.noise_model.channels_for(gate):
+                    self.apply_channel(channel, qubits)
+        if self.renormalize:
+            self._renormalize()
+
+    def run(
+        self,
+        circuit: Any,
+        shots: int = 1024,
+        rng: Optional[np.random.Generator] = None,
+    ) -> Dict[str, int]:
+        # Execute the circuit from |0...0⟩ (if given), then sample every shot at once
+        if circuit is not None:
+            self.reset()
+            self.apply_circuit(circuit)
+        return sample_counts(
+            self.get_probabilities(),
+            shots,
+            self.num_qubits,
+            rng if rng is not None else self.rng,
+        )
+
+    def get_probabilities(self) -> np.ndarray:
+        return np.abs(self.state_vector) ** 2
+
+    def calculate_expectation_value(
+        self, observable: Union[np.ndarray, PauliSum], state_vector: np.ndarray = None
+    ) -> float:
+        # <psi|O|psi> for the given state vector, or the simulator's own state. A
+        # PauliSum is evaluated term group by term group, with no dense observable.
+        if state_vector is None:
+            state_vector = self.state_vector
+        if isinstance(observable, PauliSum):
+            return observable.expectation_value(state_vector)
+        return float(np.real(np.vdot(state_vector, observable @ state_vector)))
+
+    def _snapshot_state(self):
+        options = {"renormalize": self.renormalize, "num_threads": self.num_threads}
+        return options, {"state_vector": self.state_vector}
+
+    @classmethod
+    def _from_snapshot(cls, snapshot, rng, noise_model):
+        simulator = cls(
+            snapshot.num_qubits,
+            rng=rng,
+            noise_model=noise_model,
+            precision=snapshot.precision,
+            **snapshot.options,
+        )
+        # Copy-on-write map of the file: the first gates read it in place and write
+        # into the swap buffer, so the snapshot is never copied up front
+        simulator.state_vector = snapshot.array("state_vector")
+        return simulator
+
+    def _get_gate_matrix(
+        self, gate_name: str, params: Optional[List[float]]
+    ) -> np.ndarray:
+        # Shared, read-only matrices from the gate registry (no allocation per lookup)
+        return gate_matrix(gate_name, params, self.dtype)
+
+    def _renormalize(self):
+        norm = np.linalg.norm(self.state_vector)
+        if norm > 0:
+            self.state_vector /= norm
+
+    def _apply_local_gate(self, gate_matrix: np.ndarray, qubits: List[int]):
+        if any(q >= self.num_qubits or q < 0 for q in qubits):
+            raise ValueError(
+                f"Invalid qubit indices {qubits} for a system with {self.num_qubits} qubits."
+            )
+        diagonal = np.diagonal(gate_matrix)
+        if np.count_nonzero(gate_matrix) == np.count_nonzero(diagonal):
+            apply_diagonal(
+                self.state_vector,
+                diagonal,
+                qubits,
+                self.num_qubits,
+                threads=self._threads,
+            )
+            return
+        apply_matrix(
+            self.state_vector,
+            gate_matrix,
+            qubits,
+            self.num_qubits,
+            out=self._scratch,
+            overwrite_input=True,
+            threads=self._threads,
+        )
+        self.state_vector, self._scratch = self._scratch, self.state_vector
@@ -0,0 +1,156 @@
+import os
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+from src.simulator.sampling import sample_counts
+from src.simulator.sv_simulator import StateVectorSimulator
+
+# Batches handed to each worker process; more batches balance uneven trajectories
+BATCHES_PER_WORKER = 4
+
+
+class TrajectoryResult:
+    """
+    Aggregated outcome of a Monte Carlo trajectory run.
+
+    Attributes:
+        counts (dict): Measurement counts over every shot of every trajectory.
+        expectation_values (numpy.ndarray): Mean of each observable over trajectories.
+        standard_errors (numpy.ndarray): Standard error of each mean (zero for a
+            single trajectory).
+        trajectories (int): Number of trajectories run.
+    """
+
+    def __init__(
+        self,
+        counts: Dict[str, int],
+        expectation_values: np.ndarray,
+        standard_errors: np.ndarray,
+        trajectories: int,
+    ):
+        self.counts = counts
+        self.expectation_values = expectation_values
+        self.standard_errors = standard_errors
+        self.trajectories = trajectories
+
+    def __repr__(self):
+        return (
+            f"TrajectoryResult(trajectories={self.trajectories}, "
+            f"outcomes={len(self.counts)}, "
+            f"expectation_values={self.expectation_values}, "
+            f"standard_errors={self.standard_errors})"
+        )
+
+
+def _run_batch(
+    circuit: Any,
+    noise_model: Any,
+    num_qubits: int,
+    trajectories: int,
+    shots: int,
+    observables: Sequence[Any],
+    seed: np.random.SeedSequence,
+    precision: str = "double",
+):
+    # One simulator (two 2^n buffers) is reused for every trajectory of the batch
+    rng = np.random.default_rng(seed)
+    simulator = StateVectorSimulator(
+        num_qubits, rng=rng, noise_model=noise_model, precision=precision
+    )
+    counts = Counter()
+    values = np.empty((trajectories, len(observables)))
+    for t in range(trajectories):
+        simulator.reset()
+        simulator.apply_circuit(circuit)
+        for i, observable in enumerate(observables):
+            values[t, i] = simulator.calculate_expectation_value(observable)
+        if shots:
+            counts.update(
+                sample_counts(simulator.get_probabilities(), shots, num_qubits, rng)
+            )
+    return counts, values
+
+
+def run_trajectories(
+    circuit: Any,
+    noise_model: Any,
+    trajectories: int = 1000,
+    shots_per_trajectory: int = 1,
+    observables: Sequence[Any] = (),
+    num_qubits: Optional[int] = None,
+    max_workers: Optional[int] = None,
+    seed: Optional[int] = None,
+    precision: str = "double",
+) -> TrajectoryResult:
+    """
+    Simulates a noisy circuit by averaging pure-state trajectories: each trajectory
+    samples one Kraus branch per channel application on a 2^n state vector, so memory
+    stays at 2^n amplitudes per worker instead of the 4^n of a density matrix.
+
+    Trajectories are split into batches over a ProcessPoolExecutor. Every batch draws
+    from its own stream spawned from one SeedSequence, so results are reproducible for
+    a given seed and worker count, regardless of scheduling.
+
+    Args:
+        circuit: A QuantumCircuit or CompactCircuit.
+        noise_model (NoiseModel): The channels following each gate.
+        trajectories (int, optional): Number of trajectories. Defaults to 1000.
+        shots_per_trajectory (int, optional): Measurements sampled from each final
+            state. Defaults to 1.
+        observables (Sequence, optional): Observables accepted by
+            ``StateVectorSimulator.calculate_expectation_value``.
+        num_qubits (int, optional): Defaults to one past the highest qubit index used.
+        max_workers (int, optional): Worker processes; 1 runs in this process.
+            Defaults to ``os.cpu_count()``.
+        seed (int, optional): Root seed of the random streams.
+        precision (str, optional): "double" or "single" amplitudes in the workers.
+
+    Returns:
+        TrajectoryResult: Counts, expectation values and their standard errors.
+    """
+    if trajectories < 1:
+        raise ValueError("At least one trajectory is required.")
+    if num_qubits is None:
+        num_qubits = max(circuit.qubits) + 1 if len(circuit.qubits) else 0
+    observables = list(observables)
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    max_workers = min(max_workers, trajectories)
+
+    num_batches = min(trajectories, max_workers * BATCHES_PER_WORKER)
+    sizes = [len(b) for b in np.array_split(np.arange(trajectories), num_batches)]
+    seeds = np.random.SeedSequence(seed).spawn(num_batches)
+    arguments = [
+        (
+            circuit,
+            noise_model,
+            num_qubits,
+            size,
+            shots_per_trajectory,
+            observables,
+            s,
+            precision,
+        )
+        for size, s in zip(sizes, seeds)
+    ]
+
+    if max_workers == 1:
+        batches = [_run_batch(*args) for args in arguments]
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            batches = list(executor.map(_run_batch, *zip(*arguments)))
+
+    counts: Counter = Counter()
+    values: List[np.ndarray] = []
+    for batch_counts, batch_values in batches:
+        counts.update(batch_counts)
+        values.append(batch_values)
+    values = np.concatenate(values)
+    means = values.mean(axis=0)
+    if trajectories > 1:
+        errors = values.std(axis=0, ddof=1) / np.sqrt(trajectories)
+    else:
+        errors = np.zeros_like(means)
+    return TrajectoryResult(dict(counts), means, errors, trajectories)
@@ -0,0 +1,48 @@
+"""
+run_batch keeps going when a single job fails, including circuits that cannot be
+encoded for the workers.
+"""
+
+import numpy as np
+import pytest
+
+from src.dtos import QuantumCircuit
+from src.models.Parameter import Parameter
+from src.models.gates import CNOT, Hadamard, Rx
+from src.simulator.batch_runner import run_batch
+
+
+def bell_circuit():
+    circuit = QuantumCircuit()
+    circuit.append(Hadamard(qubits=[0]))
+    circuit.append(CNOT(0, 1))
+    return circuit
+
+
+def unbound_circuit():
+    circuit = bell_circuit()
+    circuit.append(Rx(Parameter("theta"), [1]))
+    return circuit
+
+
+@pytest.mark.parametrize("max_workers", [1, 2])
+def test_unencodable_circuit_fails_only_its_job(max_workers):
+    circuits = [bell_circuit(), unbound_circuit(), bell_circuit()]
+    results = {
+        result.index: result
+        for result in run_batch(
+            circuits,
+            shots=100,
+            outputs=("counts", "probabilities"),
+            max_workers=max_workers,
+            seed=3,
+        )
+    }
+
+    assert sorted(results) == [0, 1, 2]
+    assert not results[1].ok
+    assert isinstance(results[1].error, ValueError)
+    for index in (0, 2):
+        assert results[index].ok
+        assert sum(results[index].counts.values()) == 100
+        assert np.allclose(results[index].probabilities, [0.5, 0, 0, 0.5])
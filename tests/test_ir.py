@@ -0,0 +1,55 @@
+"""
+Binary circuit IR: corrupt or truncated data raises ValueError, so the parse cache
+treats a damaged entry as a miss.
+"""
+
+import os
+
+import pytest
+
+from src.dtos import QuantumCircuit
+from src.loader import Loader
+from src.loader._cache import ParseCache
+from src.loader._ir import _HEADER, _body_start, decode_ir, encode_ir
+from src.models.gates import CNOT, Hadamard, Rz
+
+QASM = """OPENQASM 2.0;
+include "qelib1.inc";
+qreg q[3];
+h q[0];
+cx q[0],q[1];
+rz(0.5) q[2];
+"""
+
+
+def small_circuit():
+    circuit = QuantumCircuit()
+    circuit.append(Hadamard(qubits=[0]))
+    circuit.append(CNOT(0, 1))
+    circuit.append(Rz(0.5, [2]))
+    return circuit
+
+
+@pytest.mark.parametrize("length", [0, 10, 48, _body_start() - 1, _body_start() + 1])
+def test_truncated_data_raises_value_error(length):
+    data = encode_ir(small_circuit())
+    with pytest.raises(ValueError):
+        decode_ir(data[:length])
+
+
+def test_truncated_cache_entry_is_a_miss(tmp_path):
+    source = tmp_path / "circuit.qasm"
+    source.write_text(QASM)
+    cache = ParseCache(str(tmp_path / "cache"))
+    expected = Loader.load_qasm2(str(source), compact=True, cache=cache)
+
+    key = cache.key(str(source))
+    entry = cache._path(key)
+    with open(entry, "r+b") as handle:
+        # Cut inside the section table
+        handle.truncate(_HEADER.size + 4)
+    assert cache.get(key) is None
+
+    loaded = Loader.load_qasm2(str(source), compact=True, cache=cache)
+    assert loaded.num_gates == expected.num_gates
+    assert os.path.getsize(entry) > _body_start()
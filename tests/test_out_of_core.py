@@ -0,0 +1,82 @@
+"""
+Out-of-core simulator: lifetime of the temporary amplitude file and block sizes.
+"""
+
+import gc
+import tempfile
+
+import numpy as np
+import pytest
+
+from src.dtos import QuantumCircuit
+from src.models.gates import CNOT, Hadamard
+from src.simulator.out_of_core_simulator import OutOfCoreSimulator
+from src.simulator.qestkit_simulator import QuantumSimulator
+
+
+def amplitude_files(directory):
+    return sorted(path.name for path in directory.glob("qestkit-*.amp"))
+
+
+def ghz_circuit(num_qubits):
+    circuit = QuantumCircuit()
+    circuit.append(Hadamard(qubits=[0]))
+    for qubit in range(num_qubits - 1):
+        circuit.append(CNOT(qubit, qubit + 1))
+    return circuit
+
+
+def test_close_removes_temporary_file(tmp_path):
+    simulator = OutOfCoreSimulator(4, directory=str(tmp_path), block_qubits=2)
+    assert len(amplitude_files(tmp_path)) == 1
+    simulator.close()
+    assert amplitude_files(tmp_path) == []
+    simulator.close()
+
+
+def test_unclosed_simulator_removes_temporary_file(tmp_path):
+    simulator = OutOfCoreSimulator(4, directory=str(tmp_path), block_qubits=2)
+    simulator.apply_circuit(ghz_circuit(4))
+    assert len(amplitude_files(tmp_path)) == 1
+    del simulator
+    gc.collect()
+    assert amplitude_files(tmp_path) == []
+
+
+def test_named_file_is_kept(tmp_path):
+    path = tmp_path / "state.amp"
+    with OutOfCoreSimulator(3, path=str(path)):
+        pass
+    assert path.exists()
+
+
+def test_restored_simulators_remove_their_files(tmp_path, monkeypatch):
+    monkeypatch.setattr(tempfile, "tempdir", str(tmp_path))
+    circuit = ghz_circuit(4)
+    with OutOfCoreSimulator(4, block_qubits=2) as simulator:
+        simulator.resume(circuit, stop=2)
+        simulator.snapshot(str(tmp_path / "state.snap"))
+
+    restored = [
+        QuantumSimulator.restore(str(tmp_path / "state.snap")) for _ in range(3)
+    ]
+    assert len(amplitude_files(tmp_path)) == 3
+    for simulator in restored:
+        simulator.resume(circuit)
+        assert np.allclose(np.abs(simulator.amplitudes[[0, 15]]) ** 2, [0.5, 0.5])
+    del restored, simulator
+    gc.collect()
+    assert amplitude_files(tmp_path) == []
+
+
+def test_block_qubits_must_be_positive(tmp_path):
+    with pytest.raises(ValueError, match="block_qubits"):
+        OutOfCoreSimulator(4, directory=str(tmp_path), block_qubits=0)
+    assert amplitude_files(tmp_path) == []
+
+
+def test_sampled_bitstrings_have_one_bit_per_qubit(tmp_path):
+    with OutOfCoreSimulator(4, directory=str(tmp_path), block_qubits=1) as simulator:
+        counts = simulator.run(ghz_circuit(4), shots=200)
+    assert set(counts) <= {"0000", "1111"}
+    assert sum(counts.values()) == 200
@@ -0,0 +1,96 @@
+"""
+Circuits with symbolic (Parameter) angles through the optimizers and the columnar
+and binary IR forms: unbound angles are merged or kept as they are, never
+evaluated.
+"""
+
+import numpy as np
+import pytest
+
+from src.dtos import CompactCircuit, QuantumCircuit
+from src.loader import Loader
+from src.loader._ir import encode_ir
+from src.models.Parameter import Parameter, ParameterExpression
+from src.models.gates import CNOT, Hadamard, Rx, Rz
+from src.optimizer import fuse_gates, simplify_gates
+from src.simulator.sv_simulator import StateVectorSimulator
+
+
+def parametric_circuit():
+    theta, phi = Parameter("theta"), Parameter("phi")
+    circuit = QuantumCircuit()
+    circuit.append(Hadamard(qubits=[0]))
+    circuit.append(Rx(theta, [0]))
+    circuit.append(Rx(2 * theta + 0.5, [0]))
+    circuit.append(CNOT(0, 1))
+    circuit.append(Rz(phi, [1]))
+    circuit.append(Rz(0.25, [1]))
+    circuit.append(Rz(0.3, [0, 1]))
+    return circuit
+
+
+def final_state(circuit, values):
+    simulator = StateVectorSimulator(2)
+    simulator.apply_circuit(circuit.bind(values))
+    return simulator.state_vector
+
+
+def test_simplify_merges_symbolic_rotations():
+    circuit = parametric_circuit()
+    simplified = simplify_gates(circuit)
+
+    rx = [gate for gate in simplified.gates if gate.name == "Rx"]
+    assert len(rx) == 1
+    assert isinstance(rx[0].theta, ParameterExpression)
+    assert rx[0].theta.terms == {"theta": 3.0}
+    assert rx[0].theta.constant == pytest.approx(0.5)
+    # The input circuit is not modified
+    assert [gate.name for gate in circuit.gates].count("Rx") == 2
+
+    values = {"theta": 0.4, "phi": -1.1}
+    assert np.allclose(final_state(simplified, values), final_state(circuit, values))
+
+
+def test_simplify_keeps_unbound_rotations_and_drops_cancelled_ones():
+    theta = Parameter("theta")
+    circuit = QuantumCircuit()
+    circuit.append(Rz(theta, [0]))
+    circuit.append(Rz(-1 * theta, [0]))
+    circuit.append(Rx(theta, [1]))
+    simplified = simplify_gates(circuit)
+
+    # theta - theta is the identity; a lone unbound rotation is never negligible
+    assert [(gate.name, gate.qubits) for gate in simplified.gates] == [("Rx", [1])]
+
+
+def test_fuse_leaves_unbound_gates_unfused():
+    circuit = parametric_circuit()
+    fused = fuse_gates(circuit)
+
+    names = [gate.name for gate in fused.gates]
+    assert names.count("Rx") == 2
+    assert "Rz" in names
+    values = {"theta": 0.4, "phi": -1.1}
+    assert np.allclose(final_state(fused, values), final_state(circuit, values))
+
+
+def test_compact_circuit_requires_bound_parameters():
+    circuit = parametric_circuit()
+    with pytest.raises(ValueError, match="bind parameters first"):
+        CompactCircuit.from_circuit(circuit)
+    with pytest.raises(ValueError, match="bind parameters first"):
+        encode_ir(circuit)
+
+
+def test_bound_circuit_round_trips_through_ir(tmp_path):
+    bound = parametric_circuit().bind({"theta": 0.4, "phi": -1.1})
+    path = str(tmp_path / "circuit.qir")
+    Loader.save_ir(bound, path)
+    loaded = Loader.load_ir(path)
+
+    simulator = StateVectorSimulator(2)
+    simulator.apply_circuit(loaded)
+    assert np.allclose(
+        simulator.state_vector,
+        final_state(parametric_circuit(), {"theta": 0.4, "phi": -1.1}),
+    )
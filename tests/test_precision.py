@@ -0,0 +1,155 @@
+"""
+Single (complex64) against double (complex128) precision: the error of the single
+state stays small on a fixed ansatz, the state never silently upcasts, and
+``renormalize=True`` removes the norm drift.
+"""
+
+import numpy as np
+import pytest
+
+from src.dtos import QuantumCircuit
+from src.models.NoiseModel import NoiseModel
+from src.models.channels import AmplitudeDampingChannel, DepolarizingChannel
+from src.models.gates import CNOT, CZ, Hadamard, Rx, Ry, Rz, T, Unitary
+from src.simulator.dm_simulator import DensityMatrixSimulator
+from src.simulator.mps_simulator import MPSSimulator
+from src.simulator.sv_simulator import StateVectorSimulator
+
+NUM_QUBITS = 6
+LAYERS = 30
+
+# Bounds against complex128, about an order of magnitude above what the ansatz
+# reaches on every backend (amplitude error ~4e-7, infidelity ~1e-12)
+MAX_ERROR = 5e-6
+MAX_INFIDELITY = 1e-10
+# Norm (trace) drift left after renormalize=True (~4e-8): a few complex64 roundings
+MAX_RENORMALIZED_DRIFT = 1e-7
+
+
+def ansatz(num_qubits=NUM_QUBITS, layers=LAYERS, seed=7):
+    rng = np.random.default_rng(seed)
+    circuit = QuantumCircuit()
+    for _ in range(layers):
+        for qubit in range(num_qubits):
+            circuit.append(Ry(rng.uniform(0, 2 * np.pi), [qubit]))
+            circuit.append(Rz(rng.uniform(0, 2 * np.pi), [qubit]))
+        for qubit in range(num_qubits - 1):
+            circuit.append(CNOT(qubit, qubit + 1))
+    return circuit
+
+
+def random_unitary(size, rng):
+    matrix = rng.normal(size=(size, size)) + 1j * rng.normal(size=(size, size))
+    q, r = np.linalg.qr(matrix)
+    return q * (np.diagonal(r) / np.abs(np.diagonal(r)))
+
+
+def mixed_circuit(seed=11):
+    # Fixed, parametric, two-qubit and explicit-matrix gates
+    rng = np.random.default_rng(seed)
+    circuit = QuantumCircuit()
+    for qubit in range(NUM_QUBITS):
+        circuit.append(Hadamard(qubits=[qubit]))
+        circuit.append(Rx(rng.uniform(0, 2 * np.pi), [qubit]))
+    circuit.append(T(qubits=[0]))
+    circuit.append(CZ(qubits=[1, 2]))
+    circuit.append(Unitary(random_unitary(4, rng), qubits=[3, 4]))
+    circuit.append(Unitary(random_unitary(2, rng), qubits=[5]))
+    return circuit
+
+
+def noise_model():
+    model = NoiseModel()
+    model.add_channel(DepolarizingChannel(0.05))
+    model.add_channel(AmplitudeDampingChannel(0.1), gates=["cx", "cz"])
+    return model
+
+
+def final_state(simulator):
+    if isinstance(simulator, DensityMatrixSimulator):
+        return simulator.density_matrix
+    if isinstance(simulator, MPSSimulator):
+        return simulator.to_state_vector()
+    return simulator.state_vector
+
+
+def norm_drift(simulator):
+    state = final_state(simulator).astype(np.complex128)
+    if isinstance(simulator, DensityMatrixSimulator):
+        return abs(np.real(np.trace(state)) - 1)
+    return abs(np.linalg.norm(state) - 1)
+
+
+SIMULATORS = {
+    "statevector": StateVectorSimulator,
+    "density_matrix": DensityMatrixSimulator,
+    "mps": MPSSimulator,
+}
+
+
+@pytest.mark.parametrize("backend", SIMULATORS)
+def test_single_precision_error_against_double(backend):
+    circuit = ansatz()
+    reference = SIMULATORS[backend](NUM_QUBITS)
+    reference.apply_circuit(circuit)
+    single = SIMULATORS[backend](NUM_QUBITS, precision="single")
+    single.apply_circuit(circuit)
+
+    expected = final_state(reference)
+    state = final_state(single)
+    assert expected.dtype == np.complex128
+    assert state.dtype == np.complex64
+    state = state.astype(np.complex128)
+    assert np.abs(state - expected).max() < MAX_ERROR
+
+    if backend == "density_matrix":
+        # Both states are pure: F = Tr(rho sigma) / (|rho| |sigma|) (Frobenius norms)
+        overlap = np.real(np.vdot(expected, state))
+        fidelity = overlap / (np.linalg.norm(expected) * np.linalg.norm(state))
+    else:
+        fidelity = abs(np.vdot(expected, state)) ** 2 / np.vdot(state, state).real
+    assert 1 - fidelity < MAX_INFIDELITY
+
+
+@pytest.mark.parametrize("backend", SIMULATORS)
+def test_single_precision_state_is_not_upcast(backend):
+    simulator = SIMULATORS[backend](NUM_QUBITS, precision="single")
+    simulator.apply_circuit(mixed_circuit())
+    assert final_state(simulator).dtype == np.complex64
+
+    # Controlled gates and explicit complex128 matrices
+    simulator.apply_gate("X", 1, controls=0)
+    simulator.apply_gate("RY", 3, controls=[2], params=[0.3])
+    simulator.apply_custom_gate(random_unitary(2, np.random.default_rng(5)), [4], [5])
+    assert final_state(simulator).dtype == np.complex64
+
+    # Noise channels
+    simulator.apply_channel(DepolarizingChannel(0.1), [0, 1])
+    simulator.apply_channel(AmplitudeDampingChannel(0.2), [2])
+    assert final_state(simulator).dtype == np.complex64
+
+
+@pytest.mark.parametrize("backend", SIMULATORS)
+def test_single_precision_noisy_circuit_is_not_upcast(backend):
+    simulator = SIMULATORS[backend](
+        NUM_QUBITS,
+        rng=np.random.default_rng(1),
+        noise_model=noise_model(),
+        precision="single",
+    )
+    simulator.apply_circuit(ansatz(layers=5))
+    assert final_state(simulator).dtype == np.complex64
+    assert norm_drift(simulator) < MAX_ERROR
+
+
+@pytest.mark.parametrize("backend", SIMULATORS)
+def test_renormalize_removes_norm_drift(backend):
+    circuit = ansatz(layers=100)
+    drifting = SIMULATORS[backend](NUM_QUBITS, precision="single")
+    drifting.apply_circuit(circuit)
+    renormalized = SIMULATORS[backend](NUM_QUBITS, precision="single", renormalize=True)
+    renormalized.apply_circuit(circuit)
+
+    assert final_state(renormalized).dtype == np.complex64
+    assert norm_drift(renormalized) < MAX_RENORMALIZED_DRIFT
+    assert norm_drift(renormalized) <= norm_drift(drifting)